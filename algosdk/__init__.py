@@ -1,48 +1,93 @@
-from . import (
-    abi,
-    account,
-    auction,
-    constants,
-    dryrun_results,
-    encoding,
-    error,
-    kmd,
-    logic,
-    mnemonic,
-    source_map,
-    transaction,
-    util,
-    v2client,
-    wallet,
-    wordlist,
-)
-
-from .abi import __all__ as abi_all
-from .v2client import __all__ as v2client_all
-
-# begin __all__
-__all__ = (
-    abi_all
-    + v2client_all
-    + [
+import sys
+from typing import Any, Dict, List
+
+# Submodules are imported the first time they are used (PEP 562), so that
+# `import algosdk` only pays for what a program needs
+_submodules = [
+    "abi",
+    "account",
+    "auction",
+    "constants",
+    "dryrun_results",
+    "encoding",
+    "error",
+    "kmd",
+    "logic",
+    "mnemonic",
+    "source_map",
+    "transaction",
+    "util",
+    "v2client",
+    "wallet",
+    "wordlist",
+]
+
+# Names re-exported from submodules, mapped to the submodule exporting them.
+# These are the `__all__` of each submodule, which tests keep in sync.
+_reexports: Dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "ABIReferenceType",
+            "ABITransactionType",
+            "ABIType",
+            "AddressType",
+            "Argument",
+            "ArrayDynamicType",
+            "ArrayStaticType",
+            "ArrayView",
+            "BoolType",
+            "ByteType",
+            "Contract",
+            "DecodedAppCall",
+            "DecodedLogRecord",
+            "Event",
+            "EventRecord",
+            "Interface",
+            "LogDecoder",
+            "Method",
+            "MethodCallRecord",
+            "NetworkInfo",
+            "Returns",
+            "ReturnRecord",
+            "StringType",
+            "TupleType",
+            "TupleView",
+            "UfixedType",
+            "UintType",
+            "check_abi_transaction_type",
+            "decode_view",
+            "is_abi_reference_type",
+            "is_abi_transaction_type",
+            "struct_type",
+        ],
         "abi",
-        "account",
-        "auction",
-        "constants",
-        "dryrun_results",
-        "encoding",
-        "error",
-        "kmd",
-        "logic",
-        "mnemonic",
-        "source_map",
-        "transaction",
-        "util",
-        "v2client",
-        "wallet",
-        "wordlist",
-    ]
-)  # type: ignore
-# end __all__
+    ),
+    **dict.fromkeys(["algod", "indexer"], "v2client"),
+}
+
+__all__ = list(_reexports) + _submodules
 
 name = "algosdk"
+
+
+def _import(submodule: str) -> Any:
+    # Unlike importlib.import_module, __import__ is reported by
+    # `python -X importtime`
+    __import__(__name__ + "." + submodule)
+    return sys.modules[__name__ + "." + submodule]
+
+
+def __getattr__(attr: str) -> Any:
+    if attr in _submodules:
+        return _import(attr)
+    if attr in _reexports:
+        value = getattr(_import(_reexports[attr]), attr)
+        globals()[attr] = value
+        return value
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, attr)
+    )
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -19,9 +19,44 @@ from . import (
     wallet,
     wordlist,
 )
-
-from .abi import __all__ as abi_all
-from .v2client import __all__ as v2client_all
+from .abi import (
+    ABIReferenceType,
+    ABITransactionType,
+    ABIType,
+    AddressType,
+    Argument,
+    ArrayDynamicType,
+    ArrayStaticType,
+    ArrayView,
+    BoolType,
+    ByteType,
+    Contract,
+    DecodedAppCall,
+    DecodedLogRecord,
+    Event,
+    EventRecord,
+    Interface,
+    LogDecoder,
+    Method,
+    MethodCallRecord,
+    NetworkInfo,
+    ReturnRecord,
+    Returns,
+    StringType,
+    TupleType,
+    TupleView,
+    UfixedType,
+    UintType,
+    check_abi_transaction_type,
+    decode_view,
+    is_abi_reference_type,
+    is_abi_transaction_type,
+    struct_type,
+)
+from .v2client import (
+    algod,
+    indexer,
+)
 
 __all__ = [
     "ABIReferenceType",
@@ -31,15 +66,24 @@ __all__ = [
     "Argument",
     "ArrayDynamicType",
     "ArrayStaticType",
+    "ArrayView",
     "BoolType",
     "ByteType",
     "Contract",
+    "DecodedAppCall",
+    "DecodedLogRecord",
+    "Event",
+    "EventRecord",
     "Interface",
+    "LogDecoder",
     "Method",
+    "MethodCallRecord",
     "NetworkInfo",
+    "ReturnRecord",
     "Returns",
     "StringType",
     "TupleType",
+    "TupleView",
     "UfixedType",
     "UintType",
     "abi",
@@ -48,6 +92,7 @@ __all__ = [
     "auction",
     "check_abi_transaction_type",
     "constants",
+    "decode_view",
     "dryrun_results",
     "encoding",
     "error",
@@ -58,6 +103,7 @@ __all__ = [
     "logic",
     "mnemonic",
     "source_map",
+    "struct_type",
     "transaction",
     "util",
     "v2client",
@@ -5,8 +5,16 @@ from algosdk.abi.base_type import ABIType
 from algosdk.abi.bool_type import BoolType
 from algosdk.abi.byte_type import ByteType
 from algosdk.abi.contract import Contract, NetworkInfo
+from algosdk.abi.event import Event
 from algosdk.abi.interface import Interface
-from algosdk.abi.method import Argument, Method, Returns
+from algosdk.abi.log_decoder import (
+    DecodedLogRecord,
+    EventRecord,
+    LogDecoder,
+    MethodCallRecord,
+    ReturnRecord,
+)
+from algosdk.abi.method import Argument, DecodedAppCall, Method, Returns
 from algosdk.abi.reference import ABIReferenceType, is_abi_reference_type
 from algosdk.abi.string_type import StringType
 from algosdk.abi.transaction import (
@@ -17,6 +25,7 @@ from algosdk.abi.transaction import (
 from algosdk.abi.tuple_type import TupleType
 from algosdk.abi.ufixed_type import UfixedType
 from algosdk.abi.uint_type import UintType
+from algosdk.abi.view import ArrayView, TupleView, decode_view, struct_type
 
 __all__ = [
     "ABIReferenceType",
@@ -26,20 +35,31 @@ __all__ = [
     "Argument",
     "ArrayDynamicType",
     "ArrayStaticType",
+    "ArrayView",
     "BoolType",
     "ByteType",
     "check_abi_transaction_type",
     "Contract",
+    "DecodedAppCall",
+    "DecodedLogRecord",
+    "Event",
+    "EventRecord",
     "Interface",
+    "LogDecoder",
     "Method",
+    "MethodCallRecord",
     "NetworkInfo",
     "Returns",
+    "ReturnRecord",
     "StringType",
     "TupleType",
+    "TupleView",
     "UfixedType",
     "UintType",
     "is_abi_reference_type",
     "is_abi_transaction_type",
+    "decode_view",
+    "struct_type",
 ]
 
 name = "abi"
@@ -1,8 +1,15 @@
 from typing import Any, List, NoReturn, Union
 
-from algosdk.abi.base_type import ABI_LENGTH_SIZE, ABIType
+from algosdk.abi.base_type import ABI_LENGTH_SIZE, ABIType, _write_uint
 from algosdk.abi.byte_type import ByteType
-from algosdk.abi.tuple_type import TupleType
+from algosdk.abi.tuple_type import (
+    TupleType,
+    _check_sequence_length,
+    decode_sequence,
+    encode_sequence_into,
+    sequence_encoded_len,
+)
+from algosdk.abi.vectorized import decode_vector
 from algosdk import error
 
 
@@ -21,6 +28,9 @@ class ArrayDynamicType(ABIType):
         super().__init__()
         self.child_type = arg_type
 
+    def _copy(self) -> "ArrayDynamicType":
+        return ArrayDynamicType(self.child_type._copy())
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ArrayDynamicType):
             return False
@@ -48,11 +58,18 @@ class ArrayDynamicType(ABIType):
         Args:
             value_array (list | bytes | bytearray): list of values to be encoded.
             If the child types are ByteType, then bytes or bytearray can be
-            passed in to be encoded as well.
+            passed in to be encoded as well. NumPy arrays, array.array and
+            memoryview values of uint, ufixed, byte and bool elements are
+            converted in bulk.
 
         Returns:
             bytes: encoded bytes of the dynamic array
         """
+        return self._encode_buffered(value_array)
+
+    def _check_values(
+        self, value_array: Union[List[Any], bytes, bytearray]
+    ) -> None:
         if (
             isinstance(value_array, bytes)
             or isinstance(value_array, bytearray)
@@ -60,22 +77,43 @@ class ArrayDynamicType(ABIType):
             raise error.ABIEncodingError(
                 f"cannot pass in bytes when the type of the array is not ByteType: {value_array!r}"
             )
-        converted_tuple = self._to_tuple_type(len(value_array))
-        length_to_encode = len(converted_tuple.child_types).to_bytes(
-            2, byteorder="big"
+
+    def encoded_len(
+        self, value_array: Union[List[Any], bytes, bytearray]
+    ) -> int:
+        self._check_values(value_array)
+        return ABI_LENGTH_SIZE + sequence_encoded_len(
+            self.child_type, value_array
         )
-        encoded = converted_tuple.encode(value_array)
-        return bytes(length_to_encode) + encoded
 
-    def decode(self, array_bytes: Union[bytes, bytearray]) -> list:
+    def _encode_into(
+        self,
+        buffer: bytearray,
+        offset: int,
+        value_array: Union[List[Any], bytes, bytearray],
+    ) -> int:
+        self._check_values(value_array)
+        _check_sequence_length(len(value_array))
+        offset = _write_uint(buffer, offset, len(value_array), ABI_LENGTH_SIZE)
+        return encode_sequence_into(
+            self.child_type, buffer, offset, value_array
+        )
+
+    def decode(
+        self, array_bytes: Union[bytes, bytearray], as_array: bool = False
+    ) -> Any:
         """
         Decodes a bytestring to a dynamic list.
 
         Args:
             array_bytes (bytes | bytearray): bytestring to be decoded
+            as_array (bool, optional): if True, decode uint, ufixed, byte
+                and bool elements in bulk into a NumPy array, or into an
+                array.array when NumPy is not installed
 
         Returns:
-            list: values from the encoded bytestring
+            list | numpy.ndarray | array.array: values from the encoded
+            bytestring
         """
         if not (
             isinstance(array_bytes, bytearray)
@@ -94,5 +132,10 @@ class ArrayDynamicType(ABIType):
         byte_length = int.from_bytes(
             array_bytes[:ABI_LENGTH_SIZE], byteorder="big"
         )
-        converted_tuple = self._to_tuple_type(byte_length)
-        return converted_tuple.decode(array_bytes[ABI_LENGTH_SIZE:])
+        if as_array:
+            return decode_vector(
+                self.child_type, byte_length, array_bytes[ABI_LENGTH_SIZE:]
+            )
+        return decode_sequence(
+            self.child_type, byte_length, array_bytes[ABI_LENGTH_SIZE:]
+        )
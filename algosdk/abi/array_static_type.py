@@ -4,7 +4,13 @@ from typing import Any, List, Union
 from algosdk.abi.base_type import ABIType
 from algosdk.abi.bool_type import BoolType
 from algosdk.abi.byte_type import ByteType
-from algosdk.abi.tuple_type import TupleType
+from algosdk.abi.tuple_type import (
+    TupleType,
+    decode_sequence,
+    encode_sequence_into,
+    sequence_encoded_len,
+)
+from algosdk.abi.vectorized import decode_vector
 from algosdk import error
 
 
@@ -32,6 +38,9 @@ class ArrayStaticType(ABIType):
         self.child_type = arg_type
         self.static_length = array_len
 
+    def _copy(self) -> "ArrayStaticType":
+        return ArrayStaticType(self.child_type._copy(), self.static_length)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ArrayStaticType):
             return False
@@ -65,11 +74,18 @@ class ArrayStaticType(ABIType):
             value_array (list | bytes | bytearray): list of values to be encoded.
             The number of elements must match the predefined length of array.
             If the child types are ByteType, then bytes or bytearray can be
-            passed in to be encoded as well.
+            passed in to be encoded as well. NumPy arrays, array.array and
+            memoryview values of uint, ufixed, byte and bool elements are
+            converted in bulk.
 
         Returns:
             bytes: encoded bytes of the static array
         """
+        return self._encode_buffered(value_array)
+
+    def _check_values(
+        self, value_array: Union[List[Any], bytes, bytearray]
+    ) -> None:
         if len(value_array) != self.static_length:
             raise error.ABIEncodingError(
                 "value array length does not match static array length: {}".format(
@@ -83,18 +99,39 @@ class ArrayStaticType(ABIType):
             raise error.ABIEncodingError(
                 f"cannot pass in bytes when the type of the array is not ByteType: {value_array!r}"
             )
-        converted_tuple = self._to_tuple_type()
-        return converted_tuple.encode(value_array)
 
-    def decode(self, array_bytes: Union[bytes, bytearray]) -> list:
+    def encoded_len(
+        self, value_array: Union[List[Any], bytes, bytearray]
+    ) -> int:
+        self._check_values(value_array)
+        return sequence_encoded_len(self.child_type, value_array)
+
+    def _encode_into(
+        self,
+        buffer: bytearray,
+        offset: int,
+        value_array: Union[List[Any], bytes, bytearray],
+    ) -> int:
+        self._check_values(value_array)
+        return encode_sequence_into(
+            self.child_type, buffer, offset, value_array
+        )
+
+    def decode(
+        self, array_bytes: Union[bytes, bytearray], as_array: bool = False
+    ) -> Any:
         """
         Decodes a bytestring to a static list.
 
         Args:
             array_bytes (bytes | bytearray): bytestring to be decoded
+            as_array (bool, optional): if True, decode uint, ufixed, byte
+                and bool elements in bulk into a NumPy array, or into an
+                array.array when NumPy is not installed
 
         Returns:
-            list: values from the encoded bytestring
+            list | numpy.ndarray | array.array: values from the encoded
+            bytestring
         """
         if not (
             isinstance(array_bytes, bytearray)
@@ -103,5 +140,10 @@ class ArrayStaticType(ABIType):
             raise error.ABIEncodingError(
                 "value to be decoded must be in bytes: {}".format(array_bytes)
             )
-        converted_tuple = self._to_tuple_type()
-        return converted_tuple.decode(array_bytes)
+        if as_array:
+            return decode_vector(
+                self.child_type, self.static_length, array_bytes
+            )
+        return decode_sequence(
+            self.child_type, self.static_length, array_bytes
+        )
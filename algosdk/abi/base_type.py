@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import copy
+from functools import lru_cache
 import re
 from typing import Any, Union
 
@@ -9,6 +11,10 @@ from algosdk import error
 ABI_LENGTH_SIZE = 2  # We use 2 bytes to encode the length of a dynamic element
 UFIXED_REGEX = r"^ufixed([1-9][\d]*)x([1-9][\d]*)$"
 STATIC_ARRAY_REGEX = r"^([a-z\d\[\](),]+)\[(0|[1-9][\d]*)]$"
+# Number of parsed type strings kept by ABIType.from_string
+TYPE_CACHE_SIZE = 1024
+# Big-endian struct format characters of the uint widths that have one
+_UINT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
 
 
 class ABIType(ABC):
@@ -19,6 +25,12 @@ class ABIType(ABC):
     def __init__(self) -> None:
         pass
 
+    def _copy(self) -> "ABIType":
+        """
+        Return a copy of this type that shares no mutable state with it.
+        """
+        return copy.copy(self)
+
     @abstractmethod
     def __str__(self) -> str:
         pass
@@ -55,82 +67,145 @@ class ABIType(ABC):
         """
         pass
 
+    def encoded_len(self, value: Any) -> int:
+        """
+        Return the exact length in bytes of the ABI encoding of value.
+        """
+        if not self.is_dynamic():
+            return self.byte_len()
+        return len(self.encode(value))
+
+    def encode_into(self, buffer: bytearray, offset: int, value: Any) -> int:
+        """
+        Serialize the ABI value into buffer starting at offset, without
+        allocating intermediate byte strings for its components.
+
+        Args:
+            buffer (bytearray): buffer to write into. If offset is the end of
+                the buffer, the encoding is appended to it, otherwise the
+                buffer must already have room for encoded_len(value) bytes
+                after offset.
+            offset (int): position in buffer to start writing at
+            value (Any): value to be encoded
+
+        Returns:
+            int: offset just past the last written byte
+        """
+        if offset != len(buffer):
+            size = self.encoded_len(value)
+            if offset < 0 or offset + size > len(buffer):
+                raise error.ABIEncodingError(
+                    "buffer of length {} cannot fit {} bytes at offset {}".format(
+                        len(buffer), size, offset
+                    )
+                )
+        return self._encode_into(buffer, offset, value)
+
+    def _encode_into(self, buffer: bytearray, offset: int, value: Any) -> int:
+        # Writers either overwrite bytes inside buffer or, when offset is
+        # at its end, append to it. This lets encode fill a single growing
+        # buffer in one pass, and lets composite types write their children
+        # without checking bounds again.
+        return _write_bytes(buffer, offset, self.encode(value))
+
+    def _encode_buffered(self, value: Any) -> bytes:
+        buffer = bytearray()
+        self._encode_into(buffer, 0, value)
+        return bytes(buffer)
+
     @staticmethod
     def from_string(s: str) -> "ABIType":
         """
         Convert a valid ABI string to a corresponding ABI type.
+
+        Parsed types are cached, and each call returns a fresh copy of the
+        cached type, so callers may change it freely.
         """
-        # We define the imports here to avoid circular imports
-        from algosdk.abi.uint_type import UintType
-        from algosdk.abi.ufixed_type import UfixedType
-        from algosdk.abi.byte_type import ByteType
-        from algosdk.abi.bool_type import BoolType
-        from algosdk.abi.address_type import AddressType
-        from algosdk.abi.string_type import StringType
-        from algosdk.abi.array_dynamic_type import ArrayDynamicType
-        from algosdk.abi.array_static_type import ArrayStaticType
-        from algosdk.abi.tuple_type import TupleType
-
-        if s.endswith("[]"):
-            array_arg_type = ABIType.from_string(s[:-2])
-            return ArrayDynamicType(array_arg_type)
-        elif s.endswith("]"):
-            matches = re.search(STATIC_ARRAY_REGEX, s)
-            try:
-                static_length = int(matches.group(2))  # type: ignore[union-attr] # we allow attribute errors to be caught
-                array_type = ABIType.from_string(matches.group(1))  # type: ignore[union-attr] # we allow attribute errors to be caught
-                return ArrayStaticType(array_type, static_length)
-            except Exception as e:
-                raise error.ABITypeError(
-                    "malformed static array string: {}".format(s)
-                ) from e
-        if s.startswith("uint"):
-            try:
-                if not s[4:].isdecimal():
-                    raise error.ABITypeError(
-                        "uint string does not contain a valid size: {}".format(
-                            s
-                        )
-                    )
-                type_size = int(s[4:])
-                return UintType(type_size)
-            except Exception as e:
+        return _type_from_string(s)._copy()
+
+
+def _write_bytes(buffer: bytearray, offset: int, data: bytes) -> int:
+    if offset == len(buffer):
+        # Appending is much cheaper than assigning to a slice
+        buffer += data
+    else:
+        buffer[offset : offset + len(data)] = data
+    return offset + len(data)
+
+
+def _write_uint(buffer: bytearray, offset: int, value: int, width: int) -> int:
+    return _write_bytes(buffer, offset, value.to_bytes(width, byteorder="big"))
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def _type_from_string(s: str) -> ABIType:
+    # We define the imports here to avoid circular imports
+    from algosdk.abi.uint_type import UintType
+    from algosdk.abi.ufixed_type import UfixedType
+    from algosdk.abi.byte_type import ByteType
+    from algosdk.abi.bool_type import BoolType
+    from algosdk.abi.address_type import AddressType
+    from algosdk.abi.string_type import StringType
+    from algosdk.abi.array_dynamic_type import ArrayDynamicType
+    from algosdk.abi.array_static_type import ArrayStaticType
+    from algosdk.abi.tuple_type import TupleType
+
+    if s.endswith("[]"):
+        array_arg_type = ABIType.from_string(s[:-2])
+        return ArrayDynamicType(array_arg_type)
+    elif s.endswith("]"):
+        matches = re.search(STATIC_ARRAY_REGEX, s)
+        try:
+            static_length = int(matches.group(2))  # type: ignore[union-attr] # we allow attribute errors to be caught
+            array_type = ABIType.from_string(matches.group(1))  # type: ignore[union-attr] # we allow attribute errors to be caught
+            return ArrayStaticType(array_type, static_length)
+        except Exception as e:
+            raise error.ABITypeError(
+                "malformed static array string: {}".format(s)
+            ) from e
+    if s.startswith("uint"):
+        try:
+            if not s[4:].isdecimal():
                 raise error.ABITypeError(
-                    "malformed uint string: {}".format(s)
-                ) from e
-        elif s == "byte":
-            return ByteType()
-        elif s.startswith("ufixed"):
-            matches = re.search(UFIXED_REGEX, s)
-            try:
-                bit_size = int(matches.group(1))  # type: ignore[union-attr] # we allow attribute errors to be caught
-                precision = int(matches.group(2))  # type: ignore[union-attr] # we allow attribute errors to be caught
-                return UfixedType(bit_size, precision)
-            except Exception as e:
+                    "uint string does not contain a valid size: {}".format(s)
+                )
+            type_size = int(s[4:])
+            return UintType(type_size)
+        except Exception as e:
+            raise error.ABITypeError(
+                "malformed uint string: {}".format(s)
+            ) from e
+    elif s == "byte":
+        return ByteType()
+    elif s.startswith("ufixed"):
+        matches = re.search(UFIXED_REGEX, s)
+        try:
+            bit_size = int(matches.group(1))  # type: ignore[union-attr] # we allow attribute errors to be caught
+            precision = int(matches.group(2))  # type: ignore[union-attr] # we allow attribute errors to be caught
+            return UfixedType(bit_size, precision)
+        except Exception as e:
+            raise error.ABITypeError(
+                "malformed ufixed string: {}".format(s)
+            ) from e
+    elif s == "bool":
+        return BoolType()
+    elif s == "address":
+        return AddressType()
+    elif s == "string":
+        return StringType()
+    elif len(s) >= 2 and s[0] == "(" and s[-1] == ")":
+        # Recursively parse parentheses from a tuple string
+        tuples = TupleType._parse_tuple(s[1:-1])
+        tuple_list = []
+        for tup in tuples:
+            if isinstance(tup, str):
+                tt = ABIType.from_string(tup)
+                tuple_list.append(tt)
+            else:
                 raise error.ABITypeError(
-                    "malformed ufixed string: {}".format(s)
-                ) from e
-        elif s == "bool":
-            return BoolType()
-        elif s == "address":
-            return AddressType()
-        elif s == "string":
-            return StringType()
-        elif len(s) >= 2 and s[0] == "(" and s[-1] == ")":
-            # Recursively parse parentheses from a tuple string
-            tuples = TupleType._parse_tuple(s[1:-1])
-            tuple_list = []
-            for tup in tuples:
-                if isinstance(tup, str):
-                    tt = ABIType.from_string(tup)
-                    tuple_list.append(tt)
-                else:
-                    raise error.ABITypeError(
-                        "cannot convert {} to an ABI type".format(tup)
-                    )
+                    "cannot convert {} to an ABI type".format(tup)
+                )
 
-            return TupleType(tuple_list)
-        else:
-            raise error.ABITypeError(
-                "cannot convert {} to an ABI type".format(s)
-            )
+        return TupleType(tuple_list)
+    else:
+        raise error.ABITypeError("cannot convert {} to an ABI type".format(s))
@@ -1,6 +1,6 @@
 from typing import Union
 
-from algosdk.abi.base_type import ABIType
+from algosdk.abi.base_type import ABIType, _write_bytes
 from algosdk import error
 
 
@@ -42,6 +42,10 @@ class BoolType(ABIType):
             return b"\x80"
         return b"\x00"
 
+    def _encode_into(self, buffer: bytearray, offset: int, value: bool) -> int:
+        assert isinstance(value, bool)
+        return _write_bytes(buffer, offset, b"\x80" if value else b"\x00")
+
     def decode(self, bytestring: Union[bytes, bytearray]) -> bool:
         """
         Decodes a bytestring to a single boolean.
@@ -1,6 +1,6 @@
 from typing import Union
 
-from algosdk.abi.base_type import ABIType
+from algosdk.abi.base_type import ABIType, _write_bytes
 from algosdk import error
 
 
@@ -42,6 +42,13 @@ class ByteType(ABIType):
             )
         return bytes([value])
 
+    def _encode_into(self, buffer: bytearray, offset: int, value: int) -> int:
+        if not isinstance(value, int) or value < 0 or value > 255:
+            raise error.ABIEncodingError(
+                "value {} cannot be encoded into a byte".format(value)
+            )
+        return _write_bytes(buffer, offset, bytes((value,)))
+
     def decode(self, bytestring: Union[bytes, bytearray]) -> int:
         """
         Decodes a bytestring to a single byte.
@@ -1,7 +1,14 @@
 import json
-from typing import Dict, List, Union, Optional, TypedDict
+from typing import Any, Dict, List, Union, Optional, TypedDict
 
-from algosdk.abi.method import Method, MethodDict, get_method_by_name
+from algosdk.abi.event import Event, EventDict
+from algosdk.abi.method import (
+    DecodedAppCall,
+    Method,
+    MethodDict,
+    _decode_app_call,
+    _MethodIndex,
+)
 
 
 class NetworkInfoDict(TypedDict):
@@ -11,6 +18,7 @@ class NetworkInfoDict(TypedDict):
 # In Python 3.11+ the following classes should be combined using `NotRequired`
 class ContractDict_Optional(TypedDict, total=False):
     desc: str
+    events: List[EventDict]
 
 
 class ContractDict(ContractDict_Optional):
@@ -29,6 +37,8 @@ class Contract:
         desc (string, optional): description of the contract
         networks (dict, optional): information about the contract in a
             particular network, such as an app-id.
+        events (list, optional): list of ARC-28 Event objects the contract
+            may log
     """
 
     def __init__(
@@ -37,11 +47,14 @@ class Contract:
         methods: List[Method],
         desc: Optional[str] = None,
         networks: Optional[Dict[str, "NetworkInfo"]] = None,
+        events: Optional[List[Event]] = None,
     ) -> None:
         self.name = name
         self.methods = methods
         self.desc = desc
         self.networks = networks if networks else {}
+        self.events = events if events else []
+        self._method_index = _MethodIndex(self.methods)
 
     def __eq__(self, o: object) -> bool:
         if not isinstance(o, Contract):
@@ -51,6 +64,7 @@ class Contract:
             and self.methods == o.methods
             and self.desc == o.desc
             and self.networks == o.networks
+            and self.events == o.events
         )
 
     @staticmethod
@@ -66,6 +80,8 @@ class Contract:
         }
         if self.desc is not None:
             d["desc"] = self.desc
+        if self.events:
+            d["events"] = [e.dictify() for e in self.events]
         return d
 
     @staticmethod
@@ -76,12 +92,43 @@ class Contract:
         networks = d["networks"] if "networks" in d else {}
         for k, v in networks.items():
             networks[k] = NetworkInfo.undictify(v)
+        event_list = [Event.undictify(event) for event in d.get("events", [])]
         return Contract(
-            name=name, desc=desc, networks=networks, methods=method_list
+            name=name,
+            desc=desc,
+            networks=networks,
+            methods=method_list,
+            events=event_list,
         )
 
+    def _index(self) -> _MethodIndex:
+        if not self._method_index.is_current(self.methods):
+            self._method_index = _MethodIndex(self.methods)
+        return self._method_index
+
     def get_method_by_name(self, name: str) -> Method:
-        return get_method_by_name(self.methods, name)
+        return self._index().get_by_name(name)
+
+    def get_method_by_selector(self, selector: bytes) -> Method:
+        """
+        Return the method with the given 4 byte selector.
+        """
+        return self._index().get_by_selector(selector)
+
+    def decode_app_call(self, txn: Any) -> DecodedAppCall:
+        """
+        Decode an application call to one of the methods of the contract.
+
+        Args:
+            txn (ApplicationCallTxn | SignedTransaction | dict): the call,
+                either as a transaction object or as an indexer transaction
+                record
+
+        Returns:
+            DecodedAppCall: the method matching the call's selector and its
+            decoded arguments
+        """
+        return _decode_app_call(self._index(), txn)
 
 
 class NetworkInfo:
@@ -0,0 +1,128 @@
+import json
+from typing import Any, List, Optional, TypedDict, Union
+
+from Cryptodome.Hash import SHA512
+
+from algosdk import abi, error
+from algosdk.abi.method import Argument, Method
+
+
+# In Python 3.11+ the following classes should be combined using `NotRequired`
+class EventDict_Optional(TypedDict, total=False):
+    desc: str
+
+
+class EventDict(EventDict_Optional):
+    name: str
+    args: List[dict]
+
+
+class Event:
+    """
+    Represents an ARC-28 event description.
+
+    An event is logged as the first four bytes of the hash of its signature
+    followed by the ABI encoding of its arguments as a tuple.
+
+    Args:
+        name (string): name of the event
+        args (list): list of Argument objects with type, name, and optional
+            description. Only ABI types are allowed.
+        desc (string, optional): optional description of the event
+    """
+
+    def __init__(
+        self, name: str, args: List[Argument], desc: Optional[str] = None
+    ) -> None:
+        self.name = name
+        self.args = args
+        self.desc = desc
+        for arg in self.args:
+            if not isinstance(arg.type, abi.ABIType):
+                raise error.ABITypeError(
+                    "event argument must be an ABI type: {}".format(arg.type)
+                )
+        self.args_type = abi.TupleType(
+            [arg.type for arg in self.args]  # type: ignore[misc]
+        )
+        self._signature: Optional[str] = None
+        self._selector: Optional[bytes] = None
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, Event):
+            return False
+        return (
+            self.name == o.name and self.args == o.args and self.desc == o.desc
+        )
+
+    def get_signature(self) -> str:
+        if self._signature is None:
+            arg_string = ",".join(str(arg.type) for arg in self.args)
+            self._signature = "{}({})".format(self.name, arg_string)
+        return self._signature
+
+    def get_selector(self) -> bytes:
+        """
+        Returns the ABI event signature, which is the first four bytes of the
+        SHA-512/256 hash of the event signature.
+
+        Returns:
+            bytes: first four bytes of the event signature hash
+        """
+        if self._selector is None:
+            hash = SHA512.new(truncate="256")
+            hash.update(self.get_signature().encode("utf-8"))
+            self._selector = hash.digest()[:4]
+        return self._selector
+
+    def decode(self, log: bytes) -> List[Any]:
+        """
+        Decode the arguments of a logged event.
+
+        Args:
+            log (bytes): logged bytes, starting with the event selector
+
+        Returns:
+            list: decoded event arguments
+        """
+        if log[:4] != self.get_selector():
+            raise error.ABIEncodingError(
+                "log does not start with the selector of {}".format(
+                    self.get_signature()
+                )
+            )
+        return self.args_type.decode(log[4:])
+
+    @staticmethod
+    def from_json(resp: Union[str, bytes, bytearray]) -> "Event":
+        event_dict = json.loads(resp)
+        return Event.undictify(event_dict)
+
+    @staticmethod
+    def from_signature(s: str) -> "Event":
+        # An event signature is a method signature without a return type
+        tokens = Method._parse_string(s)
+        if tokens[-1]:
+            raise error.ABIEncodingError(
+                "ABI event string has a return type: {}".format(s)
+            )
+        argument_list = [
+            Argument(t) for t in abi.TupleType._parse_tuple(tokens[1])
+        ]
+        return Event(name=tokens[0], args=argument_list)
+
+    def dictify(self) -> EventDict:
+        d: EventDict = {
+            "name": self.name,
+            "args": [arg.dictify() for arg in self.args],
+        }
+        if self.desc:
+            d["desc"] = self.desc
+        return d
+
+    @staticmethod
+    def undictify(d: dict) -> "Event":
+        name = d["name"]
+        arg_list = [Argument.undictify(arg) for arg in d["args"]]
+        desc = d["desc"] if "desc" in d else None
+        return Event(name=name, args=arg_list, desc=desc)
@@ -1,7 +1,13 @@
 import json
-from typing import List, Union, Optional, TypedDict
+from typing import Any, List, Union, Optional, TypedDict
 
-from algosdk.abi.method import Method, MethodDict, get_method_by_name
+from algosdk.abi.method import (
+    DecodedAppCall,
+    Method,
+    MethodDict,
+    _decode_app_call,
+    _MethodIndex,
+)
 
 
 # In Python 3.11+ the following classes should be combined using `NotRequired`
@@ -30,6 +36,7 @@ class Interface:
         self.name = name
         self.methods = methods
         self.desc = desc
+        self._method_index = _MethodIndex(self.methods)
 
     def __eq__(self, o: object) -> bool:
         if not isinstance(o, Interface):
@@ -61,5 +68,31 @@ class Interface:
         desc = d["desc"] if "desc" in d else None
         return Interface(name=name, desc=desc, methods=method_list)
 
+    def _index(self) -> _MethodIndex:
+        if not self._method_index.is_current(self.methods):
+            self._method_index = _MethodIndex(self.methods)
+        return self._method_index
+
     def get_method_by_name(self, name: str) -> Method:
-        return get_method_by_name(self.methods, name)
+        return self._index().get_by_name(name)
+
+    def get_method_by_selector(self, selector: bytes) -> Method:
+        """
+        Return the method with the given 4 byte selector.
+        """
+        return self._index().get_by_selector(selector)
+
+    def decode_app_call(self, txn: Any) -> DecodedAppCall:
+        """
+        Decode an application call to one of the methods of the interface.
+
+        Args:
+            txn (ApplicationCallTxn | SignedTransaction | dict): the call,
+                either as a transaction object or as an indexer transaction
+                record
+
+        Returns:
+            DecodedAppCall: the method matching the call's selector and its
+            decoded arguments
+        """
+        return _decode_app_call(self._index(), txn)
@@ -0,0 +1,576 @@
+import base64
+import binascii
+import itertools
+import struct
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from algosdk import constants, encoding, error
+from algosdk.abi.base_type import _UINT_FORMATS, ABIType
+from algosdk.abi.byte_type import ByteType
+from algosdk.abi.contract import Contract
+from algosdk.abi.event import Event
+from algosdk.abi.method import (
+    Method,
+    _CallPlan,
+    _decode_call_fields,
+    _MethodIndex,
+)
+from algosdk.abi.tuple_type import TupleType
+from algosdk.abi.ufixed_type import UfixedType
+from algosdk.abi.uint_type import UintType
+
+# First four bytes of the log holding the return value of a method call
+ABI_RETURN_HASH = b"\x15\x1f\x7c\x75"
+
+
+class DecodedLogRecord:
+    """
+    Base class of the records produced by LogDecoder.
+
+    Args:
+        tx_id (str | None): ID of the transaction, or of the top-level
+            transaction for inner transactions
+        confirmed_round (int | None): round the transaction was confirmed in,
+            if known
+        app_id (int): ID of the called application
+        decode_error (Exception | None): error raised while decoding, in
+            which case the decoded fields are None
+    """
+
+    def __init__(
+        self,
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        app_id: int,
+        decode_error: Optional[Exception],
+    ) -> None:
+        self.tx_id = tx_id
+        self.confirmed_round = confirmed_round
+        self.app_id = app_id
+        self.decode_error = decode_error
+
+
+class MethodCallRecord(DecodedLogRecord):
+    """
+    A call to a known ABI method with its decoded arguments, as returned by
+    Contract.decode_app_call.
+    """
+
+    def __init__(
+        self,
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        app_id: int,
+        decode_error: Optional[Exception],
+        method: Method,
+        args: Optional[List[Any]],
+    ) -> None:
+        super().__init__(tx_id, confirmed_round, app_id, decode_error)
+        self.method = method
+        self.args = args
+
+
+class ReturnRecord(DecodedLogRecord):
+    """
+    The value returned by a call to a known, non-void ABI method.
+    """
+
+    def __init__(
+        self,
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        app_id: int,
+        decode_error: Optional[Exception],
+        method: Method,
+        raw_value: bytes,
+        return_value: Any,
+    ) -> None:
+        super().__init__(tx_id, confirmed_round, app_id, decode_error)
+        self.method = method
+        self.raw_value = raw_value
+        self.return_value = return_value
+
+
+class EventRecord(DecodedLogRecord):
+    """
+    An ARC-28 event logged by an application call.
+    """
+
+    def __init__(
+        self,
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        app_id: int,
+        decode_error: Optional[Exception],
+        event: Event,
+        raw_value: bytes,
+        args: Optional[List[Any]],
+    ) -> None:
+        super().__init__(tx_id, confirmed_round, app_id, decode_error)
+        self.event = event
+        self.raw_value = raw_value
+        self.args = args
+
+
+class LogDecoder:
+    """
+    Decodes ABI method calls, return values and ARC-28 events from streams
+    of confirmed transactions.
+
+    Method and event lookups and the types used to decode them are built
+    once. Transactions are read in batches, and the values of each type in
+    a batch are decoded together, so static values such as integers and
+    addresses are unpacked with a single struct call per type and batch.
+
+    Args:
+        contracts (Contract | list[Contract]): contracts whose methods and
+            events are decoded. Methods and events with the same signature
+            in several contracts are decoded once.
+        events (list[Event], optional): additional events to decode
+        batch_size (int, optional): number of transactions, log pages or
+            blocks decoded together
+    """
+
+    def __init__(
+        self,
+        contracts: Union[Contract, Iterable[Contract]],
+        events: Optional[Iterable[Event]] = None,
+        batch_size: int = 1024,
+    ) -> None:
+        if isinstance(contracts, Contract):
+            contracts = [contracts]
+        methods: Dict[str, Method] = {}
+        all_events = list(events) if events else []
+        for contract in contracts:
+            for method in contract.methods:
+                methods.setdefault(method.get_signature(), method)
+            all_events = contract.events + all_events
+        self._methods = _MethodIndex(list(methods.values()))
+
+        self._events: Dict[bytes, Event] = {}
+        for event in all_events:
+            known = self._events.setdefault(event.get_selector(), event)
+            if known.get_signature() != event.get_signature():
+                raise error.ABITypeError(
+                    "events {} and {} have the same selector".format(
+                        known.get_signature(), event.get_signature()
+                    )
+                )
+        if batch_size < 1:
+            raise error.ABITypeError("batch_size must be a positive integer")
+        self.batch_size = batch_size
+
+    def decode_transactions(
+        self, txns: Iterable[Dict[str, Any]]
+    ) -> Iterator[DecodedLogRecord]:
+        """
+        Decode transaction records as returned by the indexer, e.g. the
+        "transactions" of IndexerClient.search_transactions. Inner
+        transactions are decoded as well.
+
+        Args:
+            txns (Iterable[dict]): indexer transaction records
+
+        Returns:
+            Iterator[DecodedLogRecord]: for each app call, in order, a
+            MethodCallRecord if it calls a known method, an EventRecord per
+            logged event, the records of its inner transactions and a
+            ReturnRecord if the method returns a value
+        """
+        for chunk in _chunks(txns, self.batch_size):
+            batch = _Batch()
+            for txn in chunk:
+                self._decode_indexer_txn(
+                    txn, txn.get("id"), txn.get("confirmed-round"), batch
+                )
+            yield from batch.decode()
+
+    def decode_application_logs(
+        self, responses: Iterable[Dict[str, Any]]
+    ) -> Iterator[EventRecord]:
+        """
+        Decode the events in pages returned by IndexerClient.application_logs.
+
+        Logs alone do not identify the called method, so only events are
+        decoded.
+
+        Args:
+            responses (Iterable[dict]): application_logs responses
+
+        Returns:
+            Iterator[EventRecord]: logged events, in order
+        """
+        for chunk in _chunks(responses, self.batch_size):
+            batch = _Batch()
+            for response in chunk:
+                app_id = response.get("application-id", 0)
+                for log_data in response.get("log-data", []):
+                    logs = [_b64decode(log) for log in log_data["logs"]]
+                    self._decode_events(
+                        log_data.get("txid"), None, app_id, logs, batch
+                    )
+            yield from cast(List[EventRecord], batch.decode())
+
+    def decode_blocks(
+        self, blocks: Iterable[Dict[str, Any]]
+    ) -> Iterator[DecodedLogRecord]:
+        """
+        Decode the app calls in blocks as returned by
+        AlgodClient.block_info(response_format="msgpack") and unpacked with
+        msgpack.unpackb(..., raw=False, strict_map_key=False).
+
+        Args:
+            blocks (Iterable[dict]): decoded blocks
+
+        Returns:
+            Iterator[DecodedLogRecord]: records as described in
+            decode_transactions
+        """
+        for chunk in _chunks(blocks, self.batch_size):
+            batch = _Batch()
+            for block in chunk:
+                block = block.get("block", block)
+                for stxn in block.get("txns") or []:
+                    first = len(batch.records)
+                    self._decode_block_txn(stxn, block.get("rnd"), batch)
+                    if len(batch.records) > first:
+                        # Only hash transactions that produced records
+                        tx_id = _block_tx_id(stxn, block)
+                        for record in batch.records[first:]:
+                            record.tx_id = tx_id
+            yield from batch.decode()
+
+    def _decode_indexer_txn(
+        self,
+        txn: Dict[str, Any],
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        batch: "_Batch",
+    ) -> None:
+        if "application-transaction" not in txn:
+            return
+        app_txn: Dict[str, Any] = txn["application-transaction"]
+        app_id: int = app_txn.get("application-id", 0) or txn.get(
+            "created-application-index", 0
+        )
+        app_args = app_txn.get("application-args")
+        plan = None
+        if app_args:
+            selector = _b64decode(app_args[0])
+            method = self._method(selector)
+            if method is not None:
+                plan = self._methods.call_plan(method)
+                decoded_args = [selector] + [
+                    _b64decode(a) for a in app_args[1:]
+                ]
+                self._decode_method_call(
+                    tx_id,
+                    confirmed_round,
+                    app_id,
+                    method,
+                    plan,
+                    decoded_args,
+                    lambda: {
+                        "sender": txn.get("sender"),
+                        "app_id": app_id,
+                        "app_args": decoded_args,
+                        "accounts": app_txn.get("accounts", []),
+                        "foreign_apps": app_txn.get("foreign-apps", []),
+                        "foreign_assets": app_txn.get("foreign-assets", []),
+                    },
+                    batch,
+                )
+        logs = [_b64decode(log) for log in txn.get("logs", [])]
+        return_log = _pop_return_log(plan, logs)
+        self._decode_events(tx_id, confirmed_round, app_id, logs, batch)
+        for inner_txn in txn.get("inner-txns", []):
+            self._decode_indexer_txn(inner_txn, tx_id, confirmed_round, batch)
+        if plan is not None:
+            self._decode_return(
+                tx_id, confirmed_round, app_id, plan, return_log, batch
+            )
+
+    def _decode_block_txn(
+        self,
+        stxn: Dict[str, Any],
+        confirmed_round: Optional[int],
+        batch: "_Batch",
+    ) -> None:
+        txn = stxn["txn"]
+        if txn.get("type") != "appl":
+            return
+        apply_data = stxn.get("dt") or {}
+        app_id = txn.get("apid") or stxn.get("apid", 0)
+        app_args = txn.get("apaa")
+        plan = None
+        if app_args:
+            method = self._method(app_args[0])
+            if method is not None:
+                plan = self._methods.call_plan(method)
+                self._decode_method_call(
+                    None,
+                    confirmed_round,
+                    app_id,
+                    method,
+                    plan,
+                    app_args,
+                    lambda: {
+                        "sender": encoding.encode_address(txn.get("snd")),
+                        "app_id": app_id,
+                        "app_args": app_args,
+                        "accounts": [
+                            encoding.encode_address(a)
+                            for a in txn.get("apat") or []
+                        ],
+                        "foreign_apps": txn.get("apfa") or [],
+                        "foreign_assets": txn.get("apas") or [],
+                    },
+                    batch,
+                )
+        logs = list(apply_data.get("lg") or [])
+        return_log = _pop_return_log(plan, logs)
+        self._decode_events(None, confirmed_round, app_id, logs, batch)
+        for inner_stxn in apply_data.get("itx") or []:
+            self._decode_block_txn(inner_stxn, confirmed_round, batch)
+        if plan is not None:
+            self._decode_return(
+                None, confirmed_round, app_id, plan, return_log, batch
+            )
+
+    def _method(self, selector: bytes) -> Optional[Method]:
+        methods = self._methods.by_selector.get(selector)
+        return methods[0] if methods else None
+
+    def _decode_method_call(
+        self,
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        app_id: int,
+        method: Method,
+        plan: _CallPlan,
+        app_args: List[bytes],
+        call_fields: Callable[[], Dict[str, Any]],
+        batch: "_Batch",
+    ) -> None:
+        record = MethodCallRecord(
+            tx_id, confirmed_round, app_id, None, method, None
+        )
+        batch.records.append(record)
+        encoded = app_args[1:]
+        if (
+            plan.static_type is not None
+            and len(encoded) == plan.app_arg_count
+            and plan.has_static_sizes(encoded)
+        ):
+            # References are resolved against the call once decoded
+            context = (plan, call_fields()) if any(plan.references) else None
+            batch.add(
+                plan.static_type, _CALL, record, b"".join(encoded), context
+            )
+            return
+        try:
+            record.args = _decode_call_fields(
+                self._methods, call_fields(), method
+            ).args
+        except Exception as e:
+            record.decode_error = e
+
+    def _decode_return(
+        self,
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        app_id: int,
+        plan: _CallPlan,
+        return_log: Optional[bytes],
+        batch: "_Batch",
+    ) -> None:
+        if plan.return_type is None:
+            return
+        record = ReturnRecord(
+            tx_id, confirmed_round, app_id, None, plan.method, bytes(), None
+        )
+        batch.records.append(record)
+        if return_log is None:
+            record.decode_error = error.ABIEncodingError(
+                "app call transaction did not log a return value"
+            )
+            return
+        record.raw_value = return_log[4:]
+        batch.add(plan.return_type, _RETURN, record, record.raw_value)
+
+    def _decode_events(
+        self,
+        tx_id: Optional[str],
+        confirmed_round: Optional[int],
+        app_id: int,
+        logs: List[bytes],
+        batch: "_Batch",
+    ) -> None:
+        events = self._events
+        for log in logs:
+            event = events.get(log[:4])
+            if event is None:
+                continue
+            record = EventRecord(
+                tx_id, confirmed_round, app_id, None, event, log[4:], None
+            )
+            batch.records.append(record)
+            batch.add(event.args_type, _EVENT, record, record.raw_value)
+
+
+def _pop_return_log(
+    plan: Optional[_CallPlan], logs: List[bytes]
+) -> Optional[bytes]:
+    # The return value is the last log of a non-void method call and is not
+    # decoded as an event
+    if (
+        plan is None
+        or plan.return_type is None
+        or not logs
+        or logs[-1][:4] != ABI_RETURN_HASH
+    ):
+        return None
+    return logs.pop()
+
+
+# Kinds of values decoded by a batch, i.e. the record field they go to
+_CALL = 0
+_RETURN = 1
+_EVENT = 2
+# Kind, record, encoded value and, for calls with reference args, the call
+# plan and fields to resolve them with
+_PendingValue = Tuple[int, DecodedLogRecord, bytes, Any]
+
+
+class _Batch:
+    """
+    Records of a batch of transactions in order, and the values they are
+    waiting on grouped by the type they are decoded as.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[DecodedLogRecord] = []
+        self.groups: Dict[int, Tuple[ABIType, List[_PendingValue]]] = {}
+
+    def add(
+        self,
+        abi_type: ABIType,
+        kind: int,
+        record: DecodedLogRecord,
+        raw_value: bytes,
+        context: Any = None,
+    ) -> None:
+        # Types are compared by identity, which is all that is needed for
+        # the shared types of a decoder's methods and events
+        group = self.groups.get(id(abi_type))
+        if group is None:
+            group = self.groups[id(abi_type)] = (abi_type, [])
+        group[1].append((kind, record, raw_value, context))
+
+    def decode(self) -> List[DecodedLogRecord]:
+        for abi_type, pending in self.groups.values():
+            _decode_group(abi_type, pending)
+        return self.records
+
+
+def _decode_group(abi_type: ABIType, pending: List[_PendingValue]) -> None:
+    unpacker = None
+    raw_indexes: Tuple[int, ...] = ()
+    if isinstance(abi_type, TupleType):
+        layout = abi_type.layout()
+        unpacker, raw_indexes = layout.unpacker, layout.raw_indexes
+    elif isinstance(abi_type, (UintType, UfixedType, ByteType)):
+        size = abi_type.byte_len()
+        if size in _UINT_FORMATS:
+            unpacker = struct.Struct(">" + _UINT_FORMATS[size])
+
+    if unpacker is not None and unpacker.size:
+        # Unpack every value of the right size from one joined buffer
+        size = unpacker.size
+        sized = [p for p in pending if len(p[2]) == size]
+        pending = [p for p in pending if len(p[2]) != size]
+        unpacked = unpacker.iter_unpack(b"".join([p[2] for p in sized]))
+        single = not isinstance(abi_type, TupleType)
+        child_types = (
+            cast(TupleType, abi_type).child_types if raw_indexes else []
+        )
+        for item, values in zip(sized, unpacked):
+            if single:
+                _assign(item, values[0])
+                continue
+            value = list(values)
+            try:
+                for index in raw_indexes:
+                    child_type = child_types[index]
+                    value[index] = child_type.decode(value[index])
+            except Exception as e:
+                _assign_error(item, e)
+                continue
+            _assign(item, value)
+
+    # Values of other types or sizes are decoded, or rejected, one by one
+    for item in pending:
+        try:
+            value = abi_type.decode(item[2])
+        except Exception as e:
+            _assign_error(item, e)
+            continue
+        _assign(item, value)
+
+
+def _assign(item: _PendingValue, value: Any) -> None:
+    kind, record, _, context = item
+    if kind == _CALL:
+        if context is not None:
+            plan, call = context
+            try:
+                value = plan.resolve(value, call)
+            except Exception as e:
+                record.decode_error = e
+                return
+        cast(MethodCallRecord, record).args = value
+    elif kind == _RETURN:
+        cast(ReturnRecord, record).return_value = value
+    else:
+        cast(EventRecord, record).args = value
+
+
+def _assign_error(item: _PendingValue, e: Exception) -> None:
+    item[1].decode_error = e
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# binascii skips the argument checks of base64.b64decode, which add up over
+# the many short app args and logs of a stream
+_b64decode = binascii.a2b_base64
+
+
+def _block_tx_id(stxn: Dict[str, Any], block: Dict[str, Any]) -> str:
+    # Blocks leave out the genesis hash and ID of their transactions, which
+    # are part of what the ID is computed from
+    txn = dict(stxn["txn"])
+    txn["gh"] = block.get("gh")
+    if stxn.get("hgi"):
+        txn["gen"] = block.get("gen")
+    to_sign = constants.txid_prefix + _b64decode(encoding.msgpack_encode(txn))
+    txid = base64.b32encode(encoding.checksum(to_sign)).decode()
+    return encoding._undo_padding(txid)
@@ -1,10 +1,14 @@
+import base64
 import json
-from typing import List, Union, Optional, TypedDict
+from typing import Any, Dict, List, Union, Optional, TypedDict, cast
 
 from Cryptodome.Hash import SHA512
 
 from algosdk import abi, constants, error
 
+# Maximum number of app args of an application call, including the selector
+MAX_APP_ARG_LIMIT = 16
+
 
 # In Python 3.11+ the following classes should be combined using `NotRequired`
 class MethodDict_Optional(TypedDict, total=False):
@@ -47,6 +51,10 @@ class Method:
             if abi.is_abi_transaction_type(arg.type):
                 txn_count += 1
         self.txn_calls = txn_count
+        # Like txn_calls, the signature and selector are computed once; a
+        # method is not expected to change after it is constructed
+        self._signature: Optional[str] = None
+        self._selector: Optional[bytes] = None
 
     def __eq__(self, o: object) -> bool:
         if not isinstance(o, Method):
@@ -60,9 +68,13 @@ class Method:
         )
 
     def get_signature(self) -> str:
-        arg_string = ",".join(str(arg.type) for arg in self.args)
-        ret_string = self.returns.type
-        return "{}({}){}".format(self.name, arg_string, ret_string)
+        if self._signature is None:
+            arg_string = ",".join(str(arg.type) for arg in self.args)
+            ret_string = self.returns.type
+            self._signature = "{}({}){}".format(
+                self.name, arg_string, ret_string
+            )
+        return self._signature
 
     def get_selector(self) -> bytes:
         """
@@ -72,9 +84,11 @@ class Method:
         Returns:
             bytes: first four bytes of the method signature hash
         """
-        hash = SHA512.new(truncate="256")
-        hash.update(self.get_signature().encode("utf-8"))
-        return hash.digest()[:4]
+        if self._selector is None:
+            hash = SHA512.new(truncate="256")
+            hash.update(self.get_signature().encode("utf-8"))
+            self._selector = hash.digest()[:4]
+        return self._selector
 
     def get_txn_calls(self) -> int:
         """
@@ -157,6 +171,241 @@ def get_method_by_name(methods: List[Method], name: str) -> Method:
     return methods_filtered[0]
 
 
+class _MethodIndex:
+    """
+    Name and selector lookup tables over a list of methods, shared by
+    Contract and Interface.
+    """
+
+    def __init__(self, methods: List[Method]) -> None:
+        self.methods = methods
+        self.count = len(methods)
+        self.by_name: Dict[str, List[Method]] = {}
+        self.by_selector: Dict[bytes, List[Method]] = {}
+        self._plans: Dict[int, "_CallPlan"] = {}
+        for method in methods:
+            self.by_name.setdefault(method.name, []).append(method)
+            self.by_selector.setdefault(method.get_selector(), []).append(
+                method
+            )
+
+    def is_current(self, methods: List[Method]) -> bool:
+        # Rebuild when the methods list is replaced or appended to
+        return methods is self.methods and len(methods) == self.count
+
+    def get_by_name(self, name: str) -> Method:
+        methods = self.by_name.get(name, [])
+        if len(methods) > 1:
+            raise KeyError(
+                "found {} methods with the same name {}".format(
+                    len(methods),
+                    ",".join([method.get_signature() for method in methods]),
+                )
+            )
+        if len(methods) == 0:
+            raise KeyError("found 0 methods for {}".format(name))
+        return methods[0]
+
+    def get_by_selector(self, selector: bytes) -> Method:
+        methods = self.by_selector.get(bytes(selector), [])
+        if len(methods) > 1:
+            raise KeyError(
+                "found {} methods with the same selector {}".format(
+                    len(methods), selector.hex()
+                )
+            )
+        if len(methods) == 0:
+            raise KeyError(
+                "found 0 methods for selector {}".format(selector.hex())
+            )
+        return methods[0]
+
+    def call_plan(self, method: Method) -> "_CallPlan":
+        # Keyed by identity since only indexed methods are looked up
+        plan = self._plans.get(id(method))
+        if plan is None:
+            plan = self._plans[id(method)] = _CallPlan(method)
+        return plan
+
+
+class DecodedAppCall:
+    """
+    Represents an application call decoded against an ABI method.
+
+    Args:
+        method (Method): the method the call's selector maps to
+        args (list): decoded value of each method argument that is passed in
+            the app args, in order. Reference arguments are resolved to the
+            address, asset ID or application ID they refer to. Transaction
+            arguments are not part of the app args and are left out.
+
+    Attributes:
+        method (Method)
+        args (list)
+    """
+
+    def __init__(self, method: Method, args: List[Any]) -> None:
+        self.method = method
+        self.args = args
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, DecodedAppCall):
+            return False
+        return self.method == o.method and self.args == o.args
+
+
+def _decode_app_call(index: _MethodIndex, txn: Any) -> DecodedAppCall:
+    """
+    Decode the method and arguments of an application call transaction.
+
+    Args:
+        index (_MethodIndex): methods to match the selector against
+        txn (ApplicationCallTxn | SignedTransaction | dict): the call, either
+            as a transaction object or as an indexer transaction record
+
+    Returns:
+        DecodedAppCall: the matched method and its decoded arguments
+    """
+    return _decode_call_fields(index, _app_call_fields(txn))
+
+
+def _decode_call_fields(
+    index: _MethodIndex, call: Dict[str, Any], method: Optional[Method] = None
+) -> DecodedAppCall:
+    app_args = call["app_args"]
+    if not app_args:
+        raise error.ABIEncodingError(
+            "application call has no app args to read a selector from"
+        )
+    if method is None:
+        method = index.get_by_selector(app_args[0])
+    plan = index.call_plan(method)
+
+    encoded = app_args[1:]
+    if len(encoded) != plan.app_arg_count:
+        raise error.ABIEncodingError(
+            "expected {} app args for method {}, got {}".format(
+                plan.app_arg_count + 1, method.get_signature(), len(app_args)
+            )
+        )
+    if plan.static_type is not None and plan.has_static_sizes(encoded):
+        values = plan.static_type.decode(b"".join(encoded))
+    else:
+        values = [t.decode(a) for t, a in zip(plan.types, encoded)]
+        if plan.packed is not None:
+            values += plan.packed.decode(encoded[-1])
+    return DecodedAppCall(method, plan.resolve(values, call))
+
+
+class _CallPlan:
+    """
+    Types to decode the app args of a method call with, worked out once per
+    method.
+    """
+
+    def __init__(self, method: Method) -> None:
+        self.method = method
+        types: List[abi.ABIType] = []
+        self.references: List[Optional[str]] = []
+        for arg in method.args:
+            if abi.is_abi_transaction_type(arg.type):
+                continue
+            if abi.is_abi_reference_type(arg.type):
+                types.append(abi.UintType(8))
+                self.references.append(str(arg.type))
+            else:
+                types.append(cast(abi.ABIType, arg.type))
+                self.references.append(None)
+
+        # Arguments past the 15th app arg are packed into a trailing tuple
+        self.packed: Optional[abi.TupleType] = None
+        if len(types) > MAX_APP_ARG_LIMIT - 1:
+            self.packed = abi.TupleType(types[MAX_APP_ARG_LIMIT - 2 :])
+            types = types[: MAX_APP_ARG_LIMIT - 2]
+        self.types = types
+        self.app_arg_count = len(types) + (self.packed is not None)
+        self.return_type: Optional[abi.ABIType] = None
+        if method.returns.type != Returns.VOID:
+            self.return_type = cast(abi.ABIType, method.returns.type)
+
+        # Without booleans, which are packed into bits in a tuple, the
+        # encoding of a static tuple is the concatenation of its values, so
+        # static app args can be decoded together as a single tuple
+        self.static_type: Optional[abi.TupleType] = None
+        self.static_sizes: List[int] = []
+        if self.packed is None and not any(
+            t.is_dynamic() or isinstance(t, abi.BoolType) for t in types
+        ):
+            self.static_type = abi.TupleType(types)
+            self.static_sizes = [t.byte_len() for t in types]
+
+    def has_static_sizes(self, encoded: List[bytes]) -> bool:
+        # Each app arg must have its own size for the concatenation to split
+        # back into the same values
+        return list(map(len, encoded)) == self.static_sizes
+
+    def resolve(self, values: List[Any], call: Dict[str, Any]) -> List[Any]:
+        if not any(self.references):
+            return values
+        return [
+            _resolve_reference(ref, value, call) if ref else value
+            for ref, value in zip(self.references, values)
+        ]
+
+
+def _app_call_fields(txn: Any) -> Dict[str, Any]:
+    if isinstance(txn, dict):
+        # Indexer transaction record
+        app_txn = txn.get("application-transaction")
+        if app_txn is None:
+            raise error.ABIEncodingError(
+                "transaction record is not an application call"
+            )
+        return {
+            "sender": txn.get("sender"),
+            "app_id": app_txn.get("application-id", 0),
+            "app_args": [
+                base64.b64decode(a)
+                for a in app_txn.get("application-args", [])
+            ],
+            "accounts": app_txn.get("accounts", []),
+            "foreign_apps": app_txn.get("foreign-apps", []),
+            "foreign_assets": app_txn.get("foreign-assets", []),
+        }
+    # Unwrap a SignedTransaction
+    txn = getattr(txn, "transaction", txn)
+    if not hasattr(txn, "app_args"):
+        raise error.ABIEncodingError(
+            "transaction is not an application call: {}".format(txn)
+        )
+    return {
+        "sender": txn.sender,
+        "app_id": txn.index or 0,
+        "app_args": txn.app_args or [],
+        "accounts": txn.accounts or [],
+        "foreign_apps": txn.foreign_apps or [],
+        "foreign_assets": txn.foreign_assets or [],
+    }
+
+
+def _resolve_reference(ref: str, index: int, call: Dict[str, Any]) -> Any:
+    # Account and application index 0 refer to the sender and the called
+    # app, so their foreign arrays start at index 1
+    if ref == abi.ABIReferenceType.ACCOUNT:
+        refs = [call["sender"]] + list(call["accounts"])
+    elif ref == abi.ABIReferenceType.APPLICATION:
+        refs = [call["app_id"]] + list(call["foreign_apps"])
+    else:
+        refs = list(call["foreign_assets"])
+    if index >= len(refs):
+        raise error.ABIEncodingError(
+            "{} reference {} is out of range of the foreign array".format(
+                ref, index
+            )
+        )
+    return refs[index]
+
+
 class Argument:
     """
     Represents an argument for a ABI method
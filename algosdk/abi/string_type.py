@@ -1,6 +1,10 @@
 from typing import NoReturn, Union
 
-from algosdk.abi.base_type import ABI_LENGTH_SIZE, ABIType
+from algosdk.abi.base_type import (
+    ABI_LENGTH_SIZE,
+    ABIType,
+    _write_bytes,
+)
 from algosdk import error
 
 
@@ -42,6 +46,22 @@ class StringType(ABIType):
         length_to_encode = len(encoded).to_bytes(2, byteorder="big")
         return length_to_encode + encoded
 
+    def encoded_len(self, string_val: str) -> int:
+        if not isinstance(string_val, str):
+            raise error.ABIEncodingError(
+                "value {} is not a string".format(string_val)
+            )
+        if string_val.isascii():
+            return ABI_LENGTH_SIZE + len(string_val)
+        return ABI_LENGTH_SIZE + len(string_val.encode("utf-8"))
+
+    def _encode_into(
+        self, buffer: bytearray, offset: int, string_val: str
+    ) -> int:
+        encoded = string_val.encode("utf-8")
+        length = len(encoded).to_bytes(ABI_LENGTH_SIZE, byteorder="big")
+        return _write_bytes(buffer, offset, length + encoded)
+
     def decode(self, bytestring: Union[bytes, bytearray]) -> str:
         """
         Decodes a bytestring to a string.
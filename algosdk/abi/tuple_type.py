@@ -1,9 +1,47 @@
-from typing import Any, List, Union, Optional, cast
-
-from algosdk.abi.base_type import ABI_LENGTH_SIZE, ABIType
+import struct
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from algosdk.abi.base_type import (
+    _UINT_FORMATS,
+    ABI_LENGTH_SIZE,
+    ABIType,
+    _write_bytes,
+)
 from algosdk.abi.bool_type import BoolType
+from algosdk.abi.byte_type import ByteType
+from algosdk.abi.ufixed_type import UfixedType
+from algosdk.abi.uint_type import UintType
+from algosdk.abi.vectorized import element_width, encode_vector, is_vector
 from algosdk import error
 
+# Kinds of head segments in a compiled tuple layout
+STATIC_SEGMENT = 0
+BOOL_SEGMENT = 1
+DYNAMIC_SEGMENT = 2
+# Arrays of at least this many integers are packed with a single struct call
+BULK_PACK_THRESHOLD = 16
+# Placeholder written for a dynamic offset until its value is known
+_EMPTY_OFFSET = bytes(ABI_LENGTH_SIZE)
+
+
+class TupleLayout(NamedTuple):
+    """
+    Compiled head layout of a tuple, computed once per type.
+
+    Each segment is a (kind, child index, arg, head offset, head size)
+    tuple, where arg is the child type for static and dynamic segments and
+    the number of packed booleans for bool segments.
+    """
+
+    segments: Tuple[Tuple[int, int, Any, int, int], ...]
+    head_size: int
+    is_dynamic: bool
+    # For static tuples without booleans, a struct unpacking the whole
+    # encoding at once, and the indexes of the children it leaves as raw
+    # bytes for their own decode
+    unpacker: Optional[struct.Struct] = None
+    raw_indexes: Tuple[int, ...] = ()
+
 
 class TupleType(ABIType):
     """
@@ -24,6 +62,27 @@ class TupleType(ABIType):
         super().__init__()
         self.child_types = arg_types
 
+    @property
+    def child_types(self) -> List[Any]:
+        return self._child_types
+
+    @child_types.setter
+    def child_types(self, arg_types: List[Any]) -> None:
+        self._child_types = arg_types
+        self._compiled_layout: Optional[TupleLayout] = None
+
+    def _copy(self) -> "TupleType":
+        return TupleType([child._copy() for child in self.child_types])
+
+    def layout(self) -> TupleLayout:
+        """
+        Return the compiled head layout of this tuple. The layout is built on
+        first use and reused by every encode and decode afterwards.
+        """
+        if self._compiled_layout is None:
+            self._compiled_layout = _compile_layout(self.child_types)
+        return self._compiled_layout
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TupleType):
             return False
@@ -33,24 +92,15 @@ class TupleType(ABIType):
         return "({})".format(",".join(str(t) for t in self.child_types))
 
     def byte_len(self) -> int:
-        size = 0
-        i = 0
-        while i < len(self.child_types):
-            if isinstance(self.child_types[i], BoolType):
-                after = TupleType._find_bool(self.child_types, i, 1)
-                i += after
-                bool_num = after + 1
-                size += bool_num // 8
-                if bool_num % 8 != 0:
-                    size += 1
-            else:
-                child_byte_size = self.child_types[i].byte_len()
-                size += child_byte_size
-            i += 1
-        return size
+        layout = self.layout()
+        if layout.is_dynamic:
+            raise error.ABITypeError(
+                "cannot get length of a dynamic type: {}".format(self)
+            )
+        return layout.head_size
 
     def is_dynamic(self) -> bool:
-        return any(child.is_dynamic() for child in self.child_types)
+        return self.layout().is_dynamic
 
     @staticmethod
     def _find_bool(type_list: List[ABIType], index: int, delta: int) -> int:
@@ -143,77 +193,74 @@ class TupleType(ABIType):
         Returns:
             bytes: encoded bytes of the tuple
         """
-        if len(self.child_types) >= (2**16):
+        return self._encode_buffered(values)
+
+    def _check_values(self, values: Sequence[Any]) -> None:
+        # child_types can be replaced after __init__ checked its length
+        if len(self.child_types) >= 2**16:
             raise error.ABIEncodingError(
                 "length of tuple array should not exceed a uint16: {}".format(
                     len(self.child_types)
                 )
             )
-        tuple_elements = self.child_types
-
-        # Create a head/tail component and use it to concat bytes later
-        heads = list()
-        tails = list()
-        is_dynamic_index = list()
-        i = 0
-        while i < len(tuple_elements):
-            element = tuple_elements[i]
-            if element.is_dynamic():
-                # Head is not pre-determined for dynamic types; store a placeholder for now
-                heads.append(b"\x00\x00")
-                is_dynamic_index.append(True)
-                tail_encoding = element.encode(values[i])
-                tails.append(tail_encoding)
-            else:
-                if isinstance(element, BoolType):
-                    before = TupleType._find_bool(self.child_types, i, -1)
-                    after = TupleType._find_bool(self.child_types, i, 1)
+        if len(values) != len(self.child_types):
+            raise error.ABIEncodingError(
+                "expected {} values for tuple {}, got {}".format(
+                    len(self.child_types), self, len(values)
+                )
+            )
+
+    def encoded_len(self, values: Sequence[Any]) -> int:
+        self._check_values(values)
+        layout = self.layout()
+        size = layout.head_size
+        if layout.is_dynamic:
+            for kind, index, arg, _, _ in layout.segments:
+                if kind == DYNAMIC_SEGMENT:
+                    size += arg.encoded_len(values[index])
+        return size
 
-                    # Pack bytes to heads and tails
-                    if before % 8 != 0:
+    def _encode_into(
+        self, buffer: bytearray, offset: int, values: Sequence[Any]
+    ) -> int:
+        if len(values) != len(self._child_types) or len(values) >= 2**16:
+            self._check_values(values)
+        layout = self._compiled_layout or self.layout()
+
+        # The head holds static values and the offsets of dynamic values,
+        # which follow it in order and are only known once written
+        dynamic_segments = []
+        for kind, index, arg, head_offset, _ in layout.segments:
+            start = offset + head_offset
+            if kind == STATIC_SEGMENT:
+                arg._encode_into(buffer, start, values[index])
+            elif kind == BOOL_SEGMENT:
+                bits = 0
+                for bool_i in range(arg):
+                    value = values[index + bool_i]
+                    if not isinstance(value, bool):
                         raise error.ABIEncodingError(
-                            "expected before index should have number of bool mod 8 equal 0"
-                        )
-                    after = min(7, after)
-                    consecutive_bool_list = cast(
-                        List[bool], values[i : i + after + 1]
-                    )
-                    compressed_int = TupleType._compress_multiple_bool(
-                        consecutive_bool_list
-                    )
-                    heads.append(bytes([compressed_int]))
-                    i += after
-                else:
-                    encoded_tuple_element = element.encode(values[i])
-                    heads.append(encoded_tuple_element)
-                is_dynamic_index.append(False)
-                tails.append(b"")
-            i += 1
-
-        # Adjust heads for dynamic types
-        head_length = 0
-        for head_element in heads:
-            # If the element is not a placeholder, append the length of the element
-            head_length += len(head_element)
-
-        # Correctly encode dynamic types and replace placeholder
-        tail_curr_length = 0
-        for i in range(len(heads)):
-            if is_dynamic_index[i]:
-                head_value = head_length + tail_curr_length
-                if head_value >= 2**16:
-                    raise error.ABIEncodingError(
-                        "byte length {} should not exceed a uint16".format(
-                            head_value
+                            "expected boolean values: {}".format(value)
                         )
+                    if value:
+                        bits |= 0x80 >> bool_i
+                _write_bytes(buffer, start, bytes((bits,)))
+            else:
+                _write_bytes(buffer, start, _EMPTY_OFFSET)
+                dynamic_segments.append((start, index, arg))
+
+        tail = offset + layout.head_size
+        for start, index, arg in dynamic_segments:
+            head_value = tail - offset
+            if head_value >= 2**16:
+                raise error.ABIEncodingError(
+                    "byte length {} should not exceed a uint16".format(
+                        head_value
                     )
-                heads[i] = head_value.to_bytes(
-                    ABI_LENGTH_SIZE, byteorder="big"
                 )
-            tail_curr_length += len(tails[i])
-
-        # Concatenate bytes
-        return b"".join(heads) + b"".join(tails)
+            struct.pack_into(">H", buffer, start, head_value)
+            tail = arg._encode_into(buffer, tail, values[index])
+        return tail
 
     def decode(self, bytestring: Union[bytes, bytearray]) -> list:
         """
@@ -231,92 +278,266 @@ class TupleType(ABIType):
             raise error.ABIEncodingError(
                 "value string must be in bytes: {}".format(bytestring)
             )
-        tuple_elements = self.child_types
-        dynamic_segments: List[List[int]] = (
-            list()
-        )  # Store the start and end of a dynamic element
-        value_partitions: List[Optional[Union[bytes, bytearray]]] = list()
-        i = 0
-        array_index = 0
-
-        while i < len(tuple_elements):
-            element = tuple_elements[i]
-            if element.is_dynamic():
-                if len(bytestring[array_index:]) < ABI_LENGTH_SIZE:
-                    raise error.ABIEncodingError(
-                        "malformed value: dynamically typed values must contain a two-byte length specifier"
-                    )
-                # Decode the size of the dynamic element
-                dynamic_index = int.from_bytes(
-                    bytestring[array_index : array_index + ABI_LENGTH_SIZE],
-                    byteorder="big",
-                    signed=False,
-                )
-                if len(dynamic_segments) > 0:
-                    dynamic_segments[-1][1] = dynamic_index
-                    # Check that the right side of segment is greater than the left side
-                    assert (
-                        dynamic_index
-                        > dynamic_segments[len(dynamic_segments) - 1][0]
-                    )
-                # Since we do not know where the current dynamic element ends, put a placeholder and update later
-                dynamic_segments.append([dynamic_index, -1])
-                value_partitions.append(None)
-                array_index += ABI_LENGTH_SIZE
+        layout = self.layout()
+        _check_head_length(bytestring, layout.head_size, layout.is_dynamic)
+
+        if layout.unpacker is not None:
+            values = list(layout.unpacker.unpack(bytestring))
+            for index in layout.raw_indexes:
+                values[index] = self.child_types[index].decode(values[index])
+            return values
+
+        values = [None] * len(self.child_types)
+        dynamic_segments: List[Tuple[int, ABIType, int]] = []
+        for kind, index, arg, offset, size in layout.segments:
+            if kind == STATIC_SEGMENT:
+                values[index] = arg.decode(bytestring[offset : offset + size])
+            elif kind == BOOL_SEGMENT:
+                bits = bytestring[offset]
+                for bool_i in range(arg):
+                    values[index + bool_i] = bool(bits & (0x80 >> bool_i))
             else:
-                if isinstance(element, BoolType):
-                    before = TupleType._find_bool(self.child_types, i, -1)
-                    after = TupleType._find_bool(self.child_types, i, 1)
-
-                    if before % 8 != 0:
-                        raise error.ABIEncodingError(
-                            "expected before index should have number of bool mod 8 equal 0"
-                        )
-                    after = min(7, after)
-                    bits = int.from_bytes(
-                        bytestring[array_index : array_index + 1],
-                        byteorder="big",
-                    )
-                    # Parse bool values into multiple byte strings
-                    for bool_i in range(after + 1):
-                        mask = 128 >> bool_i
-                        if mask & bits:
-                            value_partitions.append(b"\x80")
-                        else:
-                            value_partitions.append(b"\x00")
-                    i += after
-                    array_index += 1
-                else:
-                    curr_len = element.byte_len()
-                    value_partitions.append(
-                        bytestring[array_index : array_index + curr_len]
-                    )
-                    array_index += curr_len
-            if array_index >= len(bytestring) and i != len(tuple_elements) - 1:
+                start = int.from_bytes(
+                    bytestring[offset : offset + size], byteorder="big"
+                )
+                dynamic_segments.append((index, arg, start))
+
+        # Each dynamic value runs until the next one starts
+        ends = [start for _, _, start in dynamic_segments[1:]]
+        ends.append(len(bytestring))
+        prev_end = layout.head_size
+        for (index, child_type, start), end in zip(dynamic_segments, ends):
+            if start != prev_end or end < start:
                 raise error.ABIEncodingError(
-                    f"input string is not long enough to be decoded: {bytestring!r}"
+                    f"malformed value: dynamic offsets are out of order: {bytestring!r}"
                 )
-            i += 1
+            values[index] = child_type.decode(bytestring[start:end])
+            prev_end = end
+        return values
+
+
+def _compile_layout(child_types: Sequence[ABIType]) -> TupleLayout:
+    segments: List[Tuple[int, int, Any, int, int]] = []
+    offset = 0
+    dynamic = False
+    i = 0
+    while i < len(child_types):
+        child_type = child_types[i]
+        if isinstance(child_type, BoolType):
+            # Up to 8 consecutive booleans share a single byte
+            count = 1
+            while (
+                count < 8
+                and i + count < len(child_types)
+                and isinstance(child_types[i + count], BoolType)
+            ):
+                count += 1
+            segments.append((BOOL_SEGMENT, i, count, offset, 1))
+            offset += 1
+            i += count
+            continue
+        if child_type.is_dynamic():
+            dynamic = True
+            size = ABI_LENGTH_SIZE
+            segments.append((DYNAMIC_SEGMENT, i, child_type, offset, size))
+        else:
+            size = child_type.byte_len()
+            segments.append((STATIC_SEGMENT, i, child_type, offset, size))
+        offset += size
+        i += 1
+    if dynamic or any(kind == BOOL_SEGMENT for kind, *_ in segments):
+        return TupleLayout(tuple(segments), offset, dynamic)
+
+    formats = []
+    raw_indexes = []
+    for _, index, child_type, _, size in segments:
+        if isinstance(child_type, (UintType, UfixedType, ByteType)) and (
+            size in _UINT_FORMATS
+        ):
+            formats.append(_UINT_FORMATS[size])
+        else:
+            formats.append("{}s".format(size))
+            raw_indexes.append(index)
+    unpacker = struct.Struct(">" + "".join(formats))
+    return TupleLayout(
+        tuple(segments), offset, dynamic, unpacker, tuple(raw_indexes)
+    )
+
+
+def _pack_bools(values: Sequence[Any]) -> bytes:
+    """
+    Pack booleans into bytes, most significant bit first.
+    """
+    if not all(isinstance(value, bool) for value in values):
+        raise error.ABIEncodingError(
+            "expected boolean values: {}".format(values)
+        )
+    if not values:
+        return b""
+    bits = "".join(["1" if value else "0" for value in values])
+    padded = bits + "0" * (-len(bits) % 8)
+    return int(padded, 2).to_bytes(len(padded) // 8, byteorder="big")
+
+
+def _unpack_bools(bytestring: Union[bytes, bytearray], count: int) -> list:
+    bits = bin(int.from_bytes(bytestring, byteorder="big"))[2:]
+    bits = bits.zfill(8 * len(bytestring))
+    return [bit == "1" for bit in bits[:count]]
+
+
+def _check_head_length(
+    bytestring: Union[bytes, bytearray], head_size: int, is_dynamic: bool
+) -> None:
+    if len(bytestring) < head_size:
+        raise error.ABIEncodingError(
+            f"input string is not long enough to be decoded: {bytestring!r}"
+        )
+    if not is_dynamic and len(bytestring) > head_size:
+        raise error.ABIEncodingError(
+            f"input string was not fully consumed: {bytestring!r}"
+        )
+
+
+def _check_sequence_length(length: int) -> None:
+    if length >= 2**16:
+        raise error.ABITypeError(
+            "tuple args cannot exceed a uint16: {}".format(length)
+        )
+
+
+def encode_sequence(
+    child_type: ABIType, values: Union[Sequence[Any], bytes, bytearray]
+) -> bytes:
+    """
+    Encode a homogeneous sequence of values, i.e. the elements of a static
+    or dynamic array without the length prefix.
+
+    This produces the same bytes as a TupleType with len(values) copies of
+    child_type, without building that tuple. NumPy arrays, array.array and
+    memoryview values of fixed-width types are converted in bulk.
+    """
+    buffer = bytearray()
+    encode_sequence_into(child_type, buffer, 0, values)
+    return bytes(buffer)
+
 
-        if len(dynamic_segments) > 0:
-            dynamic_segments[len(dynamic_segments) - 1][1] = len(bytestring)
-            array_index = len(bytestring)
-        if array_index < len(bytestring):
+def sequence_encoded_len(
+    child_type: ABIType, values: Union[Sequence[Any], bytes, bytearray]
+) -> int:
+    """
+    Return the length in bytes of encode_sequence(child_type, values).
+    """
+    _check_sequence_length(len(values))
+    if isinstance(child_type, BoolType):
+        return (len(values) + 7) // 8
+    if not child_type.is_dynamic():
+        return child_type.byte_len() * len(values)
+    return ABI_LENGTH_SIZE * len(values) + sum(
+        map(child_type.encoded_len, values)
+    )
+
+
+def encode_sequence_into(
+    child_type: ABIType,
+    buffer: bytearray,
+    offset: int,
+    values: Union[Sequence[Any], bytes, bytearray],
+) -> int:
+    """
+    Write encode_sequence(child_type, values) into buffer at offset, which
+    must have room for it, and return the offset past the written bytes.
+    """
+    count = len(values)
+    _check_sequence_length(count)
+    encoded: Optional[bytes] = None
+    if isinstance(values, (bytes, bytearray)):
+        if isinstance(child_type, ByteType):
+            encoded = bytes(values)
+    elif is_vector(values):
+        encoded = encode_vector(child_type, values)
+    if encoded is None and isinstance(child_type, BoolType):
+        encoded = _pack_bools(values)
+    if encoded is not None:
+        return _write_bytes(buffer, offset, encoded)
+
+    if not child_type.is_dynamic():
+        width = element_width(child_type)
+        if (
+            count >= BULK_PACK_THRESHOLD
+            and width in _UINT_FORMATS
+            and all(type(v) is int for v in values)
+        ):
+            # Pack the whole array at once; values out of range are
+            # reported by the element-wise writer below
+            fmt = ">{}{}".format(count, _UINT_FORMATS[width])
+            try:
+                encoded = struct.pack(fmt, *values)
+            except struct.error:
+                pass
+            else:
+                return _write_bytes(buffer, offset, encoded)
+        for value in values:
+            offset = child_type._encode_into(buffer, offset, value)
+        return offset
+
+    head_size = ABI_LENGTH_SIZE * count
+    _write_bytes(buffer, offset, bytes(head_size))
+    heads = []
+    tail = offset + head_size
+    for value in values:
+        heads.append(tail - offset)
+        tail = child_type._encode_into(buffer, tail, value)
+    if heads and heads[-1] >= 2**16:
+        raise error.ABIEncodingError(
+            "byte length {} should not exceed a uint16".format(heads[-1])
+        )
+    struct.pack_into(">{}H".format(count), buffer, offset, *heads)
+    return tail
+
+
+def decode_sequence(
+    child_type: ABIType, length: int, bytestring: Union[bytes, bytearray]
+) -> list:
+    """
+    Decode a homogeneous sequence of `length` values encoded as by
+    encode_sequence.
+    """
+    _check_sequence_length(length)
+    if isinstance(child_type, BoolType):
+        _check_head_length(bytestring, (length + 7) // 8, False)
+        return _unpack_bools(bytestring, length)
+    if not child_type.is_dynamic():
+        size = child_type.byte_len()
+        _check_head_length(bytestring, size * length, False)
+        if size == 0:
+            return [child_type.decode(bytestring[:0]) for _ in range(length)]
+        if isinstance(child_type, ByteType):
+            return list(bytestring)
+        if isinstance(child_type, (UintType, UfixedType)):
+            return [
+                int.from_bytes(bytestring[i : i + size], byteorder="big")
+                for i in range(0, size * length, size)
+            ]
+        return [
+            child_type.decode(bytestring[i : i + size])
+            for i in range(0, size * length, size)
+        ]
+
+    head_size = ABI_LENGTH_SIZE * length
+    # Without elements there are no offsets to account for trailing bytes
+    _check_head_length(bytestring, head_size, length > 0)
+    starts = [
+        int.from_bytes(bytestring[i : i + ABI_LENGTH_SIZE], byteorder="big")
+        for i in range(0, head_size, ABI_LENGTH_SIZE)
+    ]
+    starts.append(len(bytestring))
+    values = []
+    prev_end = head_size
+    for start, end in zip(starts, starts[1:]):
+        if start != prev_end or end < start:
             raise error.ABIEncodingError(
-                f"input string was not fully consumed: {bytestring!r}"
+                f"malformed value: dynamic offsets are out of order: {bytestring!r}"
             )
-
-        # Check dynamic element partitions
-        segment_index = 0
-        for i, element in enumerate(tuple_elements):
-            if element.is_dynamic():
-                segment_start, segment_end = dynamic_segments[segment_index]
-                value_partitions[i] = bytestring[segment_start:segment_end]
-                segment_index += 1
-
-        # Decode individual tuple elements
-        values = list()
-        for i, element in enumerate(tuple_elements):
-            val = element.decode(value_partitions[i])
-            values.append(val)
-        return values
+        values.append(child_type.decode(bytestring[start:end]))
+        prev_end = end
+    return values
@@ -1,6 +1,6 @@
 from typing import Union
 
-from algosdk.abi.base_type import ABIType
+from algosdk.abi.base_type import ABIType, _write_bytes
 from algosdk import error
 
 
@@ -64,6 +64,20 @@ class UintType(ABIType):
             )
         return value.to_bytes(self.bit_size // 8, byteorder="big")
 
+    def _encode_into(self, buffer: bytearray, offset: int, value: int) -> int:
+        if (
+            not isinstance(value, int)
+            or value >= (2**self.bit_size)
+            or value < 0
+        ):
+            raise error.ABIEncodingError(
+                "value {} is not a non-negative int or is too big to fit in size {}".format(
+                    value, self.bit_size
+                )
+            )
+        encoded = value.to_bytes(self.bit_size // 8, byteorder="big")
+        return _write_bytes(buffer, offset, encoded)
+
     def decode(self, bytestring: Union[bytes, bytearray]) -> int:
         """
         Decodes a bytestring to a uint.
@@ -0,0 +1,228 @@
+import array
+import sys
+from typing import Any, Dict, Optional, Union
+
+from algosdk.abi.base_type import ABIType
+from algosdk.abi.bool_type import BoolType
+from algosdk.abi.byte_type import ByteType
+from algosdk.abi.ufixed_type import UfixedType
+from algosdk.abi.uint_type import UintType
+from algosdk import error
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+# Widest element, in bytes, handled by the vectorized paths
+MAX_VECTOR_WIDTH = 8
+
+# array.array typecodes of unsigned integers. Several may share an item
+# size (e.g. "L" and "Q" on 64 bit Linux), and any of them is accepted.
+_UNSIGNED_TYPECODES = frozenset("BHILQ")
+
+# The typecode used for decoded values of each item size
+_TYPECODE_BY_SIZE: Dict[int, str] = {}
+for _code in ("B", "H", "I", "L", "Q"):
+    _TYPECODE_BY_SIZE.setdefault(array.array(_code).itemsize, _code)
+
+# Maps 0/1 bytes to the characters "0"/"1"
+_BITS_TABLE = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def element_width(child_type: ABIType) -> Optional[int]:
+    """
+    Return the byte width of child_type if arrays of it can be converted
+    in bulk, i.e. uintN, ufixedNxM and byte with N up to 64, otherwise None.
+    """
+    if isinstance(child_type, ByteType):
+        return 1
+    if isinstance(child_type, (UintType, UfixedType)):
+        width = child_type.bit_size // 8
+        if width <= MAX_VECTOR_WIDTH:
+            return width
+    return None
+
+
+def is_vector(values: Any) -> bool:
+    """
+    Check if values is a NumPy array, array.array or memoryview.
+    """
+    if isinstance(values, (array.array, memoryview)):
+        return True
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def encode_vector(child_type: ABIType, values: Any) -> Optional[bytes]:
+    """
+    Encode a NumPy array, array.array or memoryview of fixed-width values
+    in bulk.
+
+    Args:
+        child_type (ABIType): element type of the array
+        values (numpy.ndarray | array.array | memoryview): values to encode
+
+    Returns:
+        bytes | None: encoded elements without a length prefix, or None if
+        values cannot be converted in bulk and must be encoded one by one
+    """
+    if isinstance(child_type, BoolType):
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.dtype != numpy.bool_:
+                raise error.ABIEncodingError(
+                    "expected boolean values: {}".format(values)
+                )
+            return numpy.packbits(_flat(values)).tobytes()
+        flags = _unsigned_array(values)
+        if flags is None:
+            return None
+        return _pack_bits(flags)
+
+    width = element_width(child_type)
+    if width is None:
+        return None
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return _encode_ndarray(_flat(values), width)
+
+    values = _unsigned_array(values)
+    if values is None or values.itemsize != width:
+        # Only a byte swap is needed when the widths agree
+        return None
+    swapped = array.array(values.typecode, values)
+    if sys.byteorder == "little":
+        swapped.byteswap()
+    return swapped.tobytes()
+
+
+def decode_vector(
+    child_type: ABIType, length: int, bytestring: Union[bytes, bytearray]
+) -> Any:
+    """
+    Decode `length` fixed-width values in bulk.
+
+    Args:
+        child_type (ABIType): element type of the array
+        length (int): number of elements
+        bytestring (bytes | bytearray): encoded elements without a length
+            prefix
+
+    Returns:
+        numpy.ndarray | array.array: decoded values in native byte order.
+        A NumPy array is returned when NumPy is installed, booleans are
+        returned as 0/1 bytes when it is not.
+    """
+    if isinstance(child_type, BoolType):
+        _check_size(bytestring, (length + 7) // 8)
+        if numpy is not None:
+            bits = numpy.frombuffer(bytes(bytestring), dtype=numpy.uint8)
+            return numpy.unpackbits(bits, count=length).astype(numpy.bool_)
+        bits_str = bin(int.from_bytes(bytestring, byteorder="big"))[2:]
+        bits_str = bits_str.zfill(8 * len(bytestring))
+        return array.array("B", [c == "1" for c in bits_str[:length]])
+
+    width = element_width(child_type)
+    if width is None:
+        raise error.ABITypeError(
+            "cannot decode {} into an array of fixed-width values".format(
+                child_type
+            )
+        )
+    _check_size(bytestring, width * length)
+    if numpy is not None:
+        return _decode_ndarray(bytes(bytestring), width, length)
+
+    if width in _TYPECODE_BY_SIZE:
+        decoded = array.array(_TYPECODE_BY_SIZE[width])
+        decoded.frombytes(bytes(bytestring))
+        if sys.byteorder == "little":
+            decoded.byteswap()
+        return decoded
+    return array.array(
+        _TYPECODE_BY_SIZE[MAX_VECTOR_WIDTH],
+        [
+            int.from_bytes(bytestring[i : i + width], byteorder="big")
+            for i in range(0, width * length, width)
+        ],
+    )
+
+
+def _unsigned_array(values: Any) -> Optional[array.array]:
+    # An array.array of unsigned integers with the contents of values, or
+    # None if values is not one and has no unsigned integer format
+    if isinstance(values, memoryview):
+        code = values.format.lstrip("@")
+        if code == "?":
+            code = "B"
+        if code not in _UNSIGNED_TYPECODES:
+            return None
+        return array.array(code, values.tobytes())
+    if isinstance(values, array.array):
+        if values.typecode not in _UNSIGNED_TYPECODES:
+            return None
+        return values
+    return None
+
+
+def _pack_bits(flags: array.array) -> bytes:
+    # Pack 0/1 values into bits, most significant bit first
+    if flags and max(flags) > 1:
+        raise error.ABIEncodingError(
+            "expected boolean values: {}".format(flags)
+        )
+    if flags.itemsize != 1:
+        flags = array.array("B", flags)
+    bits = flags.tobytes().translate(_BITS_TABLE)
+    if not bits:
+        return b""
+    size = (len(bits) + 7) // 8
+    return int(bits.ljust(8 * size, b"0"), 2).to_bytes(size, "big")
+
+
+def _flat(values: Any) -> Any:
+    if values.ndim != 1:
+        raise error.ABIEncodingError(
+            "expected a one-dimensional array, got shape {}".format(
+                values.shape
+            )
+        )
+    return values
+
+
+def _encode_ndarray(values: Any, width: int) -> bytes:
+    if values.dtype.kind not in "ui":
+        raise error.ABIEncodingError(
+            "expected an integer array, got dtype {}".format(values.dtype)
+        )
+    if values.size and (
+        int(values.min()) < 0 or int(values.max()) >> (8 * width)
+    ):
+        raise error.ABIEncodingError(
+            "array values do not fit in {} bytes".format(width)
+        )
+    if width in (1, 2, 4, 8):
+        return values.astype(">u{}".format(width)).tobytes()
+    # Drop the leading zero bytes of each big-endian 64 bit value
+    wide = values.astype(">u8").view(numpy.uint8).reshape(-1, 8)
+    return wide[:, 8 - width :].tobytes()
+
+
+def _decode_ndarray(bytestring: bytes, width: int, length: int) -> Any:
+    if width in (1, 2, 4, 8):
+        big = numpy.frombuffer(bytestring, dtype=">u{}".format(width))
+        return big.astype("=u{}".format(width))
+    wide = numpy.zeros((length, 8), dtype=numpy.uint8)
+    wide[:, 8 - width :] = numpy.frombuffer(
+        bytestring, dtype=numpy.uint8
+    ).reshape(length, width)
+    return wide.view(">u8").ravel().astype(numpy.uint64)
+
+
+def _check_size(bytestring: Union[bytes, bytearray], size: int) -> None:
+    if len(bytestring) < size:
+        raise error.ABIEncodingError(
+            f"input string is not long enough to be decoded: {bytestring!r}"
+        )
+    if len(bytestring) > size:
+        raise error.ABIEncodingError(
+            f"input string was not fully consumed: {bytestring!r}"
+        )
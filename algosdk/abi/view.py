@@ -0,0 +1,381 @@
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from algosdk.abi.array_dynamic_type import ArrayDynamicType
+from algosdk.abi.array_static_type import ArrayStaticType
+from algosdk.abi.base_type import ABI_LENGTH_SIZE, ABIType
+from algosdk.abi.bool_type import BoolType
+from algosdk.abi.byte_type import ByteType
+from algosdk.abi.tuple_type import (
+    BOOL_SEGMENT,
+    DYNAMIC_SEGMENT,
+    TupleType,
+    _check_sequence_length,
+)
+from algosdk.abi.ufixed_type import UfixedType
+from algosdk.abi.uint_type import UintType
+from algosdk import error
+
+# ARC-56 style struct definitions: struct name -> [{"name", "type"}, ...],
+# where each field type is an ABI type string or another struct name
+StructDefinitions = Mapping[str, Sequence[Mapping[str, str]]]
+
+
+def struct_type(name: str, structs: StructDefinitions) -> TupleType:
+    """
+    Build the tuple type of an ARC-4 struct.
+
+    Args:
+        name (str): name of the struct
+        structs (dict): struct definitions keyed by struct name, each a list
+            of {"name": ..., "type": ...} fields whose type is either an ABI
+            type string or the name of another struct
+
+    Returns:
+        TupleType: the tuple type the struct is encoded as
+    """
+    if name not in structs:
+        raise error.ABITypeError("unknown struct: {}".format(name))
+    child_types: List[ABIType] = []
+    for field in structs[name]:
+        if field["type"] in structs:
+            child_types.append(struct_type(field["type"], structs))
+        else:
+            child_types.append(ABIType.from_string(field["type"]))
+    return TupleType(child_types)
+
+
+def decode_view(
+    abi_type: ABIType,
+    bytestring: Union[bytes, bytearray, memoryview],
+    struct: Optional[str] = None,
+    structs: Optional[StructDefinitions] = None,
+) -> Any:
+    """
+    Decode an ABI value lazily without copying the encoded bytes.
+
+    Tuples and arrays are returned as TupleView and ArrayView objects over a
+    memoryview of bytestring that decode an element only when it is
+    accessed. Other types are decoded right away.
+
+    Args:
+        abi_type (ABIType): type of the encoded value
+        bytestring (bytes | bytearray | memoryview): bytestring to be decoded
+        struct (str, optional): name of the ARC-4 struct the value is
+            encoded as, used to name the fields of the returned TupleView
+        structs (dict, optional): struct definitions keyed by struct name,
+            as accepted by struct_type
+
+    Returns:
+        TupleView | ArrayView | Any: decoded value
+    """
+    if not isinstance(bytestring, (bytes, bytearray, memoryview)):
+        raise error.ABIEncodingError(
+            "value to be decoded must be in bytes: {}".format(bytestring)
+        )
+    buffer = memoryview(bytestring).cast("B")
+    if struct is None:
+        return _view(abi_type, buffer, None)
+    if structs is None or struct not in structs:
+        raise error.ABITypeError("unknown struct: {}".format(struct))
+    if struct_type(struct, structs) != abi_type:
+        raise error.ABITypeError(
+            "struct {} does not match type {}".format(struct, abi_type)
+        )
+    return _view(abi_type, buffer, (struct, structs))
+
+
+class TupleView(Sequence):
+    """
+    Lazily decoded tuple over a memoryview of its encoding.
+
+    Fields are decoded on first access and cached. When decoded as an ARC-4
+    struct, fields can also be read by name as attributes or keys.
+
+    Args:
+        tuple_type (TupleType): type of the encoded tuple
+        buffer (memoryview): encoded tuple
+        struct (tuple, optional): struct name and struct definitions
+
+    Attributes:
+        tuple_type (TupleType)
+        field_names (tuple)
+    """
+
+    def __init__(
+        self,
+        tuple_type: TupleType,
+        buffer: memoryview,
+        struct: Optional[Tuple[str, StructDefinitions]] = None,
+    ) -> None:
+        self.tuple_type = tuple_type
+        self._buffer = buffer
+        self._struct = struct
+        self.field_names: Tuple[str, ...] = ()
+        if struct is not None:
+            name, structs = struct
+            self.field_names = tuple(f["name"] for f in structs[name])
+        self._values: Dict[int, Any] = {}
+        self._spans = self._read_spans()
+
+    def _read_spans(self) -> List[Tuple[int, int]]:
+        layout = self.tuple_type.layout()
+        buffer = self._buffer
+        _check_length(buffer, layout.head_size, layout.is_dynamic)
+
+        spans: List[Tuple[int, int]] = [(0, 0)] * len(
+            self.tuple_type.child_types
+        )
+        dynamic: List[Tuple[int, int]] = []
+        for kind, index, arg, offset, size in layout.segments:
+            if kind == BOOL_SEGMENT:
+                for bool_i in range(arg):
+                    spans[index + bool_i] = (offset, bool_i)
+            elif kind == DYNAMIC_SEGMENT:
+                start = int.from_bytes(
+                    buffer[offset : offset + size], byteorder="big"
+                )
+                dynamic.append((index, start))
+            else:
+                spans[index] = (offset, offset + size)
+
+        # Each dynamic value runs until the next one starts
+        ends = [start for _, start in dynamic[1:]] + [len(buffer)]
+        prev_end = layout.head_size
+        for (index, start), end in zip(dynamic, ends):
+            if start != prev_end or end < start:
+                raise error.ABIEncodingError(
+                    "malformed value: dynamic offsets are out of order"
+                )
+            spans[index] = (start, end)
+            prev_end = end
+        return spans
+
+    def __len__(self) -> int:
+        return len(self.tuple_type.child_types)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            return self[self._field_index(key)]
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("tuple index out of range")
+        if key not in self._values:
+            self._values[key] = self._decode(key)
+        return self._values[key]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in self.__dict__.get(
+            "field_names", ()
+        ):
+            raise AttributeError(name)
+        return self[name]
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TupleView, ArrayView)):
+            other = other.to_list()
+        return isinstance(other, (list, tuple)) and self.to_list() == list(
+            other
+        )
+
+    def __repr__(self) -> str:
+        if self.field_names:
+            return "{}({})".format(
+                self._struct[0] if self._struct else "TupleView",
+                ", ".join(
+                    "{}={!r}".format(k, v) for k, v in self.to_dict().items()
+                ),
+            )
+        return "TupleView({!r})".format(self.to_list())
+
+    def _field_index(self, name: str) -> int:
+        try:
+            return self.field_names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+
+    def _decode(self, index: int) -> Any:
+        child_type = self.tuple_type.child_types[index]
+        first, second = self._spans[index]
+        if isinstance(child_type, BoolType):
+            return bool(self._buffer[first] & (0x80 >> second))
+        struct = None
+        if self._struct is not None:
+            name, structs = self._struct
+            field_type = structs[name][index]["type"]
+            if field_type in structs:
+                struct = (field_type, structs)
+        return _view(child_type, self._buffer[first:second], struct)
+
+    def to_list(self) -> list:
+        """
+        Decode every field, returning the same list as TupleType.decode.
+        """
+        return [_materialize(value) for value in self]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Decode every field of a struct into a dict keyed by field name.
+        Nested structs are decoded into dicts as well.
+        """
+        if not self.field_names:
+            raise error.ABITypeError(
+                "tuple was not decoded as a struct: {}".format(self.tuple_type)
+            )
+        return {
+            name: (
+                value.to_dict()
+                if isinstance(value, TupleView) and value.field_names
+                else _materialize(value)
+            )
+            for name, value in zip(self.field_names, self)
+        }
+
+
+class ArrayView(Sequence):
+    """
+    Lazily decoded static or dynamic array over a memoryview of its
+    encoding. Elements are decoded on access and are not cached.
+
+    Args:
+        child_type (ABIType): type of the array elements
+        length (int): number of elements
+        buffer (memoryview): encoded elements without the length prefix
+
+    Attributes:
+        child_type (ABIType)
+    """
+
+    def __init__(
+        self, child_type: ABIType, length: int, buffer: memoryview
+    ) -> None:
+        _check_sequence_length(length)
+        self.child_type = child_type
+        self._length = length
+        self._buffer = buffer
+        self._size = 0
+        self._starts: List[int] = []
+        if isinstance(child_type, BoolType):
+            _check_length(buffer, (length + 7) // 8, False)
+        elif not child_type.is_dynamic():
+            self._size = child_type.byte_len()
+            _check_length(buffer, self._size * length, False)
+        else:
+            self._starts = self._read_starts()
+
+    def _read_starts(self) -> List[int]:
+        buffer = self._buffer
+        head_size = ABI_LENGTH_SIZE * self._length
+        # Without elements there are no offsets to account for trailing bytes
+        _check_length(buffer, head_size, self._length > 0)
+        starts = [
+            int.from_bytes(buffer[i : i + ABI_LENGTH_SIZE], byteorder="big")
+            for i in range(0, head_size, ABI_LENGTH_SIZE)
+        ]
+        starts.append(len(buffer))
+        prev_end = head_size
+        for start, end in zip(starts, starts[1:]):
+            if start != prev_end or end < start:
+                raise error.ABIEncodingError(
+                    "malformed value: dynamic offsets are out of order"
+                )
+            prev_end = end
+        return starts
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("array index out of range")
+        if isinstance(self.child_type, BoolType):
+            return bool(self._buffer[key // 8] & (0x80 >> (key % 8)))
+        if self._starts:
+            start, end = self._starts[key], self._starts[key + 1]
+        else:
+            start = key * self._size
+            end = start + self._size
+        return _view(self.child_type, self._buffer[start:end], None)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(self._length):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TupleView, ArrayView)):
+            other = other.to_list()
+        return isinstance(other, (list, tuple)) and self.to_list() == list(
+            other
+        )
+
+    def __repr__(self) -> str:
+        return "ArrayView({!r})".format(self.to_list())
+
+    def to_list(self) -> list:
+        """
+        Decode every element, returning the same list as the array type's
+        decode.
+        """
+        return [_materialize(value) for value in self]
+
+
+def _view(
+    abi_type: ABIType,
+    buffer: memoryview,
+    struct: Optional[Tuple[str, StructDefinitions]],
+) -> Any:
+    if isinstance(abi_type, TupleType):
+        return TupleView(abi_type, buffer, struct)
+    if isinstance(abi_type, ArrayStaticType):
+        return ArrayView(abi_type.child_type, abi_type.static_length, buffer)
+    if isinstance(abi_type, ArrayDynamicType):
+        if len(buffer) < ABI_LENGTH_SIZE:
+            raise error.ABIEncodingError(
+                "dynamic array is too short to be decoded: {}".format(
+                    len(buffer)
+                )
+            )
+        length = int.from_bytes(buffer[:ABI_LENGTH_SIZE], byteorder="big")
+        return ArrayView(abi_type.child_type, length, buffer[ABI_LENGTH_SIZE:])
+    if isinstance(abi_type, (UintType, UfixedType, ByteType)):
+        # Fixed-width integers decode straight from the view
+        _check_length(buffer, abi_type.byte_len(), False)
+        return int.from_bytes(buffer, byteorder="big")
+    return abi_type.decode(buffer.tobytes())
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, (TupleView, ArrayView)):
+        return value.to_list()
+    return value
+
+
+def _check_length(buffer: memoryview, size: int, is_dynamic: bool) -> None:
+    if len(buffer) < size:
+        raise error.ABIEncodingError(
+            f"input string is not long enough to be decoded: {buffer.tobytes()!r}"
+        )
+    if not is_dynamic and len(buffer) > size:
+        raise error.ABIEncodingError(
+            f"input string was not fully consumed: {buffer.tobytes()!r}"
+        )
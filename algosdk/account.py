@@ -1,5 +1,8 @@
+from collections import deque
+from nacl.bindings import crypto_sign_seed_keypair
 from nacl.signing import SigningKey
 import base64
+import os
 from . import encoding, constants
 
 
@@ -30,3 +33,206 @@ def address_from_private_key(private_key):
     pk = base64.b64decode(private_key)[constants.key_len_bytes :]
     address = encoding.encode_address(pk)
     return address
+
+
+# Header of files written by write_accounts in the binary format
+ACCOUNTS_FILE_MAGIC = b"ALGOKEY1"
+
+
+def generate_accounts(
+    count, with_mnemonics=False, processes=1, chunk_size=4096
+):
+    """
+    Generate many accounts, optionally spreading the work across worker
+    processes.
+
+    Accounts are produced in chunks and yielded as soon as each chunk is
+    ready, so any number of them can be streamed without holding them all
+    in memory.
+
+    Args:
+        count (int): number of accounts to generate
+        with_mnemonics (bool, optional): also compute each account's
+            mnemonic
+        processes (int, optional): number of worker processes, or None for
+            the number of CPUs. With 1, the default, or if `count` fits in
+            one chunk, accounts are generated in this process. Where worker
+            processes are spawned rather than forked (Windows, macOS), the
+            calling script must guard its entry point with
+            `if __name__ == "__main__":`.
+        chunk_size (int, optional): number of accounts generated per task
+
+    Yields:
+        (str, str) or (str, str, str): private key and address of each
+            account, followed by its mnemonic if `with_mnemonics` is set
+    """
+    key_len = 2 * constants.key_len_bytes
+    for keys, addresses, mnemonics in _generate_chunks(
+        count, with_mnemonics, processes, chunk_size
+    ):
+        for i, address in enumerate(addresses):
+            private_key = base64.b64encode(
+                keys[i * key_len : (i + 1) * key_len]
+            ).decode()
+            if mnemonics is None:
+                yield private_key, address
+            else:
+                yield private_key, address, mnemonics[i]
+
+
+def write_accounts(
+    path,
+    count,
+    file_format="csv",
+    with_mnemonics=False,
+    processes=1,
+    chunk_size=4096,
+):
+    """
+    Generate many accounts and stream them into a new file.
+
+    The file holds secret keys, so it is created readable and writable by
+    its owner only, an existing file is never overwritten, and a partially
+    written file is removed if generation fails.
+
+    In the "csv" format each row holds an address and private key in base64
+    after an "address,private_key" header, plus a mnemonic column if
+    `with_mnemonics` is set. The "binary" format holds ACCOUNTS_FILE_MAGIC
+    followed by the 64 bytes of each private key, from which `read_accounts`
+    derives the addresses.
+
+    Args:
+        path (str): path of the file to create
+        count (int): number of accounts to generate
+        file_format (str, optional): "csv" or "binary"
+        with_mnemonics (bool, optional): add a mnemonic column to a csv file
+        processes (int, optional): number of worker processes; see
+            `generate_accounts`
+        chunk_size (int, optional): number of accounts generated per task
+
+    Returns:
+        int: number of accounts written
+    """
+    if file_format not in ("csv", "binary"):
+        raise ValueError("unknown account file format: " + file_format)
+    if with_mnemonics and file_format != "csv":
+        raise ValueError("mnemonics can only be written to a csv file")
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            chunks = _generate_chunks(
+                count, with_mnemonics, processes, chunk_size
+            )
+            if file_format == "binary":
+                f.write(ACCOUNTS_FILE_MAGIC)
+                for keys, addresses, _ in chunks:
+                    f.write(keys)
+                    written += len(addresses)
+                return written
+
+            header = "address,private_key"
+            f.write(
+                (header + (",mnemonic" if with_mnemonics else "")).encode()
+            )
+            f.write(b"\n")
+            key_len = 2 * constants.key_len_bytes
+            for keys, addresses, mnemonics in chunks:
+                rows = []
+                for i, address in enumerate(addresses):
+                    row = [
+                        address,
+                        base64.b64encode(
+                            keys[i * key_len : (i + 1) * key_len]
+                        ).decode(),
+                    ]
+                    if mnemonics is not None:
+                        row.append(mnemonics[i])
+                    rows.append(",".join(row) + "\n")
+                f.write("".join(rows).encode())
+                written += len(addresses)
+            return written
+    except BaseException:
+        os.remove(path)
+        raise
+
+
+def read_accounts(path):
+    """
+    Read the accounts of a binary file written by `write_accounts`.
+
+    Args:
+        path (str): path of the file
+
+    Yields:
+        (str, str): private key and address of each account
+    """
+    key_len = 2 * constants.key_len_bytes
+    with open(path, "rb") as f:
+        if f.read(len(ACCOUNTS_FILE_MAGIC)) != ACCOUNTS_FILE_MAGIC:
+            raise ValueError("not an account file: " + path)
+        while True:
+            keys = f.read(key_len * 4096)
+            if len(keys) % key_len:
+                raise ValueError("truncated account file: " + path)
+            if not keys:
+                return
+            for i in range(0, len(keys), key_len):
+                key = keys[i : i + key_len]
+                yield (
+                    base64.b64encode(key).decode(),
+                    encoding.encode_address(key[constants.key_len_bytes :]),
+                )
+
+
+def _generate_chunks(count, with_mnemonics, processes, chunk_size):
+    """
+    Yield the accounts of `_generate_chunk` for `count` accounts in order,
+    keeping a bounded number of chunks in flight across worker processes.
+    """
+    sizes = [min(chunk_size, count - n) for n in range(0, count, chunk_size)]
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(sizes) <= 1:
+        for size in sizes:
+            yield _generate_chunk(size, with_mnemonics)
+        return
+
+    # Imported here as it is slow to import and only needed for many accounts
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        for size in sizes:
+            pending.append(
+                executor.submit(_generate_chunk, size, with_mnemonics)
+            )
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _generate_chunk(count, with_mnemonics):
+    """
+    Generate accounts, returning their private keys as one bytes object,
+    their addresses and, if requested, their mnemonics.
+    """
+    # Imported here so that transaction, which imports this module, does not
+    # load the word list
+    from . import mnemonic
+
+    seeds = os.urandom(constants.key_len_bytes * count)
+    keys = []
+    public_keys = []
+    mnemonics = [] if with_mnemonics else None
+    for i in range(0, len(seeds), constants.key_len_bytes):
+        seed = seeds[i : i + constants.key_len_bytes]
+        pk, sk = crypto_sign_seed_keypair(seed)
+        keys.append(sk)
+        public_keys.append(pk)
+        if mnemonics is not None:
+            mnemonics.append(mnemonic._from_key(seed))
+    # New addresses would only evict recurring ones from the address cache
+    addresses = encoding._encode_addresses(public_keys)
+    return b"".join(keys), addresses, mnemonics
@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from os import access
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from algosdk import encoding
 from algosdk.box_reference import BoxReference
@@ -30,18 +30,58 @@ def translate_to_resource_references(
         locals (list[int, str], optional): lists of tuples specifying the local states to be accessed during evaluation of the application;
             zero (empty) address means sender
     """
-    access: List["ResourceReference"] = []
+    return extend_resource_references(
+        [],
+        app_id,
+        accounts=accounts,
+        foreign_assets=foreign_assets,
+        foreign_apps=foreign_apps,
+        boxes=boxes,
+        holdings=holdings,
+        locals=locals,
+    )
 
-    def ensure(target: "ResourceReference") -> int:
-        for idx, a in enumerate(access):
-            if (
-                a.address == target.address
-                and a.asset_id == target.asset_id
-                and a.app_id == target.app_id
-            ):
-                return idx + 1
+
+def extend_resource_references(
+    access: List["ResourceReference"],
+    app_id: int,
+    accounts: Optional[List[str]] = None,
+    foreign_assets: Optional[List[int]] = None,
+    foreign_apps: Optional[List[int]] = None,
+    boxes: Optional[List[Tuple[int, bytes]]] = None,
+    holdings: Optional[List[Tuple[int, str]]] = None,
+    locals: Optional[List[Tuple[int, str]]] = None,
+) -> List["ResourceReference"]:
+    """
+    Add accounts, apps, assets, boxes, holdings and locals to an existing
+    list of ResourceReference, reusing the entries it already has.
+
+    Args:
+        access (list[ResourceReference]): access list to extend in place
+        app_id (int): current application id
+        accounts, foreign_assets, foreign_apps, boxes, holdings, locals: as
+            in translate_to_resource_references
+
+    Returns:
+        list[ResourceReference]: the extended access list
+    """
+    # 1-based position of the first entry with each (address, asset, app)
+    positions: Dict[
+        Tuple[Optional[str], Optional[int], Optional[int]], int
+    ] = {}
+    for idx, a in enumerate(access):
+        positions.setdefault((a.address, a.asset_id, a.app_id), idx + 1)
+
+    def append(target: "ResourceReference") -> None:
         access.append(target)
-        return len(access)
+        key = (target.address, target.asset_id, target.app_id)
+        positions.setdefault(key, len(access))
+
+    def ensure(target: "ResourceReference") -> int:
+        key = (target.address, target.asset_id, target.app_id)
+        if key not in positions:
+            append(target)
+        return positions[key]
 
     for account in accounts or []:
         ensure(ResourceReference(address=account))
@@ -57,7 +97,7 @@ def translate_to_resource_references(
         if addr:
             addr_idx = ensure(ResourceReference(address=addr))
         asset_idx = ensure(ResourceReference(asset_id=asset))
-        access.append(
+        append(
             ResourceReference(
                 holding_reference=HoldingRef(
                     asset_index=asset_idx, addr_index=addr_idx
@@ -72,7 +112,7 @@ def translate_to_resource_references(
         addr_idx = 0
         if addr:
             addr_idx = ensure(ResourceReference(address=addr))
-        access.append(
+        append(
             ResourceReference(
                 locals_reference=LocalsRef(
                     app_index=app_idx, addr_index=addr_idx
@@ -84,7 +124,7 @@ def translate_to_resource_references(
         app_idx = 0
         if app and app != app_id:
             app_idx = ensure(ResourceReference(app_id=app))
-        access.append(
+        append(
             ResourceReference(
                 box_reference=BoxReference(app_index=app_idx, name=name)
             )
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
+import asyncio
 import base64
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
 import copy
 from enum import IntEnum
+import math
+import threading
+import time
 from typing import (
     Any,
     Dict,
@@ -13,20 +19,25 @@ from typing import (
     cast,
 )
 
-from algosdk import abi, error, transaction
+import msgpack
+
+from algosdk import abi, app_access, constants, error, transaction
 from algosdk.transaction import GenericSignedTransaction
 from algosdk.abi.address_type import AddressType
+from algosdk.abi.log_decoder import ABI_RETURN_HASH
+from algosdk.box_reference import BoxReference
 from algosdk.v2client import algod, models
 
 
-# The first four bytes of an ABI method call return must have this hash
-ABI_RETURN_HASH = b"\x15\x1f\x7c\x75"
 # Support for generic typing
 T = TypeVar("T")
 
 
 def populate_foreign_array(
-    value_to_add: T, foreign_array: List[T], zero_value: Optional[T] = None
+    value_to_add: T,
+    foreign_array: List[T],
+    zero_value: Optional[T] = None,
+    positions: Optional[Dict[T, int]] = None,
 ) -> int:
     """
     Add a value to an application call's foreign array. The addition will be as
@@ -44,19 +55,45 @@ def populate_foreign_array(
             additionally, if `value_to_add` equals `zero_value`, then
             `value_to_add` will not be added to the array and the 0 index will
             be returned.
+        positions: If provided, the position of each value in `foreign_array`,
+            as returned by `index_foreign_array`. It is looked up instead of
+            scanning the array and is updated along with it, so adding many
+            values takes linear rather than quadratic time.
     """
     if zero_value is not None and value_to_add == zero_value:
         return 0
 
     offset = 0 if zero_value is None else 1
 
-    if value_to_add in foreign_array:
-        return foreign_array.index(value_to_add) + offset
+    if positions is None:
+        try:
+            return foreign_array.index(value_to_add) + offset
+        except ValueError:
+            pass
+    else:
+        position = positions.get(value_to_add)
+        if position is not None:
+            return position + offset
+        positions[value_to_add] = len(foreign_array)
 
     foreign_array.append(value_to_add)
     return offset + len(foreign_array) - 1
 
 
+def index_foreign_array(foreign_array: List[T]) -> Dict[T, int]:
+    """
+    Map each value of a foreign array to the position of its first occurrence,
+    for use as the `positions` argument of `populate_foreign_array`.
+
+    Args:
+        foreign_array: the foreign array to index
+    """
+    positions: Dict[T, int] = {}
+    for i, value in enumerate(foreign_array):
+        positions.setdefault(value, i)
+    return positions
+
+
 class AtomicTransactionComposerStatus(IntEnum):
     # BUILDING indicates that the atomic group is still under construction
     BUILDING = 0
@@ -92,6 +129,85 @@ class TransactionSigner(ABC):
     ) -> List[GenericSignedTransaction]:
         pass
 
+    def sign_transaction_groups(
+        self, groups: List[Tuple[List[transaction.Transaction], List[int]]]
+    ) -> List[List[GenericSignedTransaction]]:
+        """
+        Sign transactions from several atomic groups at once.
+
+        The default signs each group in turn with sign_transactions. Signers
+        backed by a remote service can override this to send all groups in a
+        single request.
+
+        Args:
+            groups (list[(list[Transaction], list[int])]): atomic groups
+                paired with the indexes to sign in each
+
+        Returns:
+            list[list[GenericSignedTransaction]]: signed transactions for
+                each group, in the same order as `groups`
+        """
+        return [
+            self.sign_transactions(txn_group, indexes)
+            for txn_group, indexes in groups
+        ]
+
+
+class AsyncTransactionSigner(TransactionSigner):
+    """
+    Represents a Transaction Signer whose signing is a coroutine, such as one
+    backed by an asynchronous HTTP client.
+
+    Composers run all asynchronous signers of a signing pass concurrently in
+    one event loop on a worker thread, so they may be used from code that
+    already runs an event loop. Calling sign_transactions directly from a
+    running event loop runs the coroutine in a new loop on a separate
+    thread, blocking the caller until it finishes.
+    """
+
+    @abstractmethod
+    async def sign_transactions_async(
+        self, txn_group: List[transaction.Transaction], indexes: List[int]
+    ) -> List[GenericSignedTransaction]:
+        pass
+
+    async def sign_transaction_groups_async(
+        self, groups: List[Tuple[List[transaction.Transaction], List[int]]]
+    ) -> List[List[GenericSignedTransaction]]:
+        """
+        Sign transactions from several atomic groups at once. The default
+        signs the groups concurrently with sign_transactions_async.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.sign_transactions_async(txn_group, indexes)
+                    for txn_group, indexes in groups
+                )
+            )
+        )
+
+    def sign_transactions(
+        self, txn_group: List[transaction.Transaction], indexes: List[int]
+    ) -> List[GenericSignedTransaction]:
+        return _run_coroutine(self.sign_transactions_async(txn_group, indexes))
+
+    def sign_transaction_groups(
+        self, groups: List[Tuple[List[transaction.Transaction], List[int]]]
+    ) -> List[List[GenericSignedTransaction]]:
+        return _run_coroutine(self.sign_transaction_groups_async(groups))
+
+
+def _run_coroutine(coro: Any) -> Any:
+    # asyncio.run fails in a thread that already runs an event loop, so the
+    # coroutine then gets its own loop on a separate thread
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 
 class AccountTransactionSigner(TransactionSigner):
     """
@@ -220,6 +336,294 @@ class TransactionWithSigner:
         self.signer = signer
 
 
+def _check_transaction_arg(arg_type: str, arg: Any) -> TransactionWithSigner:
+    if not isinstance(arg, TransactionWithSigner):
+        raise error.AtomicTransactionComposerError(
+            "expected TransactionWithSigner as method argument, "
+            f"but received: {arg}"
+        )
+    if not abi.check_abi_transaction_type(arg_type, arg.txn):
+        raise error.AtomicTransactionComposerError(
+            f"expected Transaction type {arg_type} as method argument, "
+            f"but received: {arg.txn.type}"
+        )
+    return arg
+
+
+class _ForeignArrays:
+    """
+    The foreign arrays of one application call, indexed by value so that
+    reference arguments are resolved without scanning them.
+    """
+
+    def __init__(
+        self,
+        accounts: List[str],
+        foreign_apps: List[int],
+        foreign_assets: List[int],
+    ) -> None:
+        self.accounts = accounts
+        self.foreign_apps = foreign_apps
+        self.foreign_assets = foreign_assets
+        self._account_positions = index_foreign_array(accounts)
+        self._app_positions = index_foreign_array(foreign_apps)
+        self._asset_positions = index_foreign_array(foreign_assets)
+
+    def copy(self) -> "_ForeignArrays":
+        cloned = copy.copy(self)
+        cloned.accounts = self.accounts[:]
+        cloned.foreign_apps = self.foreign_apps[:]
+        cloned.foreign_assets = self.foreign_assets[:]
+        cloned._account_positions = dict(self._account_positions)
+        cloned._app_positions = dict(self._app_positions)
+        cloned._asset_positions = dict(self._asset_positions)
+        return cloned
+
+    def resolve(
+        self, ref_type: str, arg: Any, sender: str, app_id: int
+    ) -> int:
+        # Add a reference argument to its foreign array and return its index
+        if ref_type == abi.ABIReferenceType.ACCOUNT:
+            address_type = AddressType()
+            account_arg = address_type.decode(
+                address_type.encode(cast(Union[str, bytes], arg))
+            )
+            return populate_foreign_array(
+                account_arg, self.accounts, sender, self._account_positions
+            )
+        elif ref_type == abi.ABIReferenceType.ASSET:
+            return populate_foreign_array(
+                int(cast(int, arg)),
+                self.foreign_assets,
+                positions=self._asset_positions,
+            )
+        elif ref_type == abi.ABIReferenceType.APPLICATION:
+            return populate_foreign_array(
+                int(cast(int, arg)),
+                self.foreign_apps,
+                app_id,
+                self._app_positions,
+            )
+        # Shouldn't reach this line unless someone accidentally
+        # adds another foreign array arg
+        raise error.AtomicTransactionComposerError(
+            "cannot recognize {} as a foreign array arg".format(ref_type)
+        )
+
+
+def _encode_app_args(
+    selector: bytes, types: List[abi.ABIType], values: List[Any]
+) -> List[bytes]:
+    # Encode all arguments into one buffer, then split it per app arg
+    encoded_args = bytearray()
+    arg_ends = [
+        arg_type.encode_into(encoded_args, len(encoded_args), value)
+        for arg_type, value in zip(types, values)
+    ]
+    encoded_view = memoryview(encoded_args)
+    app_args = [selector]
+    arg_start = 0
+    for arg_end in arg_ends:
+        app_args.append(bytes(encoded_view[arg_start:arg_end]))
+        arg_start = arg_end
+    return app_args
+
+
+class MethodCallTemplate:
+    """
+    A method call on an existing application, compiled once for repeated use.
+
+    Everything that does not change between calls is validated and built up
+    front: the method selector, how each argument is encoded or resolved
+    into a foreign array, the box references of the given applications and
+    the rest of the application call transaction. Instantiating the template then only
+    encodes the new arguments and applies the new suggested params.
+
+    Application creation and update calls carry programs and cannot be
+    templated; use AtomicTransactionComposer.add_method_call for those.
+
+    Args:
+        app_id (int): application id of app that the method is being invoked on
+        method (Method): ABI method object with initialized arguments and return types
+        sender (str): address of the sender
+        signer (TransactionSigner): signer that will sign the transactions
+        on_complete (OnComplete, optional): intEnum representing what app should do on completion
+            and if blank, it will default to a NoOp call
+        accounts (list[string], optional): list of additional accounts involved in call
+        foreign_apps (list[int], optional): list of other applications (identified by index) involved in call
+        foreign_assets (list[int], optional): list of assets involved in call
+        rekey_to (str, optional): additionally rekey the sender to this address
+        boxes (list[(int, bytes)], optional): list of tuples specifying app id and key for boxes the app may access
+    """
+
+    def __init__(
+        self,
+        app_id: int,
+        method: abi.Method,
+        sender: str,
+        signer: TransactionSigner,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+        accounts: Optional[List[str]] = None,
+        foreign_apps: Optional[List[int]] = None,
+        foreign_assets: Optional[List[int]] = None,
+        rekey_to: Optional[str] = None,
+        boxes: Optional[List[Tuple[int, bytes]]] = None,
+    ) -> None:
+        if not isinstance(method, abi.Method):
+            raise error.AtomicTransactionComposerError(
+                "invalid Method object was passed into MethodCallTemplate"
+            )
+        if app_id == 0:
+            raise error.AtomicTransactionComposerError(
+                "MethodCallTemplate cannot create an application"
+            )
+        if on_complete == transaction.OnComplete.UpdateApplicationOC:
+            raise error.AtomicTransactionComposerError(
+                "MethodCallTemplate cannot update an application"
+            )
+        self.app_id = app_id
+        self.method = method
+        self.sender = sender
+        self.signer = signer
+
+        self._selector = method.get_selector()
+        self._foreign_arrays = _ForeignArrays(
+            accounts[:] if accounts else [],
+            [int(a) for a in foreign_apps or []],
+            [int(a) for a in foreign_assets or []],
+        )
+
+        # Transaction arguments and the remaining arguments, by position
+        self._txn_args: List[Tuple[int, str]] = []
+        self._value_args: List[Tuple[int, Any]] = []
+        types: List[abi.ABIType] = []
+        for i, arg in enumerate(method.args):
+            if abi.is_abi_transaction_type(arg.type):
+                self._txn_args.append((i, cast(str, arg.type)))
+            elif abi.is_abi_reference_type(arg.type):
+                self._value_args.append((i, arg.type))
+                types.append(abi.UintType(8))
+            else:
+                self._value_args.append((i, None))
+                types.append(cast(abi.ABIType, arg.type))
+
+        limit = AtomicTransactionComposer.MAX_APP_ARG_LIMIT
+        self._packed_from: Optional[int] = None
+        if len(types) > limit - 1:
+            self._packed_from = limit - 2
+            types = types[: limit - 2] + [abi.TupleType(types[limit - 2 :])]
+        self._types = types
+
+        # Reference arguments are only ever appended to the foreign apps, so
+        # boxes of this app and of the given foreign apps can be translated
+        # against the base array once. Boxes of other apps may be reachable
+        # through application arguments, and are translated per call.
+        static_apps = {0, app_id, *self._foreign_arrays.foreign_apps}
+        self._boxes: List[Any] = [
+            (
+                BoxReference.translate_box_reference(
+                    box, self._foreign_arrays.foreign_apps, app_id
+                )
+                if isinstance(box, BoxReference) or box[0] in static_apps
+                else box
+            )
+            for box in boxes or []
+        ]
+        self._prototype = transaction.ApplicationCallTxn(
+            sender=sender,
+            sp=transaction.SuggestedParams(0, 0, 0, "", flat_fee=True),
+            index=app_id,
+            on_complete=on_complete,
+            accounts=self._foreign_arrays.accounts,
+            foreign_apps=self._foreign_arrays.foreign_apps,
+            foreign_assets=self._foreign_arrays.foreign_assets,
+            rekey_to=rekey_to,
+        )
+
+    def instantiate(
+        self,
+        sp: transaction.SuggestedParams,
+        method_args: Optional[List[Union[Any, TransactionWithSigner]]] = None,
+        note: Optional[bytes] = None,
+        lease: Optional[bytes] = None,
+    ) -> List[TransactionWithSigner]:
+        """
+        Build the transactions of one call of the templated method.
+
+        Args:
+            sp (SuggestedParams): suggested params from algod
+            method_args (list[ABIValue | TransactionWithSigner], optional): list of arguments to be encoded
+                or transactions that immediate precede this method call
+            note (bytes, optional): arbitrary optional bytes
+            lease (byte[32], optional): specifies a lease, and no other transaction
+                with the same sender and lease can be confirmed in this
+                transaction's valid rounds
+
+        Returns:
+            list[TransactionWithSigner]: the transaction arguments followed
+                by the method call
+        """
+        if not method_args:
+            method_args = []
+        if len(self.method.args) != len(method_args):
+            raise error.AtomicTransactionComposerError(
+                "number of method arguments do not match the method signature"
+            )
+        txn_list = [
+            _check_transaction_arg(arg_type, method_args[i])
+            for i, arg_type in self._txn_args
+        ]
+
+        foreign_arrays = self._foreign_arrays.copy()
+        values = []
+        for i, ref_type in self._value_args:
+            if ref_type is None:
+                values.append(method_args[i])
+            else:
+                values.append(
+                    foreign_arrays.resolve(
+                        ref_type, method_args[i], self.sender, self.app_id
+                    )
+                )
+        if self._packed_from is not None:
+            values[self._packed_from :] = [values[self._packed_from :]]
+
+        # Fill in the per-call fields the way Transaction.__init__ and
+        # ApplicationCallTxn.__init__ would
+        txn = copy.copy(self._prototype)
+        # Lists are built for each instance, so that changing one (e.g.
+        # populating its references) does not change the template
+        boxes = [
+            (
+                box
+                if isinstance(box, BoxReference)
+                else BoxReference.translate_box_reference(
+                    box, foreign_arrays.foreign_apps, self.app_id
+                )
+            )
+            for box in self._boxes
+        ]
+        txn.boxes = cast(Any, boxes) or None
+        txn.resources = list(txn.resources) if txn.resources else None
+        txn.fee = sp.fee
+        txn.first_valid_round = sp.first
+        txn.last_valid_round = sp.last
+        txn.note = txn.as_note(note)
+        txn.genesis_id = sp.gen
+        txn.genesis_hash = sp.gh
+        txn.lease = txn.as_lease(lease)
+        txn.app_args = _encode_app_args(self._selector, self._types, values)
+        txn.accounts = foreign_arrays.accounts or None
+        txn.foreign_apps = foreign_arrays.foreign_apps or None
+        txn.foreign_assets = foreign_arrays.foreign_assets or None
+        if not sp.flat_fee:
+            mf = constants.min_txn_fee if sp.min_fee is None else sp.min_fee
+            txn.fee = max(txn.estimate_size() * txn.fee, mf)
+
+        txn_list.append(TransactionWithSigner(txn, self.signer))
+        return txn_list
+
+
 class ABIResult:
     def __init__(
         self,
@@ -377,12 +781,18 @@ class AtomicTransactionComposer:
         Creates a new composer with the same underlying transactions.
         The new composer's status will be BUILDING, so additional transactions
         may be added to it.
+
+        Each transaction is copied structurally: its fields and reference
+        lists belong to the clone, so fees, validity rounds and groups can be
+        changed independently, while the methods, signers and immutable
+        payloads such as program and argument bytes are shared.
         """
         cloned = AtomicTransactionComposer()
-        cloned.method_dict = copy.deepcopy(self.method_dict)
-        cloned.txn_list = copy.deepcopy(self.txn_list)
-        for t in cloned.txn_list:
-            t.txn.group = None
+        cloned.method_dict = dict(self.method_dict)
+        cloned.txn_list = [
+            TransactionWithSigner(_clone_transaction(t.txn), t.signer)
+            for t in self.txn_list
+        ]
         cloned.status = AtomicTransactionComposerStatus.BUILDING
         return cloned
 
@@ -525,70 +935,32 @@ class AtomicTransactionComposer:
             )
 
         # Initialize foreign object maps
-        accounts = accounts[:] if accounts else []
-        foreign_apps = foreign_apps[:] if foreign_apps else []
-        foreign_assets = foreign_assets[:] if foreign_assets else []
+        foreign_arrays = _ForeignArrays(
+            accounts[:] if accounts else [],
+            foreign_apps[:] if foreign_apps else [],
+            foreign_assets[:] if foreign_assets else [],
+        )
         boxes = boxes[:] if boxes else []
 
-        app_args = []
         raw_values: List[Any] = []
         raw_types = []
         txn_list = []
 
-        # First app arg must be the selector of the method
-        app_args.append(method.get_selector())
-
         # Iterate through the method arguments and either pack a transaction
         # or encode a ABI value.
         for i, arg in enumerate(method.args):
             if abi.is_abi_transaction_type(arg.type):
-                if not isinstance(method_args[i], TransactionWithSigner):
-                    raise error.AtomicTransactionComposerError(
-                        "expected TransactionWithSigner as method argument, "
-                        f"but received: {method_args[i]}"
-                    )
-
-                if not abi.check_abi_transaction_type(
-                    arg.type, method_args[i].txn
-                ):
-                    raise error.AtomicTransactionComposerError(
-                        f"expected Transaction type {arg.type} as method argument, "
-                        f"but received: {method_args[i].txn.type}"
-                    )
-                txn_list.append(method_args[i])
+                txn_list.append(
+                    _check_transaction_arg(cast(str, arg.type), method_args[i])
+                )
             else:
                 if abi.is_abi_reference_type(arg.type):
-                    current_type: Union[str, abi.ABIType] = abi.UintType(8)
-                    if arg.type == abi.ABIReferenceType.ACCOUNT:
-                        address_type = AddressType()
-                        account_arg = address_type.decode(
-                            address_type.encode(
-                                cast(Union[str, bytes], method_args[i])
-                            )
-                        )
-                        current_arg: Any = populate_foreign_array(
-                            account_arg, accounts, sender
-                        )
-                    elif arg.type == abi.ABIReferenceType.ASSET:
-                        asset_arg = int(cast(int, method_args[i]))
-                        current_arg = populate_foreign_array(
-                            asset_arg, foreign_assets
-                        )
-                    elif arg.type == abi.ABIReferenceType.APPLICATION:
-                        app_arg = int(cast(int, method_args[i]))
-                        current_arg = populate_foreign_array(
-                            app_arg, foreign_apps, app_id
-                        )
-                    else:
-                        # Shouldn't reach this line unless someone accidentally
-                        # adds another foreign array arg
-                        raise error.AtomicTransactionComposerError(
-                            "cannot recognize {} as a foreign array arg".format(
-                                arg.type
-                            )
-                        )
+                    current_type: abi.ABIType = abi.UintType(8)
+                    current_arg: Any = foreign_arrays.resolve(
+                        cast(str, arg.type), method_args[i], sender, app_id
+                    )
                 else:
-                    current_type = arg.type
+                    current_type = cast(abi.ABIType, arg.type)
                     current_arg = method_args[i]
 
                 raw_types.append(current_type)
@@ -604,8 +976,10 @@ class AtomicTransactionComposer:
             raw_types.append(abi.TupleType(additional_types))
             raw_values.append(additional_values)
 
-        for i, arg_type in enumerate(raw_types):
-            app_args.append(arg_type.encode(raw_values[i]))
+        # First app arg must be the selector of the method
+        app_args = _encode_app_args(
+            method.get_selector(), raw_types, raw_values
+        )
 
         # Create a method call transaction
         method_txn = transaction.ApplicationCallTxn(
@@ -618,9 +992,9 @@ class AtomicTransactionComposer:
             approval_program=approval_program,
             clear_program=clear_program,
             app_args=app_args,
-            accounts=accounts,
-            foreign_apps=foreign_apps,
-            foreign_assets=foreign_assets,
+            accounts=foreign_arrays.accounts,
+            foreign_apps=foreign_arrays.foreign_apps,
+            foreign_assets=foreign_arrays.foreign_assets,
             note=note,
             lease=lease,
             rekey_to=rekey_to,
@@ -634,6 +1008,50 @@ class AtomicTransactionComposer:
         self.method_dict[len(self.txn_list) - 1] = method
         return self
 
+    def add_template_call(
+        self,
+        template: MethodCallTemplate,
+        sp: transaction.SuggestedParams,
+        method_args: Optional[List[Union[Any, TransactionWithSigner]]] = None,
+        note: Optional[bytes] = None,
+        lease: Optional[bytes] = None,
+    ) -> "AtomicTransactionComposer":
+        """
+        Add a call of a precompiled method call template to this atomic group.
+
+        This is equivalent to add_method_call with the template's app id,
+        method, sender, signer and foreign arrays, but skips the work the
+        template has already done.
+
+        Args:
+            template (MethodCallTemplate): the method call to add
+            sp (SuggestedParams): suggested params from algod
+            method_args (list[ABIValue | TransactionWithSigner], optional): list of arguments to be encoded
+                or transactions that immediate precede this method call
+            note (bytes, optional): arbitrary optional bytes
+            lease (byte[32], optional): specifies a lease, and no other transaction
+                with the same sender and lease can be confirmed in this
+                transaction's valid rounds
+        """
+        if self.status != AtomicTransactionComposerStatus.BUILDING:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposer must be in BUILDING state for a transaction to be added"
+            )
+        if not isinstance(template, MethodCallTemplate):
+            raise error.AtomicTransactionComposerError(
+                "expected MethodCallTemplate object to the AtomicTransactionComposer"
+            )
+        if (
+            len(self.txn_list) + template.method.get_txn_calls()
+            > self.MAX_GROUP_SIZE
+        ):
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposer cannot exceed MAX_GROUP_SIZE transactions"
+            )
+        self.txn_list += template.instantiate(sp, method_args, note, lease)
+        self.method_dict[len(self.txn_list) - 1] = template.method
+        return self
+
     def build_group(self) -> List[TransactionWithSigner]:
         """
         Finalize the transaction group and returns the finalized transactions with signers.
@@ -662,49 +1080,29 @@ class AtomicTransactionComposer:
         self.status = AtomicTransactionComposerStatus.BUILT
         return self.txn_list
 
-    def gather_signatures(self) -> List[GenericSignedTransaction]:
+    def gather_signatures(
+        self, max_workers: int = 4, timeout: Optional[float] = None
+    ) -> List[GenericSignedTransaction]:
         """
         Obtain signatures for each transaction in this group. If signatures have already been obtained,
         this method will return cached versions of the signatures.
         The composer's status will be at least SIGNED after executing this method.
         An error will be thrown if signing any of the transactions fails.
 
+        Each signer is given all of its transactions in a single call, and
+        different signers sign concurrently.
+
+        Args:
+            max_workers (int, optional): maximum number of signers signing
+                concurrently
+            timeout (float, optional): seconds each signer may take, counted
+                from when it starts signing, before signing fails with an
+                AtomicTransactionComposerError
+
         Returns:
             List[GenericSignedTransaction]: list of signed transactions
         """
-        if self.status >= AtomicTransactionComposerStatus.SIGNED:
-            # Return cached versions of the signatures
-            return self.signed_txns
-
-        stxn_list: List[Optional[GenericSignedTransaction]] = [None] * len(
-            self.txn_list
-        )
-        signer_indexes: Dict[TransactionSigner, List[int]] = (
-            {}
-        )  # Map a signer to a list of indices to sign
-        txn_list = self.build_group()
-        for i, txn_with_signer in enumerate(txn_list):
-            if txn_with_signer.signer not in signer_indexes:
-                signer_indexes[txn_with_signer.signer] = []
-            signer_indexes[txn_with_signer.signer].append(i)
-
-        # Sign then merge the signed transactions in order
-        txns = [t.txn for t in self.txn_list]
-        for signer, indexes in signer_indexes.items():
-            stxns = signer.sign_transactions(txns, indexes)
-            for i, stxn in enumerate(stxns):
-                index = indexes[i]
-                stxn_list[index] = stxn
-
-        if None in stxn_list:
-            raise error.AtomicTransactionComposerError(
-                "missing signatures, got {}".format(stxn_list)
-            )
-        full_stxn_list = cast(List[GenericSignedTransaction], stxn_list)
-
-        self.status = AtomicTransactionComposerStatus.SIGNED
-        self.signed_txns = full_stxn_list
-        return self.signed_txns
+        return gather_signatures_batch([self], max_workers, timeout)[0]
 
     def submit(self, client: algod.AlgodClient) -> List[str]:
         """
@@ -756,20 +1154,10 @@ class AtomicTransactionComposer:
                 will contain None for that method's return value.
         """
 
-        if self.status <= AtomicTransactionComposerStatus.SUBMITTED:
-            self.gather_signatures()
-        else:
-            raise error.AtomicTransactionComposerError(
-                "AtomicTransactionComposerStatus must be submitted or "
-                "lower to simulate a group"
-            )
-
         current_simulation_request = (
             request if request else models.SimulateRequest(txn_groups=list())
         )
-        current_simulation_request.txn_groups = [
-            models.SimulateRequestTransactionGroup(txns=self.signed_txns)
-        ]
+        current_simulation_request.txn_groups = [self._simulation_group()]
 
         simulation_result = cast(
             Dict[str, Any],
@@ -777,8 +1165,83 @@ class AtomicTransactionComposer:
         )
 
         # Only take the first group in the simulate response
-        txn_group: Dict[str, Any] = simulation_result["txn-groups"][0]
+        return self._parse_simulation_group(
+            simulation_result, simulation_result["txn-groups"][0]
+        )
+
+    def populate_resources(
+        self,
+        client: algod.AlgodClient,
+        request: Optional[models.SimulateRequest] = None,
+    ) -> "AtomicTransactionComposer":
+        """
+        Simulate this group and add the references it is missing to its
+        application calls, as described in ResourcePopulator. Use a
+        ResourcePopulator directly to reuse packings across groups.
+
+        The composer's status must be BUILDING.
+
+        Args:
+            client (AlgodClient): Algod V2 client
+            request (models.SimulateRequest, optional): SimulateRequest with
+                options for the simulation
+        """
+        return ResourcePopulator(client, request, cache_size=0).populate(self)
+
+    def optimize_fees(
+        self,
+        client: algod.AlgodClient,
+        payer_index: int = 0,
+        request: Optional[models.SimulateRequest] = None,
+        budget_app_id: Optional[int] = None,
+        min_fee: int = constants.MIN_TXN_FEE,
+    ) -> "AtomicTransactionComposer":
+        """
+        Simulate this group, then pool the smallest fees it needs onto one
+        transaction and add opcode budget padding calls if it needs them, as
+        described in FeeBudgetOptimizer. Use a FeeBudgetOptimizer directly to
+        reuse results across groups.
+
+        The composer's status must be BUILDING.
+
+        Args:
+            client (AlgodClient): Algod V2 client
+            payer_index (int, optional): index of the transaction that pays
+                the fees of the group
+            request (models.SimulateRequest, optional): SimulateRequest with
+                options for the simulation
+            budget_app_id (int, optional): application called to add budget
+            min_fee (int, optional): minimum fee of a transaction
+        """
+        optimizer = FeeBudgetOptimizer(
+            client,
+            request,
+            min_fee=min_fee,
+            budget_app_id=budget_app_id,
+            cache_size=0,
+        )
+        return optimizer.optimize(self, payer_index)
+
+    def _simulation_group(self) -> models.SimulateRequestTransactionGroup:
+        """
+        Sign this group, if needed, and wrap it for a simulate request.
+        """
+        if self.status <= AtomicTransactionComposerStatus.SUBMITTED:
+            self.gather_signatures()
+        else:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposerStatus must be submitted or "
+                "lower to simulate a group"
+            )
+        return models.SimulateRequestTransactionGroup(txns=self.signed_txns)
 
+    def _parse_simulation_group(
+        self, simulation_result: Dict[str, Any], txn_group: Dict[str, Any]
+    ) -> SimulateAtomicTransactionResponse:
+        """
+        Build the simulate response for this composer from its group's entry
+        in a simulate result.
+        """
         # Parse out abi results
         txn_results = [t["txn-result"] for t in txn_group["txn-results"]]
         method_results: List[ABIResult] = []
@@ -837,7 +1300,10 @@ class AtomicTransactionComposer:
         )
 
     def execute(
-        self, client: algod.AlgodClient, wait_rounds: int
+        self,
+        client: algod.AlgodClient,
+        wait_rounds: int,
+        results_from_block: bool = False,
     ) -> AtomicTransactionResponse:
         """
         Send the transaction group to the network and wait until it's committed
@@ -852,6 +1318,11 @@ class AtomicTransactionComposer:
         Args:
             client (AlgodClient): Algod V2 client
             wait_rounds (int): maximum number of rounds to wait for transaction confirmation
+            results_from_block (bool, optional): read method call results
+                from the confirmed block (two requests in total) instead of
+                one pending transaction lookup per method call. The tx_info
+                of each result then only holds the confirmed round, logs and
+                created application or asset index.
 
         Returns:
             AtomicTransactionResponse: Object with confirmed round for this transaction,
@@ -873,9 +1344,17 @@ class AtomicTransactionComposer:
         )
         self.status = AtomicTransactionComposerStatus.COMMITTED
 
-        confirmed_round = resp["confirmed-round"]
-        method_results: List[ABIResult] = []
+        tx_infos = self._fetch_method_tx_infos(
+            client, resp, results_from_block
+        )
+        return self._build_response(resp["confirmed-round"], tx_infos)
 
+    def _build_response(
+        self,
+        confirmed_round: int,
+        tx_infos: Dict[int, "Future[Dict[str, Any]]"],
+    ) -> AtomicTransactionResponse:
+        method_results: List[ABIResult] = []
         for method_index, method in self.method_dict.items():
             tx_id = self.tx_ids[method_index]
             result: ABIResult = ABIResult(
@@ -887,9 +1366,7 @@ class AtomicTransactionComposer:
                 method=method,
             )
             try:
-                tx_info = cast(
-                    Dict[str, Any], client.pending_transaction_info(tx_id)
-                )
+                tx_info = tx_infos[method_index].result()
                 result = self.parse_result(
                     method, self.tx_ids[method_index], tx_info
                 )
@@ -903,6 +1380,51 @@ class AtomicTransactionComposer:
             results=method_results,
         )
 
+    def _fetch_method_tx_infos(
+        self,
+        client: algod.AlgodClient,
+        first_tx_info: Dict[str, Any],
+        results_from_block: bool,
+    ) -> Dict[int, "Future[Dict[str, Any]]"]:
+        """
+        Look up the confirmed transaction info of every method call in this
+        group without paying one round trip per method call.
+
+        The info of the first transaction is already known from waiting on
+        its confirmation. The others are either read from the confirmed
+        block or requested concurrently.
+        """
+        infos: Dict[int, "Future[Dict[str, Any]]"] = {}
+        block_infos: Dict[str, Dict[str, Any]] = {}
+        if results_from_block and self.method_dict:
+            try:
+                block_infos = _tx_infos_from_block(
+                    client, first_tx_info["confirmed-round"], self.tx_ids
+                )
+            except Exception:
+                # Fall back to per-transaction lookups below
+                block_infos = {}
+
+        missing: List[int] = []
+        for method_index in self.method_dict:
+            tx_id = self.tx_ids[method_index]
+            if tx_id in block_infos:
+                infos[method_index] = _completed(block_infos[tx_id])
+            elif method_index == 0:
+                infos[method_index] = _completed(first_tx_info)
+            else:
+                missing.append(method_index)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                for method_index in missing:
+                    infos[method_index] = executor.submit(
+                        _pending_transaction_info,
+                        client,
+                        self.tx_ids[method_index],
+                    )
+        return infos
+
     def parse_result(
         self, method: abi.Method, txid: str, txn: Dict[str, Any]
     ) -> ABIResult:
@@ -949,3 +1471,1208 @@ class AtomicTransactionComposer:
             tx_info=txn,
             method=method,
         )
+
+
+def _clone_transaction(
+    txn: transaction.Transaction,
+) -> transaction.Transaction:
+    # Copy the transaction and any lists it holds, leaving it ungrouped
+    cloned = copy.copy(txn)
+    for name, value in vars(cloned).items():
+        if isinstance(value, list):
+            setattr(cloned, name, value[:])
+    cloned.group = None
+    return cloned
+
+
+def _completed(value: T) -> "Future[T]":
+    future: "Future[T]" = Future()
+    future.set_result(value)
+    return future
+
+
+def _pending_transaction_info(
+    client: algod.AlgodClient, tx_id: str
+) -> Dict[str, Any]:
+    return cast(Dict[str, Any], client.pending_transaction_info(tx_id))
+
+
+def _tx_infos_from_block(
+    client: algod.AlgodClient, confirmed_round: int, tx_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build minimal transaction info dicts for the given transaction IDs from
+    the apply data stored in the block of the round they were confirmed in.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        txids_future = executor.submit(client.get_block_txids, confirmed_round)
+        block_future = executor.submit(
+            client.block_info, confirmed_round, response_format="msgpack"
+        )
+    block_txids = cast(Dict[str, Any], txids_future.result())["blockTxids"]
+    block = msgpack.unpackb(
+        cast(bytes, block_future.result()), raw=True, strict_map_key=False
+    )
+    payset = block[b"block"].get(b"txns") or []
+
+    wanted = set(tx_ids)
+    infos: Dict[str, Dict[str, Any]] = {}
+    for tx_id, stxn in zip(block_txids, payset):
+        if tx_id not in wanted:
+            continue
+        info: Dict[str, Any] = {"confirmed-round": confirmed_round}
+        logs = (stxn.get(b"dt") or {}).get(b"lg")
+        if logs:
+            info["logs"] = [base64.b64encode(log).decode() for log in logs]
+        if stxn.get(b"apid"):
+            info["application-index"] = stxn[b"apid"]
+        if stxn.get(b"caid"):
+            info["asset-index"] = stxn[b"caid"]
+        infos[tx_id] = info
+    return infos
+
+
+def simulate_batch(
+    client: algod.AlgodClient,
+    composers: List[AtomicTransactionComposer],
+    request: Optional[models.SimulateRequest] = None,
+    max_groups_per_request: int = 1,
+    max_workers: int = 4,
+) -> List[SimulateAtomicTransactionResponse]:
+    """
+    Simulate many transaction groups, packing them into as few `simulate`
+    calls as allowed and running those calls concurrently.
+
+    Each composer is signed as in `AtomicTransactionComposer.simulate`, so
+    the same status rules apply.
+
+    Args:
+        client (AlgodClient): Algod V2 client
+        composers (list[AtomicTransactionComposer]): groups to simulate
+        request (models.SimulateRequest, optional): SimulateRequest with
+            options shared by every simulation. Its transaction groups are
+            ignored.
+        max_groups_per_request (int, optional): number of groups sent in a
+            single simulate call. algod currently accepts one group per
+            request; raise this for nodes that accept more.
+        max_workers (int, optional): maximum number of concurrent simulate
+            calls
+
+    Returns:
+        list[SimulateAtomicTransactionResponse]: one response per composer,
+            in the same order as `composers`
+    """
+    if max_groups_per_request < 1:
+        raise error.AtomicTransactionComposerError(
+            "max_groups_per_request must be a positive integer"
+        )
+    base_request = (
+        request if request else models.SimulateRequest(txn_groups=list())
+    )
+    groups = [composer._simulation_group() for composer in composers]
+
+    def simulate_chunk(start: int) -> List[SimulateAtomicTransactionResponse]:
+        chunk = composers[start : start + max_groups_per_request]
+        chunk_request = copy.copy(base_request)
+        chunk_request.txn_groups = groups[
+            start : start + max_groups_per_request
+        ]
+        simulation_result = cast(
+            Dict[str, Any], client.simulate_transactions(chunk_request)
+        )
+        txn_groups = simulation_result.get("txn-groups", [])
+        if len(txn_groups) != len(chunk):
+            raise error.AtomicTransactionComposerError(
+                "simulate returned {} groups for a request with {}".format(
+                    len(txn_groups), len(chunk)
+                )
+            )
+        return [
+            composer._parse_simulation_group(simulation_result, txn_group)
+            for composer, txn_group in zip(chunk, txn_groups)
+        ]
+
+    starts = range(0, len(composers), max_groups_per_request)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunks = executor.map(simulate_chunk, starts)
+        return [result for chunk in chunks for result in chunk]
+
+
+class BatchExecutionReport:
+    """
+    Outcome of the groups run by `execute_batch`, in the order they were
+    given.
+
+    Args:
+        responses (list[AtomicTransactionResponse]): response of each
+            group, or None if it was not confirmed
+        errors (list[Exception]): error that kept each group from being
+            confirmed, or None if it was
+        latencies (list[float]): seconds from submitting each group to
+            seeing it confirmed, or None if it was not
+        elapsed (float): seconds taken to run every group
+    """
+
+    def __init__(
+        self,
+        responses: List[Optional[AtomicTransactionResponse]],
+        errors: List[Optional[Exception]],
+        latencies: List[Optional[float]],
+        elapsed: float,
+    ) -> None:
+        self.responses = responses
+        self.errors = errors
+        self.latencies = latencies
+        self.elapsed = elapsed
+
+    @property
+    def confirmed(self) -> int:
+        """int: number of groups confirmed"""
+        return sum(latency is not None for latency in self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """float: groups confirmed per second"""
+        return self.confirmed / self.elapsed if self.elapsed else 0.0
+
+    def latency_percentiles(
+        self, percentiles: Tuple[float, ...] = (50, 90, 99)
+    ) -> Dict[float, float]:
+        """
+        Get nearest-rank percentiles of the confirmation latencies.
+
+        Args:
+            percentiles (tuple[float], optional): percentiles to get
+
+        Returns:
+            dict[float, float]: latency in seconds at each percentile, or an
+                empty dict if no group was confirmed
+        """
+        ordered = sorted(t for t in self.latencies if t is not None)
+        if not ordered:
+            return {}
+        return {
+            p: ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+            for p in percentiles
+        }
+
+
+class BatchExecution:
+    """
+    Groups being run by `execute_batch`.
+
+    Each future in `futures` resolves to its group's
+    AtomicTransactionResponse as soon as the round confirming it is seen, or
+    to the error that kept it from being confirmed.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.futures: List["Future[AtomicTransactionResponse]"] = [
+            Future() for _ in range(count)
+        ]
+        self.latencies: List[Optional[float]] = [None] * count
+        self.elapsed = 0.0
+        self._done = threading.Event()
+
+    def done(self) -> bool:
+        """
+        Check whether every group has been confirmed or has failed.
+        """
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> BatchExecutionReport:
+        """
+        Wait until every group has been confirmed or has failed.
+
+        Args:
+            timeout (float, optional): seconds to wait before failing with an
+                AtomicTransactionComposerError
+
+        Returns:
+            BatchExecutionReport: outcome of every group
+        """
+        if not self._done.wait(timeout):
+            raise error.AtomicTransactionComposerError(
+                "groups are still being executed"
+            )
+        return BatchExecutionReport(
+            [f.result() if not f.exception() else None for f in self.futures],
+            [cast(Optional[Exception], f.exception()) for f in self.futures],
+            self.latencies,
+            self.elapsed,
+        )
+
+
+def execute_batch(
+    client: algod.AlgodClient,
+    composers: List[AtomicTransactionComposer],
+    wait_rounds: int,
+    max_in_flight: int = 64,
+    max_workers: int = 4,
+) -> BatchExecution:
+    """
+    Send many transaction groups to the network and track their
+    confirmation in the background, returning without waiting for them.
+
+    Groups are signed and submitted in order, keeping at most
+    `max_in_flight` of them waiting for confirmation. Rather than waiting on
+    each group in turn, a single loop follows the rounds and reads every
+    group confirmed in a round, with its method call results, from that
+    round's block. Groups whose transactions cannot be read from the block
+    are looked up as pending transactions instead. Once the loop has caught
+    up with the node, groups still unconfirmed are looked up too, and those
+    the node dropped from its pool fail with a TransactionRejectedError.
+
+    Each composer follows the same status rules as in
+    `AtomicTransactionComposer.execute`.
+
+    Args:
+        client (AlgodClient): Algod V2 client
+        composers (list[AtomicTransactionComposer]): groups to execute
+        wait_rounds (int): maximum number of rounds to wait for each group's
+            confirmation, counted from the node's last round when the group
+            is submitted
+        max_in_flight (int, optional): maximum number of groups submitted
+            but not yet confirmed
+        max_workers (int, optional): maximum number of groups signed or
+            submitted concurrently
+
+    Returns:
+        BatchExecution: futures resolving to each group's response, in the
+            same order as `composers`
+    """
+    if max_in_flight < 1:
+        raise error.AtomicTransactionComposerError(
+            "max_in_flight must be a positive integer"
+        )
+    execution = BatchExecution(len(composers))
+    threading.Thread(
+        target=_execute_groups,
+        args=(
+            client,
+            composers,
+            execution,
+            wait_rounds,
+            max_in_flight,
+            max_workers,
+        ),
+        daemon=True,
+    ).start()
+    return execution
+
+
+def _execute_groups(
+    client: algod.AlgodClient,
+    composers: List[AtomicTransactionComposer],
+    execution: BatchExecution,
+    wait_rounds: int,
+    max_in_flight: int,
+    max_workers: int,
+) -> None:
+    start = time.perf_counter()
+    futures = execution.futures
+    # Last round to wait for and submission time of each unconfirmed group
+    in_flight: Dict[int, Tuple[int, float]] = {}
+    next_index = 0
+    try:
+        # The node's last round, which the loop may lag behind
+        node_round = cast(int, cast(dict, client.status())["last-round"])
+        current_round = node_round
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while next_index < len(composers) or in_flight:
+                end = min(
+                    len(composers), next_index + max_in_flight - len(in_flight)
+                )
+                chunk = {i: composers[i] for i in range(next_index, end)}
+                next_index = end
+                submitted_at = time.perf_counter()
+                errors = _submit_groups(client, executor, chunk, max_workers)
+                for i in chunk:
+                    if i in errors:
+                        futures[i].set_exception(errors[i])
+                    else:
+                        in_flight[i] = (node_round + wait_rounds, submitted_at)
+                if not in_flight:
+                    continue
+
+                status = client.status_after_block(current_round)
+                node_round = max(node_round, cast(dict, status)["last-round"])
+                current_round += 1
+                confirmed, failed = _confirmed_groups(
+                    client,
+                    executor,
+                    {i: composers[i] for i in in_flight},
+                    current_round,
+                    current_round >= node_round,
+                )
+                now = time.perf_counter()
+                for i, (confirmed_round, tx_infos) in confirmed.items():
+                    _, submitted_at = in_flight.pop(i)
+                    execution.latencies[i] = now - submitted_at
+                    composer = composers[i]
+                    composer.status = AtomicTransactionComposerStatus.COMMITTED
+                    futures[i].set_result(
+                        composer._build_response(confirmed_round, tx_infos)
+                    )
+                for i, e in failed.items():
+                    del in_flight[i]
+                    futures[i].set_exception(e)
+                for i, (last_round, _) in list(in_flight.items()):
+                    if current_round >= last_round:
+                        del in_flight[i]
+                        futures[i].set_exception(
+                            error.ConfirmationTimeoutError(
+                                "Wait for transaction id {} timed out".format(
+                                    composers[i].tx_ids[0]
+                                )
+                            )
+                        )
+    except Exception as e:
+        for future in futures:
+            if not future.done():
+                future.set_exception(e)
+    execution.elapsed = time.perf_counter() - start
+    execution._done.set()
+
+
+def _submit_groups(
+    client: algod.AlgodClient,
+    executor: ThreadPoolExecutor,
+    composers: Dict[int, AtomicTransactionComposer],
+    max_workers: int,
+) -> Dict[int, Exception]:
+    # Submit groups concurrently, returning the errors of those that failed
+    try:
+        gather_signatures_batch(list(composers.values()), max_workers)
+    except Exception:
+        # Each failing group reports its own error when it is submitted
+        pass
+    submissions = {
+        i: executor.submit(composer.submit, client)
+        for i, composer in composers.items()
+    }
+    errors: Dict[int, Exception] = {}
+    for i, submission in submissions.items():
+        e = submission.exception()
+        if e is not None:
+            errors[i] = cast(Exception, e)
+    return errors
+
+
+def _confirmed_groups(
+    client: algod.AlgodClient,
+    executor: ThreadPoolExecutor,
+    composers: Dict[int, AtomicTransactionComposer],
+    round_num: int,
+    check_pool: bool,
+) -> Tuple[
+    Dict[int, Tuple[int, Dict[int, "Future[Dict[str, Any]]"]]],
+    Dict[int, Exception],
+]:
+    """
+    Find the groups confirmed in a round, with the confirmed round and the
+    transaction info of the method calls of each, and the groups that
+    failed. With check_pool, groups not confirmed in the round are looked
+    up to find those the node dropped from its pool.
+    """
+    confirmed: Dict[int, Tuple[int, Dict[int, "Future[Dict[str, Any]]"]]] = {}
+    try:
+        tx_ids = [t for c in composers.values() for t in c.tx_ids]
+        block_infos = _tx_infos_from_block(client, round_num, tx_ids)
+    except Exception:
+        # Fall back to looking up each group's first transaction
+        tx_infos, failed = _pending_infos(client, executor, composers)
+        for i, tx_info in tx_infos.items():
+            if not tx_info.get("confirmed-round"):
+                continue
+            try:
+                confirmed[i] = (
+                    tx_info["confirmed-round"],
+                    composers[i]._fetch_method_tx_infos(
+                        client, tx_info, False
+                    ),
+                )
+            except Exception as e:
+                failed[i] = e
+        return confirmed, failed
+
+    for i, composer in composers.items():
+        if composer.tx_ids[0] not in block_infos:
+            continue
+        confirmed[i] = (
+            round_num,
+            {
+                method_index: _completed(
+                    block_infos[composer.tx_ids[method_index]]
+                )
+                for method_index in composer.method_dict
+            },
+        )
+    failed = {}
+    if check_pool:
+        _, failed = _pending_infos(
+            client,
+            executor,
+            {i: c for i, c in composers.items() if i not in confirmed},
+        )
+    return confirmed, failed
+
+
+def _pending_infos(
+    client: algod.AlgodClient,
+    executor: ThreadPoolExecutor,
+    composers: Dict[int, AtomicTransactionComposer],
+) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, Exception]]:
+    """
+    Look up the first transaction of each group, returning the transaction
+    info of the groups found and the errors of those that were rejected or
+    could not be looked up. Groups the node does not know yet are left out.
+    """
+    lookups = {
+        i: executor.submit(
+            _pending_transaction_info, client, composer.tx_ids[0]
+        )
+        for i, composer in composers.items()
+    }
+    tx_infos: Dict[int, Dict[str, Any]] = {}
+    failed: Dict[int, Exception] = {}
+    for i, lookup in lookups.items():
+        try:
+            tx_info = lookup.result()
+        except error.AlgodHTTPError:
+            continue
+        except Exception as e:
+            failed[i] = e
+            continue
+        if tx_info.get("pool-error"):
+            failed[i] = error.TransactionRejectedError(
+                "Transaction rejected: " + tx_info["pool-error"]
+            )
+        else:
+            tx_infos[i] = tx_info
+    return tx_infos, failed
+
+
+class _PlanCache:
+    """
+    Least recently used cache of plans derived from simulations, keyed by
+    the shape of the simulated group.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._plans: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+
+    def get(self, key: Tuple[Any, ...]) -> Any:
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+        return plan
+
+    def put(self, key: Tuple[Any, ...], plan: Any) -> None:
+        if self.size > 0:
+            self._plans[key] = plan
+            if len(self._plans) > self.size:
+                self._plans.popitem(last=False)
+
+
+def _simulate_unsigned(
+    client: algod.AlgodClient,
+    request: models.SimulateRequest,
+    atc: AtomicTransactionComposer,
+) -> Dict[str, Any]:
+    # Simulate a copy of the group with empty signatures and return the
+    # group's result
+    simulated = atc.clone()
+    empty_signer = EmptySigner()
+    for txn_with_signer in simulated.txn_list:
+        txn_with_signer.signer = empty_signer
+    request = copy.copy(request)
+    request.allow_empty_signatures = True
+    request.txn_groups = [simulated._simulation_group()]
+    simulation_result = cast(
+        Dict[str, Any], client.simulate_transactions(request)
+    )
+    txn_group = simulation_result["txn-groups"][0]
+    if txn_group.get("failure-message"):
+        raise error.AtomicTransactionComposerError(
+            "simulation failed: {}".format(txn_group["failure-message"])
+        )
+    return txn_group
+
+
+class ResourcePopulator:
+    """
+    Adds the references a transaction group is missing, as found by
+    simulating it.
+
+    The group is simulated with unnamed resources and empty signatures
+    allowed, and every resource the node reports as accessed without a
+    reference is added to the group's application calls. Resources reported
+    for one transaction go to that transaction. Resources the group shares
+    are spread over the application calls with room for them, within the
+    per-transaction limits, using their foreign arrays and boxes, or their
+    access list for calls that have one. Fees are not recomputed.
+
+    Packings can be cached by the shape of the group: the type and sender
+    of each transaction and, for application calls, the application, method
+    selector and existing references. A group with a cached shape is packed
+    without simulating. The cache is off by default, since the resources a
+    method needs, box names in particular, usually depend on its arguments;
+    enable it only for methods whose resources follow from the shape alone.
+
+    Args:
+        client (AlgodClient): Algod V2 client
+        request (models.SimulateRequest, optional): SimulateRequest with
+            options shared by every simulation. Its transaction groups are
+            ignored.
+        cache_size (int, optional): number of packings to keep; 0, the
+            default, disables the cache
+    """
+
+    def __init__(
+        self,
+        client: algod.AlgodClient,
+        request: Optional[models.SimulateRequest] = None,
+        cache_size: int = 0,
+    ) -> None:
+        self.client = client
+        self.request = (
+            request if request else models.SimulateRequest(txn_groups=list())
+        )
+        self._cache = _PlanCache(cache_size)
+
+    def populate(
+        self, atc: AtomicTransactionComposer
+    ) -> AtomicTransactionComposer:
+        """
+        Add the missing references to the transactions of a composer.
+
+        The composer's status must be BUILDING, and its transactions are
+        updated in place.
+
+        Args:
+            atc (AtomicTransactionComposer): the group to populate
+
+        Returns:
+            AtomicTransactionComposer: the same composer
+        """
+        if atc.status != AtomicTransactionComposerStatus.BUILDING:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposer must be in BUILDING state to "
+                "populate its resources"
+            )
+        txns = [t.txn for t in atc.txn_list]
+        if not txns:
+            return atc
+        key = _group_shape(txns)
+        packing = self._cache.get(key)
+        if packing is None:
+            packing = self._simulate_packing(atc)
+            self._cache.put(key, packing)
+        for txn, references in zip(txns, packing):
+            for reference in references:
+                _add_reference(
+                    cast(transaction.ApplicationCallTxn, txn), reference
+                )
+        return atc
+
+    def _simulate_packing(
+        self, atc: AtomicTransactionComposer
+    ) -> List[List[Tuple[Any, ...]]]:
+        request = copy.copy(self.request)
+        request.allow_unnamed_resources = True
+        txn_group = _simulate_unsigned(self.client, request, atc)
+        return _pack_resources(
+            [t.txn for t in atc.txn_list],
+            [
+                _unnamed_resources(result.get("unnamed-resources-accessed"))
+                for result in txn_group["txn-results"]
+            ],
+            _unnamed_resources(txn_group.get("unnamed-resources-accessed")),
+        )
+
+
+def _unnamed_resources(
+    accessed: Optional[Dict[str, Any]]
+) -> List[Tuple[Any, ...]]:
+    # Flatten a simulate report of unnamed resources into references,
+    # putting the ones that need two entries first
+    if not accessed:
+        return []
+    references: List[Tuple[Any, ...]] = []
+    for holding in accessed.get("asset-holdings", []):
+        references.append(("holding", holding["asset"], holding["account"]))
+    for local in accessed.get("app-locals", []):
+        references.append(("local", local["app"], local["account"]))
+    references += [("account", a) for a in accessed.get("accounts", [])]
+    for box in accessed.get("boxes", []):
+        name = base64.b64decode(box.get("name", ""))
+        references.append(("box", box["app"], name))
+    references += [("asset", a) for a in accessed.get("assets", [])]
+    references += [("app", a) for a in accessed.get("apps", [])]
+    references += [("box", 0, b"")] * accessed.get("extra-box-refs", 0)
+    return references
+
+
+def _pack_resources(
+    txns: List[transaction.Transaction],
+    txn_references: List[List[Tuple[Any, ...]]],
+    group_references: List[Tuple[Any, ...]],
+) -> List[List[Tuple[Any, ...]]]:
+    # Assign references to transactions, trying them on scratch copies
+    packing: List[List[Tuple[Any, ...]]] = [[] for _ in txns]
+    scratch = [_clone_transaction(txn) for txn in txns]
+    app_calls = [
+        i
+        for i, txn in enumerate(txns)
+        if isinstance(txn, transaction.ApplicationCallTxn)
+    ]
+
+    def trial(i: int, reference: Tuple[Any, ...]) -> Optional[Any]:
+        if i not in app_calls:
+            return None
+        txn = _clone_transaction(scratch[i])
+        _add_reference(cast(transaction.ApplicationCallTxn, txn), reference)
+        return txn if _reference_count(txn) is not None else None
+
+    def unplaceable(reference: Tuple[Any, ...]) -> Exception:
+        return error.AtomicTransactionComposerError(
+            "cannot fit unnamed resource {} into the group".format(reference)
+        )
+
+    for i, references in enumerate(txn_references):
+        for reference in references:
+            txn = trial(i, reference)
+            if txn is None:
+                raise unplaceable(reference)
+            scratch[i] = txn
+            packing[i].append(reference)
+
+    for reference in group_references:
+        # Use the application call that needs the fewest new entries
+        best = None
+        for i in app_calls:
+            txn = trial(i, reference)
+            if txn is None:
+                continue
+            added = cast(int, _reference_count(txn)) - cast(
+                int, _reference_count(scratch[i])
+            )
+            if best is None or added < best[0]:
+                best = (added, i, txn)
+        if best is None:
+            raise unplaceable(reference)
+        _, i, txn = best
+        scratch[i] = txn
+        packing[i].append(reference)
+    return packing
+
+
+def _add_reference(
+    txn: transaction.ApplicationCallTxn, reference: Tuple[Any, ...]
+) -> None:
+    kind, value = reference[0], reference[1]
+    if txn.resources is not None:
+        # The sender is written as the empty address in access lists
+        if kind in ("holding", "local") and reference[2] == txn.sender:
+            reference = (kind, value, "")
+        # New lists are assigned, since the transaction's lists may be
+        # shared, e.g. with a MethodCallTemplate
+        txn.resources = app_access.extend_resource_references(
+            list(txn.resources),
+            txn.index,
+            accounts=[value] if kind == "account" else None,
+            foreign_assets=[value] if kind == "asset" else None,
+            foreign_apps=[value] if kind == "app" else None,
+            boxes=[(value, reference[2])] if kind == "box" else None,
+            holdings=[(value, reference[2])] if kind == "holding" else None,
+            locals=[(value, reference[2])] if kind == "local" else None,
+        )
+        return
+
+    accounts = list(txn.accounts or [])
+    foreign_apps = list(txn.foreign_apps or [])
+    foreign_assets = list(txn.foreign_assets or [])
+    # boxes holds BoxReference objects once the transaction is built
+    boxes = cast(List[BoxReference], list(txn.boxes or []))
+
+    def add_account(address: str) -> None:
+        if address != txn.sender and address not in accounts:
+            accounts.append(address)
+
+    def add_app(app_id: int) -> None:
+        if app_id and app_id != txn.index and app_id not in foreign_apps:
+            foreign_apps.append(app_id)
+
+    def add_asset(asset_id: int) -> None:
+        if asset_id not in foreign_assets:
+            foreign_assets.append(asset_id)
+
+    if kind == "account":
+        add_account(value)
+    elif kind == "asset":
+        add_asset(value)
+    elif kind == "app":
+        add_app(value)
+    elif kind == "holding":
+        add_asset(value)
+        add_account(reference[2])
+    elif kind == "local":
+        add_app(value)
+        add_account(reference[2])
+    elif kind == "box":
+        add_app(value)
+        index = 0
+        if value and value != txn.index:
+            index = foreign_apps.index(value) + 1
+        box = BoxReference(index, reference[2])
+        # Empty box references only add I/O budget, so they may repeat
+        if not box.name or box not in boxes:
+            boxes.append(box)
+    txn.accounts = accounts or None
+    txn.foreign_apps = foreign_apps or None
+    txn.foreign_assets = foreign_assets or None
+    txn.boxes = cast(Any, boxes) or None
+
+
+def _reference_count(txn: transaction.Transaction) -> Optional[int]:
+    # Number of references of an application call, or None over the limits
+    if not isinstance(txn, transaction.ApplicationCallTxn):
+        return None
+    if txn.resources is not None:
+        count = len(txn.resources)
+        return count if count <= constants.APP_MAX_ACCESS else None
+    accounts = len(txn.accounts or [])
+    count = (
+        accounts
+        + len(txn.foreign_apps or [])
+        + len(txn.foreign_assets or [])
+        + len(txn.boxes or [])
+    )
+    if (
+        accounts > constants.APP_MAX_ACCOUNTS
+        or count > constants.APP_MAX_REFERENCES
+    ):
+        return None
+    return count
+
+
+def _group_shape(txns: List[transaction.Transaction]) -> Tuple[Any, ...]:
+    shape: List[Tuple[Any, ...]] = []
+    for txn in txns:
+        if not isinstance(txn, transaction.ApplicationCallTxn):
+            shape.append((txn.type, txn.sender))
+            continue
+        shape.append(
+            (
+                txn.type,
+                txn.sender,
+                txn.index,
+                txn.on_complete,
+                bytes(txn.app_args[0]) if txn.app_args else None,
+                tuple(txn.accounts or ()),
+                tuple(txn.foreign_apps or ()),
+                tuple(txn.foreign_assets or ()),
+                tuple(
+                    (box.app_index, box.name)
+                    for box in cast(List[BoxReference], txn.boxes or [])
+                ),
+                None if txn.resources is None else len(txn.resources),
+            )
+        )
+    return tuple(shape)
+
+
+# "#pragma version 6; pushint 1", which approves any call
+_APPROVE_PROGRAM = bytes([6, 0x81, 1])
+# Budget a padding call adds, less a margin for its own program
+_PADDING_CALL_BUDGET = constants.APP_CALL_OPCODE_BUDGET - 10
+
+
+class FeeBudgetOptimizer:
+    """
+    Sets the smallest fees a transaction group needs and adds opcode budget
+    only when it needs more, as found by simulating it.
+
+    The group is simulated once, as it would be sent, with extra opcode
+    budget. The fee credit drawn by inner transactions and the opcode budget
+    consumed beyond what the group's application calls provide are then
+    read from the result. Budget padding calls are appended when needed,
+    and the fees of the whole group, its inner transactions and the padding
+    calls are pooled onto one payer transaction as flat fees, leaving the
+    other transactions with no fee.
+
+    Padding calls are sent by the payer. By default each creates and, in
+    the same call, deletes an application whose program approves any call,
+    which costs no minimum balance. Pass `budget_app_id` to call an existing
+    application that cheaply approves any NoOp call instead.
+
+    Results can be cached by the type, application and method selector of
+    each transaction, so groups calling the same methods skip the
+    simulation. The cache is off by default: it is only safe when the fees
+    and budget of every method called do not depend on its arguments, or
+    groups get the fees and padding planned for other arguments.
+
+    Args:
+        client (AlgodClient): Algod V2 client
+        request (models.SimulateRequest, optional): SimulateRequest with
+            options shared by every simulation. Its transaction groups and
+            extra opcode budget are ignored.
+        min_fee (int, optional): minimum fee of a transaction
+        budget_app_id (int, optional): application called to add budget
+        extra_opcode_budget (int, optional): extra budget to simulate with,
+            which bounds the budget a group can be found to need
+        cache_size (int, optional): number of results to keep; 0, the
+            default, disables the cache
+    """
+
+    def __init__(
+        self,
+        client: algod.AlgodClient,
+        request: Optional[models.SimulateRequest] = None,
+        min_fee: int = constants.MIN_TXN_FEE,
+        budget_app_id: Optional[int] = None,
+        extra_opcode_budget: int = 320000,
+        cache_size: int = 0,
+    ) -> None:
+        self.client = client
+        self.request = (
+            request if request else models.SimulateRequest(txn_groups=list())
+        )
+        self.min_fee = min_fee
+        self.budget_app_id = budget_app_id
+        self.extra_opcode_budget = extra_opcode_budget
+        self._cache = _PlanCache(cache_size)
+
+    def optimize(
+        self, atc: AtomicTransactionComposer, payer_index: int = 0
+    ) -> AtomicTransactionComposer:
+        """
+        Set the fees of a composer's transactions and add any budget padding
+        calls it needs.
+
+        The composer's status must be BUILDING, and its transactions are
+        updated in place.
+
+        Args:
+            atc (AtomicTransactionComposer): the group to optimize
+            payer_index (int, optional): index of the transaction that pays
+                the fees of the group
+
+        Returns:
+            AtomicTransactionComposer: the same composer
+        """
+        if atc.status != AtomicTransactionComposerStatus.BUILDING:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposer must be in BUILDING state to "
+                "optimize its fees"
+            )
+        if not 0 <= payer_index < len(atc.txn_list):
+            raise error.AtomicTransactionComposerError(
+                "payer index {} is not in the group".format(payer_index)
+            )
+        key = _method_shape([t.txn for t in atc.txn_list])
+        plan = self._cache.get(key)
+        if plan is None:
+            plan = self._simulate_plan(atc)
+            self._cache.put(key, plan)
+        inner_fees, padding_calls = plan
+        if len(atc.txn_list) + padding_calls > atc.MAX_GROUP_SIZE:
+            raise error.AtomicTransactionComposerError(
+                "the group needs {} budget padding calls, which would "
+                "exceed MAX_GROUP_SIZE transactions".format(padding_calls)
+            )
+
+        payer = atc.txn_list[payer_index]
+        for i in range(padding_calls):
+            atc.add_transaction(
+                TransactionWithSigner(
+                    self._padding_call(payer.txn, i), payer.signer
+                )
+            )
+        total_fee = self.min_fee * len(atc.txn_list) + inner_fees
+        for i, txn_with_signer in enumerate(atc.txn_list):
+            txn_with_signer.txn.fee = total_fee if i == payer_index else 0
+        return atc
+
+    def _simulate_plan(
+        self, atc: AtomicTransactionComposer
+    ) -> Tuple[int, int]:
+        request = copy.copy(self.request)
+        request.extra_opcode_budget = self.extra_opcode_budget
+        txn_group = _simulate_unsigned(self.client, request, atc)
+
+        inner_txns = inner_paid = 0
+        app_calls = sum(
+            isinstance(t.txn, transaction.ApplicationCallTxn)
+            for t in atc.txn_list
+        )
+        for result in txn_group["txn-results"]:
+            count, paid, calls = _inner_fees(result.get("txn-result", {}))
+            inner_txns += count
+            inner_paid += paid
+            app_calls += calls
+        # Fees are pooled across the group, so inner transactions paying
+        # more than the minimum cover those paying less
+        inner_fees = max(0, self.min_fee * inner_txns - inner_paid)
+
+        deficit = (
+            txn_group.get("app-budget-consumed", 0)
+            - app_calls * constants.APP_CALL_OPCODE_BUDGET
+        )
+        padding_calls = max(0, -(-deficit // _PADDING_CALL_BUDGET))
+        return inner_fees, padding_calls
+
+    def _padding_call(
+        self, payer: transaction.Transaction, i: int
+    ) -> transaction.ApplicationCallTxn:
+        sp = transaction.SuggestedParams(
+            0,
+            payer.first_valid_round,
+            payer.last_valid_round,
+            payer.genesis_hash,
+            payer.genesis_id,
+            flat_fee=True,
+        )
+        # Padding calls differ by note so that their IDs do not collide
+        note = "budget padding {}".format(i).encode()
+        if self.budget_app_id:
+            return transaction.ApplicationCallTxn(
+                payer.sender,
+                sp,
+                self.budget_app_id,
+                transaction.OnComplete.NoOpOC,
+                note=note,
+            )
+        return transaction.ApplicationCallTxn(
+            payer.sender,
+            sp,
+            0,
+            transaction.OnComplete.DeleteApplicationOC,
+            approval_program=_APPROVE_PROGRAM,
+            clear_program=_APPROVE_PROGRAM,
+            note=note,
+        )
+
+
+def _inner_fees(txn_result: Dict[str, Any]) -> Tuple[int, int, int]:
+    # Number of inner transactions of a transaction, the fees they pay and
+    # how many of them are application calls
+    count = fees = app_calls = 0
+    for inner in txn_result.get("inner-txns", []):
+        txn = inner.get("txn", {}).get("txn", {})
+        count += 1
+        fees += txn.get("fee", 0)
+        app_calls += txn.get("type") == constants.APPCALL_TXN
+        inner_count, inner_fees, inner_calls = _inner_fees(inner)
+        count += inner_count
+        fees += inner_fees
+        app_calls += inner_calls
+    return count, fees, app_calls
+
+
+def _method_shape(txns: List[transaction.Transaction]) -> Tuple[Any, ...]:
+    return tuple(
+        (
+            (
+                txn.type,
+                txn.index,
+                bytes(txn.app_args[0]) if txn.app_args else None,
+            )
+            if isinstance(txn, transaction.ApplicationCallTxn)
+            else (txn.type,)
+        )
+        for txn in txns
+    )
+
+
+def gather_signatures_batch(
+    composers: List[AtomicTransactionComposer],
+    max_workers: int = 4,
+    timeout: Optional[float] = None,
+) -> List[List[GenericSignedTransaction]]:
+    """
+    Obtain signatures for many transaction groups in one pass.
+
+    Signers shared between groups are called once with all of their groups,
+    through TransactionSigner.sign_transaction_groups, so a remote signer can
+    serve them with a single request. Different signers sign concurrently,
+    and all AsyncTransactionSigner instances share one event loop.
+
+    Each composer is signed as in `AtomicTransactionComposer.gather_signatures`,
+    so the same caching and status rules apply.
+
+    Args:
+        composers (list[AtomicTransactionComposer]): groups to sign
+        max_workers (int, optional): maximum number of signers signing
+            concurrently
+        timeout (float, optional): seconds each signer may take, counted
+            from when it starts signing, before signing fails with an
+            AtomicTransactionComposerError. Signers waiting for a free worker
+            are not yet timed. A signer that times out is abandoned rather
+            than interrupted.
+
+    Returns:
+        list[list[GenericSignedTransaction]]: signed transactions of each
+            composer, in the same order as `composers`
+    """
+    if max_workers < 1:
+        raise error.AtomicTransactionComposerError(
+            "max_workers must be a positive integer"
+        )
+    unsigned = [
+        composer
+        for composer in composers
+        if composer.status < AtomicTransactionComposerStatus.SIGNED
+    ]
+    txn_groups = [composer.build_group() for composer in unsigned]
+    signed = _sign_groups(txn_groups, max_workers, timeout)
+    for composer, stxn_list in zip(unsigned, signed):
+        if None in stxn_list:
+            raise error.AtomicTransactionComposerError(
+                "missing signatures, got {}".format(stxn_list)
+            )
+        composer.status = AtomicTransactionComposerStatus.SIGNED
+        composer.signed_txns = cast(List[GenericSignedTransaction], stxn_list)
+    return [composer.signed_txns for composer in composers]
+
+
+def _sign_groups(
+    txn_groups: List[List[TransactionWithSigner]],
+    max_workers: int,
+    timeout: Optional[float],
+) -> List[List[Optional[GenericSignedTransaction]]]:
+    # Map each signer to the indexes it signs in each group
+    requests: Dict[TransactionSigner, Dict[int, List[int]]] = {}
+    for g, txn_group in enumerate(txn_groups):
+        for i, txn_with_signer in enumerate(txn_group):
+            signer_requests = requests.setdefault(txn_with_signer.signer, {})
+            signer_requests.setdefault(g, []).append(i)
+    txns = [[t.txn for t in txn_group] for txn_group in txn_groups]
+
+    def groups_of(
+        signer: TransactionSigner,
+    ) -> List[Tuple[List[transaction.Transaction], List[int]]]:
+        return [(txns[g], indexes) for g, indexes in requests[signer].items()]
+
+    def sign(
+        signer: TransactionSigner,
+    ) -> List[List[GenericSignedTransaction]]:
+        groups = groups_of(signer)
+        if len(groups) == 1:
+            return [signer.sign_transactions(*groups[0])]
+        return signer.sign_transaction_groups(groups)
+
+    async def sign_async(
+        signer: AsyncTransactionSigner,
+    ) -> List[List[GenericSignedTransaction]]:
+        groups = groups_of(signer)
+        if len(groups) == 1:
+            coro: Any = signer.sign_transactions_async(*groups[0])
+        else:
+            coro = signer.sign_transaction_groups_async(groups)
+        try:
+            signed = await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError:
+            raise _signer_timeout(signer, timeout)
+        return [signed] if len(groups) == 1 else signed
+
+    async def sign_all_async(
+        signers: List[AsyncTransactionSigner],
+    ) -> List[List[List[GenericSignedTransaction]]]:
+        return list(await asyncio.gather(*map(sign_async, signers)))
+
+    sync_signers = [
+        signer
+        for signer in requests
+        if not isinstance(signer, AsyncTransactionSigner)
+    ]
+    async_signers = [
+        signer
+        for signer in requests
+        if isinstance(signer, AsyncTransactionSigner)
+    ]
+    results: Dict[TransactionSigner, List[List[GenericSignedTransaction]]]
+    if len(requests) == 1 and sync_signers and timeout is None:
+        # A lone signer gains nothing from a worker thread
+        results = {sync_signers[0]: sign(sync_signers[0])}
+    else:
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            async_future = None
+            if async_signers:
+                async_future = executor.submit(
+                    lambda: _run_coroutine(sign_all_async(async_signers))
+                )
+            futures = _submit_timed(executor, sign, sync_signers, timeout)
+            for signer, future in futures:
+                results[signer] = future.result()
+            if async_future is not None:
+                results.update(zip(async_signers, async_future.result()))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # Merge the signed transactions in order
+    stxn_lists: List[List[Optional[GenericSignedTransaction]]] = [
+        [None] * len(txn_group) for txn_group in txn_groups
+    ]
+    for signer, signer_requests in requests.items():
+        for (g, indexes), stxns in zip(
+            signer_requests.items(), results[signer]
+        ):
+            for index, stxn in zip(indexes, stxns):
+                stxn_lists[g][index] = stxn
+    return stxn_lists
+
+
+def _submit_timed(
+    executor: ThreadPoolExecutor,
+    sign: Any,
+    signers: List[TransactionSigner],
+    timeout: Optional[float],
+) -> List[Tuple[TransactionSigner, Future]]:
+    # Submit sign for each signer and, with a timeout, wait until they all
+    # finish, failing once any signer runs for longer than the timeout after
+    # it starts. Signers queued behind max_workers do not use up their time.
+    started: Dict[TransactionSigner, float] = {}
+    changed = threading.Condition()
+
+    def timed(signer: TransactionSigner) -> Any:
+        with changed:
+            started[signer] = time.monotonic()
+            changed.notify_all()
+        return sign(signer)
+
+    def notify(_: Future) -> None:
+        with changed:
+            changed.notify_all()
+
+    futures = [(signer, executor.submit(timed, signer)) for signer in signers]
+    if timeout is None:
+        return futures
+    for _, future in futures:
+        future.add_done_callback(notify)
+    with changed:
+        while not all(future.done() for _, future in futures):
+            now = time.monotonic()
+            deadlines = []
+            for signer, future in futures:
+                if future.done() or signer not in started:
+                    continue
+                if started[signer] + timeout <= now:
+                    raise _signer_timeout(signer, timeout)
+                deadlines.append(started[signer] + timeout)
+            changed.wait(min(deadlines) - now if deadlines else None)
+    return futures
+
+
+def _signer_timeout(
+    signer: TransactionSigner, timeout: Optional[float]
+) -> error.AtomicTransactionComposerError:
+    return error.AtomicTransactionComposerError(
+        "{} did not finish signing within {} seconds".format(
+            type(signer).__name__, timeout
+        )
+    )
@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 from algosdk import encoding, error
 
@@ -29,33 +29,18 @@ class BoxReference:
         foreign_apps: List[int],
         this_app_id: int,
     ) -> "BoxReference":
-        # Do not need to translate the references if they are already BoxReference type.
-        if isinstance(ref, BoxReference):
-            return ref
-
-        # Try checking reference id and name type.
-        ref_id, ref_name = ref[0], encoding.encode_as_bytes(ref[1])
-        if not isinstance(ref_id, int):
-            raise TypeError("Box reference ID must be an int")
-
-        index = 0
-        try:
-            # Foreign apps start from index 1; index 0 is its own app ID.
-            index = foreign_apps.index(ref_id) + 1
-        except (ValueError, AttributeError):
-            # Check if the app referenced is itself after checking the
-            # foreign apps array (in case its own app id is in its own
-            # foreign apps array).
-            if ref_id != 0 and ref_id != this_app_id:
-                raise error.InvalidForeignIndexError(
-                    f"Box ref with appId {ref_id} not in foreign-apps"
-                )
-        return BoxReference(index, ref_name)
+        return BoxReference.translate_box_references(
+            [ref], foreign_apps, this_app_id
+        )[0]
 
     @staticmethod
     def translate_box_references(
-        references: List[Tuple[int, Union[bytes, bytearray, str, int]]],
-        foreign_apps: List[int],
+        references: List[
+            Union[
+                Tuple[int, Union[bytes, bytearray, str, int]], "BoxReference"
+            ]
+        ],
+        foreign_apps: Optional[List[int]],
         this_app_id: int,
     ) -> List["BoxReference"]:
         """
@@ -71,12 +56,36 @@ class BoxReference:
         if not references:
             return []
 
-        return [
-            BoxReference.translate_box_reference(
-                ref, foreign_apps, this_app_id
-            )
-            for ref in references
-        ]
+        # Foreign apps start from index 1; index 0 is its own app ID. Going
+        # backwards leaves each app ID mapped to its first index.
+        foreign_apps = foreign_apps or []
+        app_positions = dict(
+            zip(reversed(foreign_apps), range(len(foreign_apps), 0, -1))
+        )
+        translated = []
+        for ref in references:
+            # Do not need to translate the references if they are already BoxReference type.
+            if isinstance(ref, BoxReference):
+                translated.append(ref)
+                continue
+
+            # Try checking reference id and name type.
+            ref_id, ref_name = ref[0], encoding.encode_as_bytes(ref[1])
+            if not isinstance(ref_id, int):
+                raise TypeError("Box reference ID must be an int")
+
+            index = app_positions.get(ref_id)
+            if index is None:
+                # Check if the app referenced is itself after checking the
+                # foreign apps array (in case its own app id is in its own
+                # foreign apps array).
+                if ref_id != 0 and ref_id != this_app_id:
+                    raise error.InvalidForeignIndexError(
+                        f"Box ref with appId {ref_id} not in foreign-apps"
+                    )
+                index = 0
+            translated.append(BoxReference(index, ref_name))
+        return translated
 
     def dictify(self):
         d = dict()
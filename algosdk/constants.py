@@ -13,6 +13,10 @@ UNVERSIONED_PATHS = ["/health", "/versions", "/metrics", "/genesis", "/ready"]
 """str[]: paths that don't use the version path prefix"""
 NO_AUTH: List[str] = []
 """str[]: requests that don't require authentication"""
+SUPPORTED_CONTENT_ENCODINGS = ["gzip", "deflate"]
+"""str[]: response compressions the clients can decode"""
+ACCEPT_ENCODING = ", ".join(SUPPORTED_CONTENT_ENCODINGS)
+"""str: Accept-Encoding header value sent with algod and indexer requests"""
 
 
 # transaction types
@@ -99,6 +103,15 @@ LOGIC_SIG_MAX_SIZE = 1000
 
 APP_PAGE_MAX_SIZE = 2048
 """int: max size of a page for an application in bytes"""
+APP_MAX_ACCOUNTS = 4
+"""int: max number of foreign accounts of an application call"""
+APP_MAX_REFERENCES = 8
+"""int: max number of accounts, apps, assets and boxes an application call
+references through its foreign arrays"""
+APP_MAX_ACCESS = 16
+"""int: max number of entries in an application call's access list"""
+APP_CALL_OPCODE_BUDGET = 700
+"""int: opcode budget each application call adds to its group's pool"""
 
 ZERO_ADDRESS = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ"
 """str: algorand encoded address of 32 zero bytes"""
@@ -1,11 +1,31 @@
 import base64
 from collections import OrderedDict
-from typing import Union
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import msgpack
-from Cryptodome.Hash import SHA512
 
-from algosdk import auction, constants, error, transaction
+from algosdk import constants, error
+
+# hashlib provides SHA-512/256 when it is built against OpenSSL 1.1.1 or
+# later, and is several times faster than Cryptodome for short inputs.
+# Cryptodome is then not imported at all, which also shortens import time.
+# Copying an empty hash is cheaper than looking the algorithm up by name.
+_sha512_256: Optional[Any]
+try:
+    _sha512_256 = hashlib.new("sha512_256")
+except ValueError:
+    _sha512_256 = None
+
+# Number of addresses remembered in each direction by decode_address and
+# encode_address
+ADDRESS_CACHE_SIZE = 8192
+
+# Each address is 36 bytes with its checksum; padding it to 40 bytes aligns
+# it with 8-character base32 blocks, so many can be converted at once
+_ADDRESS_BLOCK_BYTES = 40
+_ADDRESS_BLOCK_CHARS = 64
 
 
 def msgpack_encode(obj):
@@ -66,6 +86,9 @@ def msgpack_decode(enc):
         Transaction, SignedTransaction, Multisig, Bid, or SignedBid:\
             decoded object
     """
+    # Imported here as both modules import this one
+    from algosdk import auction, transaction
+
     decoded = enc
     if not isinstance(enc, dict):
         decoded = msgpack.unpackb(base64.b64decode(enc), raw=False)
@@ -118,6 +141,85 @@ def is_valid_address(addr):
         return False
 
 
+class _AddressCache:
+    """
+    Least recently used cache of address conversions, counting hits and
+    misses. It may be shared between threads.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            if self.size <= 0:
+                return
+            self._entries[key] = value
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def resize(self, size: int) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = size
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.size,
+            }
+
+
+_decoded_addresses = _AddressCache(ADDRESS_CACHE_SIZE)
+_encoded_addresses = _AddressCache(ADDRESS_CACHE_SIZE)
+
+
+def address_cache_info() -> Dict[str, Dict[str, int]]:
+    """
+    Return statistics of the address caches used by decode_address,
+    decode_addresses, encode_address and encode_addresses.
+
+    Returns:
+        dict: for "decode" and "encode", a dict of the cache's "hits",
+            "misses", current "size" and "maxsize"
+    """
+    return {
+        "decode": _decoded_addresses.info(),
+        "encode": _encoded_addresses.info(),
+    }
+
+
+def set_address_cache_size(size: int) -> None:
+    """
+    Change how many addresses are cached in each direction, clearing the
+    caches and their statistics. A size of 0 disables caching.
+
+    Args:
+        size (int): maximum number of cached addresses per direction
+    """
+    for cache in (_decoded_addresses, _encoded_addresses):
+        cache.resize(size)
+
+
 def decode_address(addr):
     """
     Decode a string address into its address bytes and checksum.
@@ -131,6 +233,16 @@ def decode_address(addr):
     """
     if not addr:
         return addr
+    if not isinstance(addr, str):
+        return _decode_address(addr)
+    decoded = _decoded_addresses.get(addr)
+    if decoded is None:
+        decoded = _decode_address(addr)
+        _decoded_addresses.put(addr, decoded)
+    return decoded
+
+
+def _decode_address(addr):
     if not len(addr) == constants.address_len:
         raise error.WrongKeyLengthError
     decoded = base64.b32decode(_correct_padding(addr))
@@ -144,6 +256,47 @@ def decode_address(addr):
         raise error.WrongChecksumError
 
 
+def decode_addresses(addrs: Iterable[str]) -> List[bytes]:
+    """
+    Decode many string addresses, as decode_address does for each.
+
+    Addresses not in the cache are base32 decoded together in one call.
+
+    Args:
+        addrs (Iterable[str]): base32 addresses
+
+    Returns:
+        list[bytes]: addresses decoded into bytes, in the same order
+    """
+    return _convert_many(
+        list(addrs), str, _decoded_addresses, _decode_addresses, decode_address
+    )
+
+
+def _decode_addresses(addrs: List[str]) -> List[bytes]:
+    if any(len(addr) != constants.address_len for addr in addrs):
+        return [_decode_address(addr) for addr in addrs]
+    # Filling each address up to a whole block with zero bits ("A") instead
+    # of "=" padding lets them be decoded as one string
+    fill = "A" * (_ADDRESS_BLOCK_CHARS - constants.address_len)
+    try:
+        decoded = base64.b32decode(fill.join(addrs) + fill)
+    except ValueError:
+        # Raise the error of the first invalid address
+        return [_decode_address(addr) for addr in addrs]
+    result = []
+    for start in range(0, len(decoded), _ADDRESS_BLOCK_BYTES):
+        addr_end = start + constants.key_len_bytes
+        addr_bytes = decoded[start:addr_end]
+        expected_checksum = decoded[
+            addr_end : addr_end + constants.check_sum_len_bytes
+        ]
+        if _checksum(addr_bytes) != expected_checksum:
+            raise error.WrongChecksumError
+        result.append(addr_bytes)
+    return result
+
+
 def encode_address(addr_bytes):
     """
     Encode a byte address into a string composed of the encoded bytes and the
@@ -157,6 +310,16 @@ def encode_address(addr_bytes):
     """
     if not addr_bytes:
         return addr_bytes
+    if not isinstance(addr_bytes, bytes):
+        return _encode_address(addr_bytes)
+    addr = _encoded_addresses.get(addr_bytes)
+    if addr is None:
+        addr = _encode_address(addr_bytes)
+        _encoded_addresses.put(addr_bytes, addr)
+    return addr
+
+
+def _encode_address(addr_bytes):
     if not len(addr_bytes) == constants.key_len_bytes:
         raise error.WrongKeyBytesLengthError
     chksum = _checksum(addr_bytes)
@@ -164,6 +327,72 @@ def encode_address(addr_bytes):
     return _undo_padding(addr.decode())
 
 
+def encode_addresses(addrs: Iterable[bytes]) -> List[str]:
+    """
+    Encode many byte addresses, as encode_address does for each.
+
+    Addresses not in the cache are base32 encoded together in one call.
+
+    Args:
+        addrs (Iterable[bytes]): addresses in bytes
+
+    Returns:
+        list[str]: base32 encoded addresses, in the same order
+    """
+    return _convert_many(
+        list(addrs),
+        bytes,
+        _encoded_addresses,
+        _encode_addresses,
+        encode_address,
+    )
+
+
+def _encode_addresses(addrs: List[bytes]) -> List[str]:
+    """
+    Encode byte addresses without caching them.
+    """
+    if any(len(addr) != constants.key_len_bytes for addr in addrs):
+        return [_encode_address(addr) for addr in addrs]
+    fill = bytes(
+        _ADDRESS_BLOCK_BYTES
+        - constants.key_len_bytes
+        - constants.check_sum_len_bytes
+    )
+    encoded = base64.b32encode(
+        b"".join(addr + _checksum(addr) + fill for addr in addrs)
+    ).decode()
+    return [
+        encoded[start : start + constants.address_len]
+        for start in range(0, len(encoded), _ADDRESS_BLOCK_CHARS)
+    ]
+
+
+def _convert_many(addrs, kind, cache, convert_many, convert_one):
+    """
+    Convert addresses, looking distinct non-empty ones of type `kind` up in
+    a cache and converting the missing ones together with `convert_many`.
+    Anything else is passed to `convert_one`.
+    """
+    found = {}
+    missing = []
+    batched = [bool(a) and type(a) is kind for a in addrs]
+    for addr in dict.fromkeys(a for a, b in zip(addrs, batched) if b):
+        value = cache.get(addr)
+        if value is None:
+            missing.append(addr)
+        else:
+            found[addr] = value
+    if missing:
+        for addr, value in zip(missing, convert_many(missing)):
+            cache.put(addr, value)
+            found[addr] = value
+    return [
+        found[addr] if b else convert_one(addr)
+        for addr, b in zip(addrs, batched)
+    ]
+
+
 def _checksum(addr):
     """
     Compute the checksum of size checkSumLenBytes for the address.
@@ -197,6 +426,12 @@ def checksum(data):
     Returns:
         bytes: checksum of the data
     """
+    if _sha512_256 is not None:
+        chksum = _sha512_256.copy()
+        chksum.update(data)
+        return chksum.digest()
+    from Cryptodome.Hash import SHA512
+
     chksum = SHA512.new(truncate="256")
     chksum.update(data)
     return chksum.digest()
@@ -189,6 +189,11 @@ class AlgodResponseError(Exception):
         super().__init__(msg)
 
 
+class ResponseStreamError(Exception):
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
 class IndexerHTTPError(Exception):
     pass
 
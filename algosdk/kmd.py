@@ -1,6 +1,10 @@
 import base64
+from concurrent.futures import ThreadPoolExecutor
+import http.client
 import json
-from typing import Any
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 import urllib.error
 from urllib import parse
 from urllib.request import Request, urlopen
@@ -51,7 +55,7 @@ class KMDClient:
         if params:
             requrl = requrl + "?" + parse.urlencode(params)
         if data:
-            data = json.dumps(data, indent=2)
+            data = json.dumps(data, separators=(",", ":"))
             data = bytearray(data, "utf-8")
         req = Request(
             self.kmd_address + requrl, headers=header, method=method, data=data
@@ -463,3 +467,257 @@ class KMDClient:
         msig = encoding.msgpack_decode(result)
         mtx.multisig = msig
         return mtx
+
+
+class KMDSession(KMDClient):
+    """
+    KMD client for signing many transactions with one wallet.
+
+    Requests are sent over a pool of persistent connections instead of
+    opening a connection per request, and request bodies are sent as
+    compact JSON. A single handle for the wallet is initialized when the
+    session is created and renewed in the background, so signing does not
+    renew or initialize handles per transaction.
+
+    Every KMDClient method is available and uses the pooled connections.
+    Close the session, or use it as a context manager, to release the
+    handle and the connections.
+
+    Args:
+        kmd_token (str): kmd API token
+        kmd_address (str): kmd address
+        wallet_name (str): name of the wallet to sign with
+        wallet_pswd (str): wallet password
+        max_connections (int, optional): maximum number of connections kept
+            open, which also bounds concurrent requests
+        renew_interval (float, optional): seconds between renewals of the
+            wallet handle; keep it below kmd's handle timeout
+
+    Attributes:
+        wallet_id (str)
+        handle (str)
+    """
+
+    def __init__(
+        self,
+        kmd_token: str,
+        kmd_address: str,
+        wallet_name: str,
+        wallet_pswd: str,
+        max_connections: int = 8,
+        renew_interval: float = 30,
+    ) -> None:
+        super().__init__(kmd_token, kmd_address)
+        url = parse.urlsplit(kmd_address)
+        connection_class = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._base_path = url.path.rstrip("/")
+        self.max_connections = max_connections
+        # Connections only connect when first used, and reconnect after
+        # being closed
+        self._connections: "queue.LifoQueue[http.client.HTTPConnection]" = (
+            queue.LifoQueue()
+        )
+        for _ in range(max_connections):
+            self._connections.put(connection_class(url.netloc))
+
+        self.wallet_pswd = wallet_pswd
+        self.wallet_id = None
+        for w in self.list_wallets():
+            if w["name"] == wallet_name:
+                self.wallet_id = w["id"]
+        if not self.wallet_id:
+            for conn in list(self._connections.queue):
+                conn.close()
+            raise error.KMDHTTPError("wallet {} not found".format(wallet_name))
+        self._handle_lock = threading.Lock()
+        self.handle = self.init_wallet_handle(self.wallet_id, wallet_pswd)
+
+        self.renew_interval = renew_interval
+        self._closed = threading.Event()
+        self._renewer = threading.Thread(target=self._keep_handle, daemon=True)
+        self._renewer.start()
+
+    def kmd_request(self, method, requrl, params=None, data=None, timeout=30):
+        """
+        Execute a given request over a pooled connection.
+
+        Args:
+            method (str): request method
+            requrl (str): url for the request
+            params (dict, optional): parameters for the request
+            data (dict, optional): data in the body of the request
+            timeout (int, optional): request timeout in seconds
+
+        Returns:
+            dict: loaded from json response body
+        """
+        if requrl in constants.no_auth:
+            header = {}
+        else:
+            header = {constants.kmd_auth_header: self.kmd_token}
+
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+        body = None
+        if data:
+            body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+        status, payload = self._send(
+            method, self._base_path + requrl, body, header, timeout
+        )
+        if status >= 400:
+            message = payload.decode("utf-8")
+            try:
+                message = json.loads(message)["message"]
+            except Exception:
+                pass
+            raise error.KMDHTTPError(message)
+        return json.loads(payload.decode("utf-8"))
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> Tuple[int, bytes]:
+        conn = self._connections.get()
+        try:
+            try:
+                return _exchange(conn, method, url, body, headers, timeout)
+            except (http.client.HTTPException, OSError):
+                # kmd may have closed the kept-alive connection, so retry
+                # once on a new one
+                conn.close()
+                return _exchange(conn, method, url, body, headers, timeout)
+        except BaseException:
+            conn.close()
+            raise
+        finally:
+            self._connections.put(conn)
+
+    def sign_transactions(
+        self,
+        txns: List[transaction.Transaction],
+        signing_address: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[transaction.SignedTransaction]:
+        """
+        Sign many transactions with the session's wallet.
+
+        Args:
+            txns (list[Transaction]): transactions to be signed
+            signing_address (str, optional): sign the transactions with SK
+                corresponding to base32 signing_address, if provided, rather
+                than SK corresponding to each sender
+            max_workers (int, optional): maximum number of transactions
+                signed concurrently; defaults to max_connections
+
+        Returns:
+            list[SignedTransaction]: signed transactions, in the same order
+                as `txns`
+        """
+
+        def sign(txn: transaction.Transaction) -> Any:
+            handle = self.handle
+            try:
+                return self.sign_transaction(
+                    handle, self.wallet_pswd, txn, signing_address
+                )
+            except error.KMDHTTPError as e:
+                # The handle may have expired before it could be renewed
+                if not _is_handle_error(e):
+                    raise
+                if self._reinit_handle(handle) == handle:
+                    raise
+                return self.sign_transaction(
+                    self.handle, self.wallet_pswd, txn, signing_address
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers or self.max_connections
+        ) as executor:
+            return list(executor.map(sign, txns))
+
+    def _reinit_handle(self, expired: str) -> str:
+        # Replace an expired handle unless another thread already has, and
+        # release the replaced one in case it is still valid
+        with self._handle_lock:
+            if self.handle == expired:
+                try:
+                    self.handle = self.init_wallet_handle(
+                        self.wallet_id, self.wallet_pswd
+                    )
+                except error.KMDHTTPError:
+                    return self.handle
+                try:
+                    self.release_wallet_handle(expired)
+                except Exception:
+                    pass
+            return self.handle
+
+    def _keep_handle(self) -> None:
+        while not self._closed.wait(self.renew_interval):
+            handle = self.handle
+            try:
+                self.renew_wallet_handle(handle)
+            except Exception:
+                try:
+                    self._reinit_handle(handle)
+                except Exception:
+                    # Retried at the next renewal
+                    pass
+
+    def close(self) -> None:
+        """
+        Release the wallet handle and close the pooled connections.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._renewer.join()
+        try:
+            self.release_wallet_handle(self.handle)
+        except Exception:
+            pass
+        for conn in list(self._connections.queue):
+            conn.close()
+
+    def __enter__(self) -> "KMDSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _is_handle_error(e: error.KMDHTTPError) -> bool:
+    # kmd reports unknown and expired wallet handles with messages such as
+    # "invalid wallet handle" and "wallet handle expired"
+    message = str(e).lower()
+    return "handle" in message and any(
+        word in message
+        for word in ("invalid", "expired", "not exist", "not found")
+    )
+
+
+def _exchange(
+    conn: http.client.HTTPConnection,
+    method: str,
+    url: str,
+    body: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: float,
+) -> Tuple[int, bytes]:
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    conn.request(method, url, body=body, headers=headers)
+    resp = conn.getresponse()
+    return resp.status, resp.read()
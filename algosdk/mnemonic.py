@@ -176,19 +176,10 @@ def _to_11_bit(data):
     Returns:
         int[]: list of 11-bit numbers
     """
-    buffer = 0
-    num_of_bits = 0
-    output = []
-    for i in range(len(data)):
-        buffer |= data[i] << num_of_bits
-        num_of_bits += 8
-        if num_of_bits >= 11:
-            output.append(buffer & 2047)
-            buffer = buffer >> 11
-            num_of_bits -= 11
-    if num_of_bits != 0:
-        output.append(buffer & 2047)
-    return output
+    # Read the bytes as one little-endian integer and slice it into 11-bit
+    # groups, including a final partial group
+    buffer = int.from_bytes(data, "little")
+    return [(buffer >> shift) & 2047 for shift in range(0, 8 * len(data), 11)]
 
 
 def _to_bytes(nums):
@@ -202,15 +193,6 @@ def _to_bytes(nums):
         bytes: bytearray
     """
     buffer = 0
-    num_of_bits = 0
-    output = []
-    for i in range(len(nums)):
-        buffer |= nums[i] << num_of_bits
-        num_of_bits += 11
-        while num_of_bits >= 8:
-            output.append(buffer & 255)
-            buffer = buffer >> 8
-            num_of_bits -= 8
-    if num_of_bits != 0:
-        output.append(buffer & 255)
-    return bytes(output)
+    for shift, num in zip(range(0, 11 * len(nums), 11), nums):
+        buffer |= num << shift
+    return buffer.to_bytes((11 * len(nums) + 7) // 8, "little")
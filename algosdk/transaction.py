@@ -3384,7 +3384,10 @@ def assign_group_id(txns, address=None):
 
 
 def wait_for_confirmation(
-    algod_client: algod.AlgodClient, txid: str, wait_rounds: int = 0, **kwargs
+    algod_client: "algod.AlgodClient",
+    txid: str,
+    wait_rounds: int = 0,
+    **kwargs,
 ):
     """
     Block until a pending transaction is confirmed by the network.
@@ -3444,7 +3447,7 @@ defaultAppId = 1380011588
 
 
 def create_dryrun(
-    client: algod.AlgodClient,
+    client: "algod.AlgodClient",
     txns: List[GenericSignedTransaction],
     protocol_version=None,
     latest_timestamp=None,
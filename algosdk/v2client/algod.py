@@ -1,10 +1,18 @@
 import base64
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 import json
 from typing import (
     Any,
     Dict,
     Final,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -17,16 +25,25 @@ import urllib.error
 from urllib import parse
 from urllib.request import Request, urlopen
 
+import msgpack
+
 from algosdk import constants, encoding, error, transaction, util
-from algosdk.v2client import models
+from algosdk.v2client import models, response
 
-AlgodResponseType = Union[Dict[str, Any], bytes]
+AlgodResponseType = Union[Dict[str, Any], bytes, "response.StreamedResponse"]
 
 # for compatibility with urllib.parse.urlencode
 ParamsType = Union[Mapping[str, Any], Sequence[Tuple[str, Any]]]
 
 api_version_path_prefix = "/v2"
 
+# Prefix of box keys in ledger state deltas, followed by the 8-byte app ID
+box_key_prefix = b"bx:"
+
+# Most rounds of state deltas fetch_all_boxes scans for changed boxes before
+# reading all boxes instead
+max_delta_rounds = 1000
+
 
 class AlgodClient:
     """
@@ -62,6 +79,7 @@ class AlgodClient:
         headers: Optional[Dict[str, str]] = None,
         response_format: Optional[str] = "json",
         timeout: Optional[int] = 30,
+        stream_path: Optional[Sequence[str]] = None,
     ) -> AlgodResponseType:
         """
         Execute a given request.
@@ -74,12 +92,19 @@ class AlgodClient:
             headers (dict, optional): additional header for request
             response_format (str, optional): format of the response
             timeout (int, optional): request timeout in seconds
+            stream_path (Sequence[str], optional): keys leading to an array
+                in the response body, e.g. ("block", "txns"); when given,
+                the body is parsed incrementally and its items are streamed
 
         Returns:
             dict loaded from json response body when response_format == "json"
-            otherwise returns the response body as bytes
+            otherwise returns the response body as bytes; a StreamedResponse
+            over the selected array when stream_path is set
         """
-        header = {"User-Agent": "py-algorand-sdk"}
+        header = {
+            "User-Agent": "py-algorand-sdk",
+            "Accept-Encoding": constants.ACCEPT_ENCODING,
+        }
 
         if self.headers:
             header.update(self.headers)
@@ -106,7 +131,7 @@ class AlgodClient:
             resp = urlopen(req, timeout=timeout)
         except urllib.error.HTTPError as e:
             code = e.code
-            es = e.read().decode("utf-8")
+            es = response.decode_body(e).read().decode("utf-8")
             m = e  # If json.loads() fails, we'll return e itself
             j = {}
             try:
@@ -114,9 +139,14 @@ class AlgodClient:
                 m = j["message"]
             finally:
                 raise error.AlgodHTTPError(m, code, j.get("data"))
+        body = response.decode_body(resp)
+        if stream_path is not None:
+            return response.StreamedResponse(
+                body, stream_path, response_format
+            )
         if response_format == "json":
             try:
-                return json.load(resp)
+                return json.load(body)
             except Exception as e:
                 # Some algod responses currently return a 200 OK
                 # but have an empty response.
@@ -127,7 +157,7 @@ class AlgodClient:
                     "Failed to parse JSON response from algod"
                 ) from e
         else:
-            return resp.read()
+            return body.read()
 
     @classmethod
     def _assert_json_response(
@@ -194,7 +224,11 @@ class AlgodClient:
         return self.algod_request("GET", req, params=params, **kwargs)
 
     def application_boxes(
-        self, application_id: int, limit: int = 0, **kwargs: Any
+        self,
+        application_id: int,
+        limit: int = 0,
+        next_page: Optional[str] = None,
+        **kwargs: Any,
     ) -> AlgodResponseType:
         """
         Given an application ID, return all Box names. No particular ordering is guaranteed. Request fails when client or server-side configured limits prevent returning all Box names.
@@ -205,11 +239,181 @@ class AlgodClient:
             application_id (int): The ID of the application to look up.
             limit (int, optional): Max number of box names to return.
                 If max is not set, or max == 0, returns all box-names up to the maximum configured by the algod server being queried.
+            next_page (str, optional): the next page token from a previous
+                response, on nodes that paginate box names.
         """
         req = "/applications/" + str(application_id) + "/boxes"
-        params = {"max": limit} if limit else {}
+        params: Dict[str, Union[int, str]] = {}
+        if limit:
+            params["max"] = limit
+        if next_page:
+            params["next"] = next_page
         return self.algod_request("GET", req, params=params, **kwargs)
 
+    def fetch_all_boxes(
+        self,
+        application_id: int,
+        max_workers: int = 8,
+        stream: bool = False,
+        since_round: Optional[int] = None,
+        page_size: int = 0,
+        max_rounds: int = max_delta_rounds,
+        **kwargs: Any,
+    ) -> Union[
+        Dict[bytes, Optional[bytes]],
+        Iterator[Tuple[bytes, Optional[bytes]]],
+    ]:
+        """
+        Read the names and values of all of an application's boxes, fetching
+        box contents concurrently.
+
+        When since_round is given, only boxes modified after that round are
+        read, found by scanning the ledger state deltas up to the node's
+        last round. This requires a node that serves the /v2/deltas
+        endpoints (e.g. a follower node). Boxes deleted in the meantime are
+        reported with a value of None. If more than max_rounds rounds have
+        passed since since_round, all boxes are read instead.
+
+        Args:
+            application_id (int): The ID of the application to read.
+            max_workers (int, optional): maximum number of concurrent box
+                and state delta requests
+            stream (bool, optional): if True, return an iterator of
+                (name, value) pairs in completion order instead of a dict
+            since_round (int, optional): only re-fetch boxes changed after
+                this round
+            page_size (int, optional): number of box names to request per
+                page; 0 leaves it to the node
+            max_rounds (int, optional): most rounds of state deltas to scan
+                when since_round is given
+            **kwargs: passed on to every request, e.g. headers. A
+                response_format is ignored, since each request needs its
+                own.
+
+        Returns:
+            dict mapping box names to values, or an iterator of
+            (name, value) tuples when stream is True
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        kwargs.pop("response_format", None)
+        pairs = self._fetch_boxes(
+            application_id,
+            since_round,
+            page_size,
+            max_rounds,
+            max_workers,
+            kwargs,
+        )
+        return pairs if stream else dict(pairs)
+
+    def _iter_box_names(
+        self, application_id: int, page_size: int, kwargs: Dict[str, Any]
+    ) -> Iterator[bytes]:
+        next_page = None
+        while True:
+            resp = cast(
+                Dict[str, Any],
+                self.application_boxes(
+                    application_id,
+                    limit=page_size,
+                    next_page=next_page,
+                    **kwargs,
+                ),
+            )
+            for box in resp.get("boxes") or []:
+                yield base64.b64decode(box["name"])
+            next_page = resp.get("next-token")
+            if not next_page:
+                return
+
+    def _changed_box_names(
+        self,
+        application_id: int,
+        since_round: int,
+        max_rounds: int,
+        executor: ThreadPoolExecutor,
+        kwargs: Dict[str, Any],
+    ) -> Optional[List[Tuple[bytes, bool]]]:
+        """
+        Return (name, deleted) for every box of the application whose final
+        state changed in the rounds after since_round, or None if that spans
+        more than max_rounds rounds.
+        """
+        last_round = cast(Dict[str, Any], self.status(**kwargs))["last-round"]
+        if last_round - since_round > max_rounds:
+            return None
+
+        def fetch(rnd: int) -> Dict[bytes, Any]:
+            delta = self.get_ledger_state_delta(
+                rnd, response_format="msgpack", **kwargs
+            )
+            return msgpack.unpackb(
+                cast(bytes, delta), raw=True, strict_map_key=False
+            )
+
+        prefix = box_key_prefix + application_id.to_bytes(8, "big")
+        changed: Dict[bytes, bool] = {}
+        # map yields the deltas in round order, so later changes win
+        for delta in executor.map(
+            fetch, range(since_round + 1, last_round + 1)
+        ):
+            for key, mod in (delta.get(b"KvMods") or {}).items():
+                if key.startswith(prefix):
+                    changed[key[len(prefix) :]] = mod.get(b"Data") is None
+        return list(changed.items())
+
+    def _fetch_boxes(
+        self,
+        application_id: int,
+        since_round: Optional[int],
+        page_size: int,
+        max_rounds: int,
+        max_workers: int,
+        kwargs: Dict[str, Any],
+    ) -> Iterator[Tuple[bytes, Optional[bytes]]]:
+        def fetch(name: bytes) -> Tuple[bytes, Optional[bytes]]:
+            try:
+                box = cast(
+                    Dict[str, Any],
+                    self.application_box_by_name(
+                        application_id, name, **kwargs
+                    ),
+                )
+            except error.AlgodHTTPError as e:
+                if e.code == 404:
+                    return name, None
+                raise
+            return name, base64.b64decode(box["value"])
+
+        # Keep a bounded number of requests in flight so that names are
+        # paged in lazily and results can be streamed as they complete.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            names: Optional[Iterable[Tuple[bytes, bool]]] = None
+            if since_round is not None:
+                names = self._changed_box_names(
+                    application_id, since_round, max_rounds, executor, kwargs
+                )
+            if names is None:
+                names = (
+                    (name, False)
+                    for name in self._iter_box_names(
+                        application_id, page_size, kwargs
+                    )
+                )
+            pending: "set[Future[Tuple[bytes, Optional[bytes]]]]" = set()
+            for name, deleted in names:
+                if deleted:
+                    yield name, None
+                    continue
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(fetch, name))
+            for future in as_completed(pending):
+                yield future.result()
+
     def account_asset_info(
         self, address: str, asset_id: int, **kwargs: Any
     ) -> AlgodResponseType:
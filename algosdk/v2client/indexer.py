@@ -5,6 +5,7 @@ import json
 import base64
 from .. import error
 from .. import constants
+from . import response
 from .algod import _specify_round_string
 
 api_version_path_prefix = "/v2"
@@ -31,7 +32,14 @@ class IndexerClient:
         self.headers = headers
 
     def indexer_request(
-        self, method, requrl, params=None, data=None, headers=None, timeout=30
+        self,
+        method,
+        requrl,
+        params=None,
+        data=None,
+        headers=None,
+        timeout=30,
+        stream_path=None,
     ):
         """
         Execute a given request.
@@ -43,11 +51,18 @@ class IndexerClient:
             data (dict, optional): data in the body of the request
             headers (dict, optional): additional header for request
             timeout (int, optional): request timeout in seconds
+            stream_path (list, optional): keys leading to an array in the
+                response body, e.g. ["transactions"]; when given, the body
+                is parsed incrementally and its items are streamed
 
         Returns:
-            dict: loaded from json response body
+            dict: loaded from json response body, or a StreamedResponse over
+            the selected array when stream_path is set
         """
-        header = {"User-Agent": "py-algorand-sdk"}
+        header = {
+            "User-Agent": "py-algorand-sdk",
+            "Accept-Encoding": constants.ACCEPT_ENCODING,
+        }
 
         if self.headers:
             header.update(self.headers)
@@ -73,20 +88,19 @@ class IndexerClient:
         try:
             resp = urlopen(req, timeout=timeout)
         except urllib.error.HTTPError as e:
-            e = e.read().decode("utf-8")
+            e = response.decode_body(e).read().decode("utf-8")
             try:
                 e = json.loads(e)["message"]
             finally:
                 raise error.IndexerHTTPError(e)
-        response_dict = json.loads(resp.read().decode("utf-8"))
-
-        def recursively_sort_dict(dictionary):
-            return {
-                k: recursively_sort_dict(v) if isinstance(v, dict) else v
-                for k, v in sorted(dictionary.items())
-            }
+        body = response.decode_body(resp)
+        if stream_path is not None:
+            return response.StreamedResponse(
+                body, stream_path, item_hook=_recursively_sort_dict
+            )
+        response_dict = json.load(body)
 
-        return recursively_sort_dict(response_dict)
+        return _recursively_sort_dict(response_dict)
 
     def health(self, **kwargs):
         """Return 200 and a simple status message if the node is running."""
@@ -1053,6 +1067,15 @@ class IndexerClient:
         return self.indexer_request("GET", req, params, **kwargs)
 
 
+def _recursively_sort_dict(value):
+    if not isinstance(value, dict):
+        return value
+    return {
+        k: _recursively_sort_dict(v) if isinstance(v, dict) else v
+        for k, v in sorted(value.items())
+    }
+
+
 def _specify_round(query, block, round_num):
     """
     Set the round number in the query dictionary from either 'block' or
@@ -0,0 +1,310 @@
+import io
+import json
+import re
+import zlib
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+)
+
+import msgpack
+
+from algosdk import constants, error
+
+# Size of the chunks pulled from the socket while decompressing
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+# Size of the text chunks fed to the incremental JSON reader
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class DecompressingReader(io.RawIOBase):
+    """
+    Read-only stream that decompresses a gzip or deflate encoded body as it
+    is read from the underlying response, so the compressed payload never
+    has to be buffered in full.
+
+    Args:
+        raw (BinaryIO): the compressed stream, usually an HTTP response
+        content_encoding (str): either "gzip" or "deflate"
+    """
+
+    def __init__(self, raw: BinaryIO, content_encoding: str) -> None:
+        super().__init__()
+        self.raw = raw
+        self.content_encoding = content_encoding
+        # 32 + MAX_WBITS auto-detects both gzip and zlib headers.
+        self._decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        self._started = False
+        # Compressed input not yet turned into output
+        self._input = b""
+        self._pending = memoryview(b"")
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        if not self.closed:
+            self.raw.close()
+        super().close()
+
+    def _decompress(self, data: bytes, max_length: int) -> bytes:
+        if self._started or self.content_encoding != "deflate":
+            self._started = True
+            return self._decompressor.decompress(data, max_length)
+        # Some servers send raw deflate streams without the zlib wrapper
+        # for "deflate"; fall back to raw mode when the header is missing.
+        self._started = True
+        try:
+            return self._decompressor.decompress(data, max_length)
+        except zlib.error:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decompressor.decompress(data, max_length)
+
+    def readinto(self, buffer: Any) -> int:
+        if not len(buffer):
+            return 0
+        # At most len(buffer) bytes are decompressed at a time, and input
+        # left over is kept for the next read, so memory stays bounded by
+        # the read size however much a chunk expands.
+        while not self._pending and not self._eof:
+            if not self._input:
+                self._input = self.raw.read(DECOMPRESS_CHUNK_SIZE)
+                if not self._input:
+                    self._pending = memoryview(self._decompressor.flush())
+                    self._eof = True
+                    break
+            self._pending = memoryview(
+                self._decompress(self._input, len(buffer))
+            )
+            self._input = self._decompressor.unconsumed_tail
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def decode_body(resp: Any) -> BinaryIO:
+    """
+    Wrap an HTTP response in a stream that undoes its Content-Encoding.
+
+    Responses that were not compressed are returned unchanged.
+
+    Args:
+        resp (http.client.HTTPResponse): response returned by urlopen
+
+    Returns:
+        BinaryIO: stream yielding the decoded response body
+    """
+    encoding = _content_encoding(resp)
+    if encoding not in constants.SUPPORTED_CONTENT_ENCODINGS:
+        return resp
+    return io.BufferedReader(
+        DecompressingReader(resp, encoding), DECOMPRESS_CHUNK_SIZE
+    )
+
+
+def _content_encoding(resp: Any) -> Optional[str]:
+    headers = getattr(resp, "headers", None)
+    if headers is None:
+        return None
+    encoding = headers.get("Content-Encoding")
+    if not encoding:
+        return None
+    encoding = encoding.strip().lower()
+    # x-gzip is an old alias that some proxies still emit
+    return "gzip" if encoding == "x-gzip" else encoding
+
+
+class StreamedResponse:
+    """
+    Incrementally parsed response that yields the items of one array in the
+    body as they arrive instead of loading the whole document.
+
+    Everything outside of the streamed array is collected into `fields`,
+    keeping the nesting of `path`. Fields that follow the array in the body
+    are only available once iteration has finished.
+
+    Args:
+        body (BinaryIO): decoded response body
+        path (Sequence[str]): keys leading to the array to stream, e.g.
+            ("block", "txns"); an empty path streams a top-level array
+        response_format (str, optional): either "json" or "msgpack"
+        item_hook (callable, optional): applied to every item before it is
+            yielded
+
+    Attributes:
+        fields (dict)
+    """
+
+    def __init__(
+        self,
+        body: BinaryIO,
+        path: Sequence[str],
+        response_format: Optional[str] = "json",
+        item_hook: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self.body = body
+        self.path = tuple(path)
+        self.response_format = response_format
+        self.item_hook = item_hook
+        self.fields: Dict[str, Any] = {}
+        self._items: Optional[Iterator[Any]] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._items is None:
+            self._items = self._iterate()
+        return self._items
+
+    def __enter__(self) -> "StreamedResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        self.body.close()
+
+    def _iterate(self) -> Iterator[Any]:
+        try:
+            if self.response_format == "msgpack":
+                unpacker = msgpack.Unpacker(
+                    self.body, raw=False, strict_map_key=False
+                )
+                items = _iter_msgpack(unpacker, self.path, self.fields)
+            else:
+                reader = _JSONReader(
+                    io.TextIOWrapper(self.body, encoding="utf-8")
+                )
+                items = _iter_json(reader, self.path, self.fields)
+            for item in items:
+                yield self.item_hook(item) if self.item_hook else item
+        finally:
+            self.close()
+
+
+class _JSONReader:
+    """
+    Pull-style JSON reader that decodes one value at a time from a text
+    stream, refilling its buffer only as far as each value requires.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        self.stream = stream
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()  # type: ignore[union-attr] # the pattern always matches
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(STREAM_CHUNK_SIZE):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise error.ResponseStreamError(
+                "expected one of {!r} in response body, found {!r}".format(
+                    chars, char
+                )
+            )
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        size = STREAM_CHUNK_SIZE
+        while True:
+            self.peek()
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A value running up to the end of the buffer may be a
+                # truncated number, so only trust it once more data is seen.
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if self._fill(size):
+                size *= 2
+
+
+def _iter_json(
+    reader: _JSONReader, path: Sequence[str], fields: Dict[str, Any]
+) -> Iterator[Any]:
+    if not path:
+        yield from _iter_json_array(reader)
+        return
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == path[0] and reader.peek() == (
+            "[" if len(path) == 1 else "{"
+        ):
+            child: Dict[str, Any] = {}
+            if len(path) > 1:
+                fields[key] = child
+            yield from _iter_json(reader, path[1:], child)
+        else:
+            fields[key] = reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+def _iter_json_array(reader: _JSONReader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def _iter_msgpack(
+    unpacker: msgpack.Unpacker, path: Sequence[str], fields: Dict[str, Any]
+) -> Iterator[Any]:
+    try:
+        if not path:
+            for _ in range(unpacker.read_array_header()):
+                yield unpacker.unpack()
+            return
+        for _ in range(unpacker.read_map_header()):
+            key = unpacker.unpack()
+            if key == path[0]:
+                child: Dict[str, Any] = {}
+                if len(path) > 1:
+                    fields[key] = child
+                yield from _iter_msgpack(unpacker, path[1:], child)
+            else:
+                fields[key] = unpacker.unpack()
+    except (ValueError, msgpack.OutOfData) as e:
+        raise error.ResponseStreamError(
+            "malformed msgpack response body"
+        ) from e
@@ -0,0 +1,262 @@
+"""
+Measure ABI encode/decode throughput of the optimized codec paths against
+a baseline: compiled layouts against rebuilding layouts and tuples on
+every call, bulk array conversion against element-wise lists, writing
+into one buffer against joining separately encoded values, lazy views
+against decoding every field, and LogDecoder against parsing indexer
+records one at a time with AtomicTransactionComposer.parse_result.
+
+Usage:
+    python -m benchmarks.abi_codec [--number N]
+"""
+
+import argparse
+import array
+import timeit
+from typing import Any, Callable, Dict, List
+
+import base64
+
+from algosdk import abi, account
+from algosdk.abi import vectorized
+from algosdk.abi.base_type import _type_from_string
+from algosdk.abi.log_decoder import ABI_RETURN_HASH
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+
+NESTED_TUPLE = (
+    "(uint64,(bool,bool,address,string),(uint8,bool,byte[4])[3],string[])"
+)
+
+
+def _nested_value() -> List[Any]:
+    addr = account.generate_account()[1]
+    return [
+        7,
+        [True, False, addr, "hello"],
+        [
+            [1, True, [1, 2, 3, 4]],
+            [2, False, [5, 6, 7, 8]],
+            [3, True, [0] * 4],
+        ],
+        ["a", "bc", "def"],
+    ]
+
+
+def _uncompiled(t: abi.TupleType) -> abi.TupleType:
+    # Drop the compiled layout so it is rebuilt on every call
+    t._compiled_layout = None
+    return t
+
+
+def cases() -> Dict[str, Dict[str, Callable[[], Any]]]:
+    nested = abi.ABIType.from_string(NESTED_TUPLE)
+    nested_value = _nested_value()
+    nested_bytes = nested.encode(nested_value)
+
+    uint_array = abi.ABIType.from_string("uint64[5000]")
+    uint_values = list(range(5000))
+    uint_bytes = uint_array.encode(uint_values)
+    uint_vector: Any = array.array("Q", uint_values)
+    if vectorized.numpy is not None:
+        uint_vector = vectorized.numpy.array(uint_values, dtype="uint64")
+
+    bool_array = abi.ABIType.from_string("bool[4096]")
+    bool_values = [i % 3 == 0 for i in range(4096)]
+    bool_bytes = bool_array.encode(bool_values)
+
+    string_array = abi.ABIType.from_string("string[]")
+    string_values = ["value-%d" % i for i in range(1000)]
+    string_bytes = string_array.encode(string_values)
+
+    record = abi.ABIType.from_string("(uint64,address,string,uint64[],bool)")
+    record_value = [
+        1,
+        nested_value[1][2],
+        "x" * 4096,
+        list(range(2000)),
+        True,
+    ]
+    record_bytes = record.encode(record_value)
+
+    records = [[i, nested_value[1][2], "r%d" % i] for i in range(500)]
+    record_type = abi.ABIType.from_string("(uint64,address,string)")
+
+    def encode_records_into() -> bytearray:
+        buffer = bytearray()
+        for r in records:
+            record_type.encode_into(buffer, len(buffer), r)
+        return buffer
+
+    swap = abi.Method.from_signature("swap(uint64,address)uint64")
+    swapped = abi.Event.from_signature("Swapped(address,uint64,uint64)")
+    pool = abi.Contract(
+        "Pool",
+        [abi.Method.from_signature("m%d()void" % i) for i in range(20)]
+        + [swap],
+        events=[swapped],
+    )
+    b64 = lambda b: base64.b64encode(b).decode()  # noqa: E731
+    app_txns = [
+        {
+            "id": "TX%d" % i,
+            "sender": nested_value[1][2],
+            "application-transaction": {
+                "application-id": 10,
+                "application-args": [
+                    b64(swap.get_selector()),
+                    b64(i.to_bytes(8, "big")),
+                    b64(bytes(32)),
+                ],
+            },
+            "logs": [
+                b64(
+                    swapped.get_selector()
+                    + swapped.args_type.encode([nested_value[1][2], i, i])
+                ),
+                b64(ABI_RETURN_HASH + i.to_bytes(8, "big")),
+            ],
+        }
+        for i in range(1000)
+    ]
+    log_decoder = abi.LogDecoder(pool)
+    atc = AtomicTransactionComposer()
+
+    def parse_one_by_one() -> List[Any]:
+        results = []
+        for txn in app_txns:
+            app_args = txn["application-transaction"]["application-args"]
+            selector = base64.b64decode(app_args[0])
+            method = next(
+                m for m in pool.methods if m.get_selector() == selector
+            )
+            arg_types = [arg.type for arg in method.args]
+            results.append(
+                [
+                    t.decode(base64.b64decode(a))
+                    for t, a in zip(arg_types, app_args[1:])
+                ]
+            )
+            for log in txn["logs"][:-1]:
+                raw = base64.b64decode(log)
+                for event in pool.events:
+                    if raw[:4] == event.get_selector():
+                        results.append(event.decode(raw))
+            results.append(atc.parse_result(method, txn["id"], txn))
+        return results
+
+    def read_two_fields(value: Any) -> Any:
+        return value[0], value[4]
+
+    def as_tuple(t: Any, n: int) -> abi.TupleType:
+        return abi.TupleType([t.child_type] * n)
+
+    return {
+        "from_string nested": {
+            "optimized": lambda: abi.ABIType.from_string(NESTED_TUPLE),
+            "baseline": lambda: _type_from_string.__wrapped__(NESTED_TUPLE),
+        },
+        "encode nested tuple": {
+            "optimized": lambda: nested.encode(nested_value),
+            "baseline": lambda: _uncompiled(nested).encode(nested_value),
+        },
+        "decode nested tuple": {
+            "optimized": lambda: nested.decode(nested_bytes),
+            "baseline": lambda: _uncompiled(nested).decode(nested_bytes),
+        },
+        "encode uint64[5000]": {
+            "optimized": lambda: uint_array.encode(uint_values),
+            "baseline": lambda: as_tuple(uint_array, 5000).encode(uint_values),
+        },
+        "decode uint64[5000]": {
+            "optimized": lambda: uint_array.decode(uint_bytes),
+            "baseline": lambda: as_tuple(uint_array, 5000).decode(uint_bytes),
+        },
+        "encode bool[4096]": {
+            "optimized": lambda: bool_array.encode(bool_values),
+            "baseline": lambda: as_tuple(bool_array, 4096).encode(bool_values),
+        },
+        "decode bool[4096]": {
+            "optimized": lambda: bool_array.decode(bool_bytes),
+            "baseline": lambda: as_tuple(bool_array, 4096).decode(bool_bytes),
+        },
+        "encode string[1000]": {
+            "optimized": lambda: string_array.encode(string_values),
+            "baseline": lambda: string_bytes[:2]
+            + as_tuple(string_array, 1000).encode(string_values),
+        },
+        "decode string[1000]": {
+            "optimized": lambda: string_array.decode(string_bytes),
+            "baseline": lambda: as_tuple(string_array, 1000).decode(
+                string_bytes[2:]
+            ),
+        },
+        "encode uint64[5000] vector": {
+            "optimized": lambda: uint_array.encode(uint_vector),
+            "baseline": lambda: uint_array.encode(uint_values),
+        },
+        "decode uint64[5000] vector": {
+            "optimized": lambda: uint_array.decode(uint_bytes, as_array=True),
+            "baseline": lambda: uint_array.decode(uint_bytes),
+        },
+        "decode bool[4096] vector": {
+            "optimized": lambda: bool_array.decode(bool_bytes, as_array=True),
+            "baseline": lambda: bool_array.decode(bool_bytes),
+        },
+        "encode 500 records": {
+            "optimized": encode_records_into,
+            "baseline": lambda: b"".join(
+                [record_type.encode(r) for r in records]
+            ),
+        },
+        "read 2 fields lazily": {
+            "optimized": lambda: read_two_fields(
+                abi.decode_view(record, record_bytes)
+            ),
+            "baseline": lambda: read_two_fields(record.decode(record_bytes)),
+        },
+        "decode 1000 app calls": {
+            "optimized": lambda: list(
+                log_decoder.decode_transactions(app_txns)
+            ),
+            "baseline": parse_one_by_one,
+        },
+    }
+
+
+def run(number: int) -> List[Dict[str, Any]]:
+    results = []
+    for name, variants in cases().items():
+        timings = {
+            mode: min(timeit.repeat(call, number=number, repeat=3)) / number
+            for mode, call in variants.items()
+        }
+        results.append(
+            {
+                "case": name,
+                "optimized_us": 1e6 * timings["optimized"],
+                "baseline_us": 1e6 * timings["baseline"],
+                "speedup": timings["baseline"] / timings["optimized"],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        "{:<28} {:>14} {:>14} {:>8}".format(
+            "case", "optimized us", "baseline us", "speedup"
+        )
+    )
+    for r in run(args.number):
+        print(
+            "{case:<28} {optimized_us:>14.1f} {baseline_us:>14.1f} "
+            "{speedup:>7.1f}x".format(**r)
+        )
+
+
+if __name__ == "__main__":
+    main()
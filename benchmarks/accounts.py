@@ -0,0 +1,67 @@
+"""
+Measure how many accounts per second can be generated with their mnemonics
+by account.generate_accounts, in this process and across worker processes,
+against calling account.generate_account and mnemonic.from_private_key for
+each account.
+
+Usage:
+    python -m benchmarks.accounts [--count N] [--processes P]
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+from algosdk import account, mnemonic
+
+
+def _rate(generate: Callable[[int], Any], count: int) -> float:
+    start = time.perf_counter()
+    generate(count)
+    return count / (time.perf_counter() - start)
+
+
+def _one_at_a_time(count: int) -> List[Any]:
+    accounts = []
+    for _ in range(count):
+        private_key, address = account.generate_account()
+        accounts.append(
+            (private_key, address, mnemonic.from_private_key(private_key))
+        )
+    return accounts
+
+
+def run(count: int, processes: int) -> List[Dict[str, Any]]:
+    cases: Dict[str, Callable[[int], Any]] = {
+        "generate_account": _one_at_a_time,
+        "generate_accounts (1 process)": lambda n: list(
+            account.generate_accounts(n, with_mnemonics=True, processes=1)
+        ),
+        "generate_accounts ({} processes)".format(processes): lambda n: list(
+            account.generate_accounts(
+                n, with_mnemonics=True, processes=processes
+            )
+        ),
+    }
+    rates = {name: _rate(generate, count) for name, generate in cases.items()}
+    baseline = rates["generate_account"]
+    return [
+        {"case": name, "per_s": rate, "speedup": rate / baseline}
+        for name, rate in rates.items()
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print("{:<34} {:>12} {:>8}".format("case", "accounts/s", "speedup"))
+    for r in run(args.count, args.processes):
+        print("{case:<34} {per_s:>12.0f} {speedup:>7.1f}x".format(**r))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Measure the request path of AlgodClient and IndexerClient (headers, URL
+encoding, HTTP round trip and JSON parsing) against the local stand-in,
+reporting requests per second and latency percentiles per endpoint, for a
+single synchronous caller and for a pool of threads sharing one client.
+
+Each worker issues requests back to back for --duration seconds, so with
+--latency set the threaded mode shows how well the client overlaps waits
+on the node.
+
+Usage:
+    python -m benchmarks.client_load [--duration S] [--threads N]
+        [--latency MS] [--size N] [--recording FILE]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence
+
+from algosdk import encoding, transaction
+from algosdk.v2client import algod, indexer
+
+from benchmarks.stand_in import (
+    SAMPLE_TXID,
+    StandInServer,
+    load_recording,
+    sample_routes,
+)
+
+
+def _signed_payment() -> str:
+    sp = transaction.SuggestedParams(
+        1000, 1000, 2000, "A" * 43 + "=", "testnet-v1.0", flat_fee=True
+    )
+    sender = encoding.encode_address(bytes(32))
+    txn = transaction.PaymentTxn(sender, sp, sender, 1000)
+    return encoding.msgpack_encode(
+        transaction.SignedTransaction(txn, "A" * 86 + "==")
+    )
+
+
+def _calls(url: str) -> Dict[str, Callable[[], Any]]:
+    acl = algod.AlgodClient("a" * 64, url)
+    icl = indexer.IndexerClient("", url)
+    signed = _signed_payment()
+    return {
+        "status": lambda: acl.status(),
+        "suggested_params": lambda: acl.suggested_params(),
+        "send_raw_transaction": lambda: acl.send_raw_transaction(signed),
+        "pending_transaction_info": lambda: acl.pending_transaction_info(
+            SAMPLE_TXID
+        ),
+        "block_info": lambda: acl.block_info(1500),
+        "search_transactions": lambda: icl.search_transactions(),
+        "search_accounts": lambda: icl.accounts(),
+    }
+
+
+def _worker(call: Callable[[], Any], deadline: float) -> List[float]:
+    latencies: List[float] = []
+    while True:
+        start = time.perf_counter()
+        if start >= deadline:
+            return latencies
+        call()
+        latencies.append(time.perf_counter() - start)
+
+
+def _percentile(ordered: Sequence[float], percent: float) -> float:
+    # Nearest rank, as in BatchExecutionReport.latency_percentiles
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def load(
+    call: Callable[[], Any], threads: int, duration: float
+) -> Dict[str, float]:
+    """
+    Issue requests from `threads` workers for `duration` seconds.
+
+    Returns:
+        dict: requests, requests per second, and p50/p90/p99 latency in ms
+    """
+    start = time.perf_counter()
+    deadline = start + duration
+    if threads == 1:
+        latencies = _worker(call, deadline)
+    else:
+        with ThreadPoolExecutor(threads) as pool:
+            futures = [
+                pool.submit(_worker, call, deadline) for _ in range(threads)
+            ]
+            latencies = [t for f in futures for t in f.result()]
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "per_s": len(latencies) / elapsed,
+        **{
+            "p{}".format(p): 1000 * _percentile(latencies, p)
+            for p in (50, 90, 99)
+        },
+    }
+
+
+def run(
+    duration: float,
+    threads: int,
+    latency: float,
+    size: int,
+    recording: str = "",
+) -> List[Dict[str, Any]]:
+    routes = sample_routes(size)
+    if recording:
+        routes.update(load_recording(recording))
+    results: List[Dict[str, Any]] = []
+    with StandInServer(routes, latency=latency) as server:
+        for name, call in _calls(server.url).items():
+            call()  # warm up
+            for mode, n in (
+                ("sync", 1),
+                ("threads x{}".format(threads), threads),
+            ):
+                results.append(
+                    {"endpoint": name, "mode": mode, **load(call, n, duration)}
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="ms per response"
+    )
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument(
+        "--recording",
+        default="",
+        help="replay responses saved with stand_in.save_recording",
+    )
+    args = parser.parse_args()
+
+    print(
+        "{:<26} {:<11} {:>9} {:>9} {:>8} {:>8} {:>8}".format(
+            "endpoint",
+            "mode",
+            "requests",
+            "req/s",
+            "p50 ms",
+            "p90 ms",
+            "p99 ms",
+        )
+    )
+    for r in run(
+        args.duration,
+        args.threads,
+        args.latency / 1000,
+        args.size,
+        args.recording,
+    ):
+        print(
+            "{endpoint:<26} {mode:<11} {requests:>9} {per_s:>9.0f} "
+            "{p50:>8.2f} {p90:>8.2f} {p99:>8.2f}".format(**r)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Compare bytes over the wire and wall time for large algod and indexer
+responses with and without negotiated gzip/deflate compression.
+
+Usage:
+    python -m benchmarks.compression [--repeat N] [--size N]
+"""
+
+import argparse
+import base64
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+from algosdk import account
+from algosdk.v2client import algod, indexer
+
+from benchmarks.stand_in import StandInServer
+
+
+def _addresses(n: int) -> List[str]:
+    return [account.generate_account()[1] for _ in range(n)]
+
+
+def make_payloads(size: int) -> Dict[str, Any]:
+    """Build realistic-looking large responses keyed by request path."""
+    addrs = _addresses(64)
+    txns = [
+        {
+            "id": base64.b32encode(os.urandom(32)).decode().strip("="),
+            "sender": addrs[i % len(addrs)],
+            "fee": 1000,
+            "first-valid": 1000 + i,
+            "last-valid": 2000 + i,
+            "tx-type": "pay",
+            "payment-transaction": {
+                "receiver": addrs[(i + 1) % len(addrs)],
+                "amount": i * 7,
+            },
+            "note": base64.b64encode(os.urandom(16)).decode(),
+        }
+        for i in range(size)
+    ]
+    account_path = "/v2/accounts/" + addrs[0]
+    return {
+        "/v2/blocks/1": {
+            "block": {
+                "rnd": 1,
+                "txns": [
+                    {"txn": {"snd": t["sender"], "fee": 1000}} for t in txns
+                ],
+            }
+        },
+        account_path: {
+            "address": addrs[0],
+            "amount": 10**12,
+            "assets": [
+                {"asset-id": i, "amount": i * 100, "is-frozen": False}
+                for i in range(size)
+            ],
+        },
+        "/v2/applications/1/boxes": {
+            "boxes": [
+                {"name": base64.b64encode(i.to_bytes(8, "big")).decode()}
+                for i in range(size)
+            ]
+        },
+        "/v2/transactions": {"current-round": 1, "transactions": txns},
+        "/v2/transactions/pending": {
+            "top-transactions": [
+                {"txn": {"snd": t["sender"], "fee": 1000}} for t in txns
+            ],
+            "total-transactions": size,
+        },
+    }
+
+
+def _calls(
+    url: str, payloads: Dict[str, Any], headers: Dict[str, str]
+) -> Dict[str, Callable[[], Any]]:
+    acl = algod.AlgodClient("a" * 64, url, headers=headers)
+    icl = indexer.IndexerClient("", url, headers=headers)
+    addr = next(p for p in payloads if p.startswith("/v2/accounts/"))
+    return {
+        "block_info": lambda: acl.block_info(1),
+        "account_info": lambda: acl.account_info(addr.rsplit("/", 1)[1]),
+        "application_boxes": lambda: acl.application_boxes(1),
+        "pending_transactions": lambda: acl.pending_transactions(),
+        "search_transactions": lambda: icl.search_transactions(),
+    }
+
+
+def run(size: int, repeat: int) -> List[Dict[str, Any]]:
+    payloads = make_payloads(size)
+    results = []
+    for label, compress, headers in (
+        ("identity", False, {"Accept-Encoding": "identity"}),
+        ("gzip", True, {}),
+        ("deflate", True, {"Accept-Encoding": "deflate"}),
+    ):
+        with StandInServer(payloads, compress=compress) as server:
+            for name, call in _calls(server.url, payloads, headers).items():
+                call()  # warm up
+                server.bytes_sent = 0
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    call()
+                elapsed = time.perf_counter() - start
+                results.append(
+                    {
+                        "endpoint": name,
+                        "encoding": label,
+                        "bytes": server.bytes_sent // repeat,
+                        "ms": 1000 * elapsed / repeat,
+                    }
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        "{:<22} {:<9} {:>12} {:>10}".format(
+            "endpoint", "encoding", "bytes", "ms/call"
+        )
+    )
+    for r in run(args.size, args.repeat):
+        print(
+            "{endpoint:<22} {encoding:<9} {bytes:>12} {ms:>10.2f}".format(**r)
+        )
+
+
+if __name__ == "__main__":
+    main()
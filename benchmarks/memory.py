@@ -0,0 +1,260 @@
+"""
+Measure the memory held by large decoded datasets: signed transactions
+decoded with encoding.msgpack_decode, models.Account objects built from
+JSON account records, and blocks decoded from msgpack the way the SDK
+decodes them when confirming transactions.
+
+For each dataset the inputs are built before tracing starts, so only the
+memory allocated while decoding is counted. Steady-state memory is what the
+decoded objects still hold after a garbage collection; peak memory includes
+temporaries freed during decoding. Both are reported in total and per
+object as measured by tracemalloc, which slows decoding down severalfold,
+so the seconds column is only a guide to how long a run takes.
+
+Usage:
+    python -m benchmarks.memory [--scale F] [--dataset NAME] [--json]
+
+The default sizes are 1M transactions, 100k accounts and 10k blocks;
+--scale 0.01 gives a quick run.
+"""
+
+import argparse
+import base64
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import msgpack
+
+from algosdk import encoding, transaction
+from algosdk.v2client import models
+
+# Objects in each dataset at --scale 1
+SIZES = {"transactions": 1_000_000, "accounts": 100_000, "blocks": 10_000}
+
+# Transactions in each generated block
+BLOCK_TXNS = 25
+
+
+def _address(i: int) -> str:
+    return encoding.encode_address(i.to_bytes(32, "big"))
+
+
+def _signed_txn_dicts() -> List[Dict[str, Any]]:
+    # One payment and one asset transfer to vary from
+    sp = transaction.SuggestedParams(
+        1000, 1000, 2000, "A" * 43 + "=", "mainnet-v1.0", flat_fee=True
+    )
+    sender = _address(1)
+    txns = [
+        transaction.PaymentTxn(sender, sp, _address(2), 1000, note=b"x"),
+        transaction.AssetTransferTxn(sender, sp, _address(2), 1000, 31566704),
+    ]
+    return [
+        transaction.SignedTransaction(txn, "A" * 86 + "==").dictify()
+        for txn in txns
+    ]
+
+
+def _varied_txn(templates: List[Dict[str, Any]], i: int) -> Dict[str, Any]:
+    # Distinct receivers, amounts and rounds, as in real traffic
+    signed = templates[i % len(templates)]
+    txn = dict(signed["txn"])
+    txn["fv"] = 1000 + i
+    txn["lv"] = 2000 + i
+    if txn["type"] == "pay":
+        txn["rcv"] = i.to_bytes(32, "big")
+        txn["amt"] = 1000 + i
+        txn["note"] = i.to_bytes(16, "big")
+    else:
+        txn["arcv"] = i.to_bytes(32, "big")
+        txn["aamt"] = 1000 + i
+    return {"sig": signed["sig"], "txn": txn}
+
+
+def transaction_inputs(count: int) -> List[str]:
+    templates = _signed_txn_dicts()
+    return [
+        base64.b64encode(
+            msgpack.packb(_varied_txn(templates, i), use_bin_type=True)
+        ).decode()
+        for i in range(count)
+    ]
+
+
+def decode_transactions(inputs: List[str]) -> List[Any]:
+    return [encoding.msgpack_decode(enc) for enc in inputs]
+
+
+def account_inputs(count: int) -> List[bytes]:
+    return [
+        json.dumps(
+            {
+                "address": _address(i),
+                "amount": 10**9 + i,
+                "amount-without-pending-rewards": 10**9 + i,
+                "pending-rewards": 0,
+                "reward-base": 27521,
+                "rewards": 0,
+                "round": 40_000_000,
+                "status": "Offline",
+                "assets": [
+                    {"amount": i, "asset-id": 31566704, "is-frozen": False},
+                    {"amount": 7 * i, "asset-id": 312769, "is-frozen": False},
+                ],
+            }
+        ).encode()
+        for i in range(count)
+    ]
+
+
+def build_accounts(inputs: List[bytes]) -> List[models.Account]:
+    accounts = []
+    for record in inputs:
+        d = json.loads(record)
+        accounts.append(
+            models.Account(
+                address=d["address"],
+                amount=d["amount"],
+                amount_without_pending_rewards=d[
+                    "amount-without-pending-rewards"
+                ],
+                pending_rewards=d["pending-rewards"],
+                reward_base=d["reward-base"],
+                rewards=d["rewards"],
+                round=d["round"],
+                status=d["status"],
+                assets=[
+                    models.AssetHolding(
+                        amount=a["amount"],
+                        asset_id=a["asset-id"],
+                        is_frozen=a["is-frozen"],
+                    )
+                    for a in d["assets"]
+                ],
+            )
+        )
+    return accounts
+
+
+def block_inputs(count: int) -> List[bytes]:
+    templates = _signed_txn_dicts()
+    blocks = []
+    for rnd in range(count):
+        txns = []
+        for j in range(BLOCK_TXNS):
+            stxn = _varied_txn(templates, rnd * BLOCK_TXNS + j)
+            # Blocks leave out the genesis hash and mark it with "hgi"
+            del stxn["txn"]["gh"]
+            txns.append({**stxn, "hgi": True})
+        block = {
+            "block": {
+                "rnd": rnd,
+                "ts": 1_700_000_000 + rnd,
+                "prev": rnd.to_bytes(32, "big"),
+                "seed": rnd.to_bytes(32, "little"),
+                "txn": bytes(32),
+                "txns": txns,
+            }
+        }
+        blocks.append(msgpack.packb(block, use_bin_type=True))
+    return blocks
+
+
+def decode_blocks(inputs: List[bytes]) -> List[Any]:
+    return [
+        msgpack.unpackb(block, raw=True, strict_map_key=False)
+        for block in inputs
+    ]
+
+
+DATASETS: Dict[str, Any] = {
+    "transactions": (transaction_inputs, decode_transactions),
+    "accounts": (account_inputs, build_accounts),
+    "blocks": (block_inputs, decode_blocks),
+}
+
+
+def measure(
+    make_inputs: Callable[[int], List[Any]],
+    decode: Callable[[List[Any]], List[Any]],
+    count: int,
+) -> Dict[str, float]:
+    """
+    Decode `count` objects under tracemalloc, returning the steady-state and
+    peak memory they took, in total (MiB) and per object (bytes).
+    """
+    inputs = make_inputs(count)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = decode(inputs)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    steady, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return {
+        "objects": count,
+        "steady_mib": steady / 2**20,
+        "peak_mib": peak / 2**20,
+        "steady_per_object": steady / count,
+        "peak_per_object": peak / count,
+        "seconds": elapsed,
+    }
+
+
+def run(scale: float, datasets: List[str]) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for name in datasets:
+        make_inputs, decode = DATASETS[name]
+        count = max(1, int(SIZES[name] * scale))
+        results.append(
+            {"dataset": name, **measure(make_inputs, decode, count)}
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument(
+        "--dataset",
+        action="append",
+        choices=sorted(DATASETS),
+        help="dataset to measure; may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print results as JSON"
+    )
+    args = parser.parse_args()
+
+    results = run(args.scale, args.dataset or list(DATASETS))
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+    print(
+        "{:<13} {:>9} {:>11} {:>10} {:>11} {:>10} {:>8}".format(
+            "dataset",
+            "objects",
+            "steady MiB",
+            "peak MiB",
+            "steady B/o",
+            "peak B/o",
+            "seconds",
+        )
+    )
+    for r in results:
+        print(
+            "{dataset:<13} {objects:>9} {steady_mib:>11.1f} "
+            "{peak_mib:>10.1f} {steady_per_object:>11.0f} "
+            "{peak_per_object:>10.0f} {seconds:>8.2f}".format(**r)
+        )
+
+
+if __name__ == "__main__":
+    main()
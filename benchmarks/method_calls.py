@@ -0,0 +1,130 @@
+"""
+Measure how many method calls per second can be added to atomic groups
+from a precompiled MethodCallTemplate against building each one with
+AtomicTransactionComposer.add_method_call.
+
+Usage:
+    python -m benchmarks.method_calls [--calls N]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from algosdk import abi, account, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    MethodCallTemplate,
+)
+
+
+def _throughput(
+    add: Callable[[AtomicTransactionComposer, int], Any], n: int
+) -> float:
+    # Fill composers up to the group size limit, as a bot submitting
+    # full groups would
+    start = time.perf_counter()
+    atc = AtomicTransactionComposer()
+    for i in range(n):
+        if atc.get_tx_count() == atc.MAX_GROUP_SIZE:
+            atc = AtomicTransactionComposer()
+        add(atc, i)
+    return n / (time.perf_counter() - start)
+
+
+def cases() -> Dict[str, Dict[str, Any]]:
+    others = [account.generate_account()[1] for _ in range(3)]
+    flat = transaction.SuggestedParams(
+        1000, 1, 1000, "A" * 43 + "=", "testnet-v1.0", flat_fee=True
+    )
+    estimated = transaction.SuggestedParams(
+        0, 1, 1000, "A" * 43 + "=", "testnet-v1.0"
+    )
+    many = ",".join(["uint64"] * 12 + ["string"] * 8)
+    return {
+        "swap(uint64,uint64)": {
+            "method": "swap(uint64,uint64)uint64",
+            "args": lambda i: [i, 2 * i],
+            "sp": flat,
+            "fixed": {},
+        },
+        "refs + boxes": {
+            "method": "settle(account,asset,application,byte[32])void",
+            "args": lambda i: [others[i % 3], 10 + i % 4, 7, bytes(32)],
+            "sp": flat,
+            "fixed": {
+                "accounts": others[:1],
+                "foreign_apps": [7],
+                "boxes": [(7, b"book"), (0, b"state")],
+            },
+        },
+        "20 args": {
+            "method": "batch({})void".format(many),
+            "args": lambda i: list(range(12)) + ["v%d" % i] * 8,
+            "sp": flat,
+            "fixed": {},
+        },
+        "estimated fee": {
+            "method": "swap(uint64,uint64)uint64",
+            "args": lambda i: [i, 2 * i],
+            "sp": estimated,
+            "fixed": {},
+        },
+    }
+
+
+def run(calls: int) -> List[Dict[str, Any]]:
+    sender = account.generate_account()[1]
+    results = []
+    for name, case in cases().items():
+        method = abi.Method.from_signature(case["method"])
+        signer = AccountTransactionSigner(account.generate_account()[0])
+        fixed = dict(app_id=5, method=method, sender=sender, signer=signer)
+        fixed.update(case["fixed"])
+        template = MethodCallTemplate(**fixed)
+        args, sp = case["args"], case["sp"]
+
+        def with_template(atc: AtomicTransactionComposer, i: int) -> Any:
+            return atc.add_template_call(template, sp, args(i))
+
+        def with_add_method_call(atc: AtomicTransactionComposer, i: int):
+            return atc.add_method_call(sp=sp, method_args=args(i), **fixed)
+
+        rates: Dict[str, float] = {"template": 0.0, "add_method_call": 0.0}
+        for _ in range(3):
+            for mode, add in (
+                ("template", with_template),
+                ("add_method_call", with_add_method_call),
+            ):
+                rates[mode] = max(rates[mode], _throughput(add, calls))
+        results.append(
+            {
+                "case": name,
+                "template": rates["template"],
+                "add_method_call": rates["add_method_call"],
+                "speedup": rates["template"] / rates["add_method_call"],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(
+        "{:<22} {:>14} {:>18} {:>8}".format(
+            "case", "template/s", "add_method_call/s", "speedup"
+        )
+    )
+    for r in run(args.calls):
+        print(
+            "{case:<22} {template:>14.0f} {add_method_call:>18.0f} "
+            "{speedup:>7.1f}x".format(**r)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Micro-benchmarks of the encoding, hashing and signing hot paths, with
+machine-readable results and a baseline comparison for catching
+performance regressions.
+
+Each case is calibrated to run for about --min-time seconds per repeat and
+is reported as the fastest of --repeat repeats in nanoseconds per call,
+which is the least noisy estimate on a busy machine.
+
+Usage:
+    python -m benchmarks.micro [--filter REGEX] [--output results.json]
+    python -m benchmarks.micro --baseline results.json [--threshold 0.1]
+
+With --baseline, every case slower than its baseline by more than
+--threshold (a fraction) is reported, and the exit status is 1 if any is.
+"""
+
+import argparse
+import base64
+import itertools
+import json
+import platform
+import re
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from nacl.signing import SigningKey
+
+from algosdk import abi, encoding, logic, transaction
+
+# Format of the results written with --output
+RESULTS_VERSION = 1
+
+
+def _account(seed: int) -> Tuple[str, str]:
+    # Fixed keys, so that every run benchmarks exactly the same bytes
+    sk = SigningKey(bytes([seed]) * 32)
+    vk = sk.verify_key.encode()
+    return (
+        base64.b64encode(sk.encode() + vk).decode(),
+        encoding.encode_address(vk),
+    )
+
+
+def _params() -> transaction.SuggestedParams:
+    return transaction.SuggestedParams(
+        1000, 1, 1000, "A" * 43 + "=", "testnet-v1.0", flat_fee=True
+    )
+
+
+def _transactions() -> Dict[str, transaction.Transaction]:
+    _, sender = _account(1)
+    _, receiver = _account(2)
+    sp = _params()
+    key = base64.b64encode(bytes(range(32))).decode()
+    return {
+        "payment": transaction.PaymentTxn(
+            sender, sp, receiver, 1_000_000, note=b"benchmark"
+        ),
+        "keyreg": transaction.KeyregOnlineTxn(
+            sender,
+            sp,
+            votekey=key,
+            selkey=key,
+            votefst=1,
+            votelst=100_000,
+            votekd=1000,
+            sprfkey=base64.b64encode(bytes(64)).decode(),
+        ),
+        "asset_config": transaction.AssetCreateTxn(
+            sender,
+            sp,
+            total=10**12,
+            decimals=6,
+            default_frozen=False,
+            unit_name="BNCH",
+            asset_name="Benchmark",
+            manager=sender,
+            reserve=sender,
+            url="https://example.com",
+        ),
+        "asset_transfer": transaction.AssetTransferTxn(
+            sender, sp, receiver, 500, 12345
+        ),
+        "asset_freeze": transaction.AssetFreezeTxn(
+            sender, sp, 12345, receiver, True
+        ),
+        "application_call": transaction.ApplicationCallTxn(
+            sender,
+            sp,
+            7,
+            transaction.OnComplete.NoOpOC,
+            app_args=[b"\x01\x02\x03\x04", (42).to_bytes(8, "big")],
+            accounts=[receiver],
+            foreign_apps=[8],
+            foreign_assets=[12345],
+            boxes=[(7, b"box")],
+        ),
+    }
+
+
+def _abi_cases() -> Dict[str, Any]:
+    _, addr = _account(3)
+    return {
+        "uint64": 2**63 + 5,
+        "string": "benchmark" * 4,
+        "byte[32]": bytes(range(32)),
+        "uint64[]": list(range(64)),
+        "(uint64,address,string,bool[])": [
+            7,
+            addr,
+            "benchmark",
+            [True, False] * 8,
+        ],
+        "(uint8,(bool,bool),address[2])[4]": [
+            [i, [True, False], [addr, addr]] for i in range(4)
+        ],
+    }
+
+
+def _cold_cases() -> Dict[str, Callable[[], Any]]:
+    # Cycle through more distinct addresses than the address caches hold,
+    # so that every conversion misses them as with first-seen addresses
+    count = 2 * encoding.ADDRESS_CACHE_SIZE
+    raw = [i.to_bytes(32, "big") for i in range(count)]
+    addrs = [encoding.encode_address(b) for b in raw]
+    sp = _params()
+    payments = [
+        transaction.PaymentTxn(a, sp, a, 1_000_000, note=b"benchmark")
+        for a in addrs
+    ]
+    encoded = [encoding.msgpack_encode(txn) for txn in payments]
+    next_raw = itertools.cycle(raw).__next__
+    next_addr = itertools.cycle(addrs).__next__
+    next_payment = itertools.cycle(payments).__next__
+    next_encoded = itertools.cycle(encoded).__next__
+    return {
+        "encode_address/cold": lambda: encoding.encode_address(next_raw()),
+        "decode_address/cold": lambda: encoding.decode_address(next_addr()),
+        "msgpack_encode/payment/cold": lambda: (
+            encoding.msgpack_encode(next_payment())
+        ),
+        "msgpack_decode/payment/cold": lambda: (
+            encoding.msgpack_decode(next_encoded())
+        ),
+        "get_txid/payment/cold": lambda: next_payment().get_txid(),
+    }
+
+
+def cases() -> Dict[str, Callable[[], Any]]:
+    """
+    Build every benchmark case, keyed by a stable name.
+    """
+    result: Dict[str, Callable[[], Any]] = {}
+    sk, addr = _account(1)
+    txns = _transactions()
+    for name, txn in txns.items():
+        encoded = encoding.msgpack_encode(txn)
+        result["msgpack_encode/" + name] = lambda t=txn: (
+            encoding.msgpack_encode(t)
+        )
+        result["msgpack_decode/" + name] = lambda e=encoded: (
+            encoding.msgpack_decode(e)
+        )
+        result["get_txid/" + name] = lambda t=txn: t.get_txid()
+
+    payment = txns["payment"]
+    signed = payment.sign(sk)
+    encoded_signed = encoding.msgpack_encode(signed)
+    result["sign/payment"] = lambda: payment.sign(sk)
+    result["msgpack_encode/signed_payment"] = lambda: (
+        encoding.msgpack_encode(signed)
+    )
+    result["msgpack_decode/signed_payment"] = lambda: (
+        encoding.msgpack_decode(encoded_signed)
+    )
+    group = [txns["payment"]] * 16
+    result["calculate_group_id/16"] = lambda: (
+        transaction.calculate_group_id(group)
+    )
+
+    address_bytes = encoding.decode_address(addr)
+    result["encode_address"] = lambda: encoding.encode_address(address_bytes)
+    result["decode_address"] = lambda: encoding.decode_address(addr)
+    result.update(_cold_cases())
+    msig = transaction.Multisig(
+        1, 3, [_account(seed)[1] for seed in range(4, 9)]
+    )
+    result["multisig_address/3-of-5"] = lambda: msig.address()
+    program = b"\x06\x81\x01" + bytes(200)
+    result["logic_address/203B"] = lambda: logic.address(program)
+
+    for type_str, value in _abi_cases().items():
+        abi_type = abi.ABIType.from_string(type_str)
+        encoded_value = abi_type.encode(value)
+        result["abi_encode/" + type_str] = lambda t=abi_type, v=value: (
+            t.encode(v)
+        )
+        result["abi_decode/" + type_str] = (
+            lambda t=abi_type, e=encoded_value: t.decode(e)
+        )
+    return result
+
+
+def measure(call: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """
+    Time a call, returning the fastest of `repeat` runs in nanoseconds per
+    call.
+    """
+    timer = timeit.Timer(call)
+    number, elapsed = timer.autorange()
+    # autorange stops at 0.2s; scale the loop count to min_time
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return 1e9 * best / number
+
+
+def run(
+    pattern: Optional[str] = None, repeat: int = 5, min_time: float = 0.2
+) -> Dict[str, Any]:
+    """
+    Run the cases whose names match `pattern`, returning results in the
+    format written with --output.
+    """
+    selected = {
+        name: call
+        for name, call in cases().items()
+        if pattern is None or re.search(pattern, name)
+    }
+    return {
+        "version": RESULTS_VERSION,
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": {
+            name: {"ns_per_call": round(measure(call, repeat, min_time), 1)}
+            for name, call in sorted(selected.items())
+        },
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare results against a baseline, case by case.
+
+    Returns:
+        list[dict]: one row per case in both, with the ratio of current to
+            baseline time and whether it regressed past `threshold`
+    """
+    rows = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["ns_per_call"]
+        after = result["ns_per_call"]
+        ratio = after / before
+        rows.append(
+            {
+                "case": name,
+                "baseline_ns": before,
+                "ns": after,
+                "ratio": ratio,
+                "regressed": ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--filter", help="only run cases matching REGEX")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output", help="write results as JSON to a file")
+    parser.add_argument("--baseline", help="compare with results in a file")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument(
+        "--json", action="store_true", help="print results as JSON"
+    )
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if not args.baseline:
+        if args.json:
+            print(json.dumps(results, indent=2, sort_keys=True))
+            return
+        print("{:<44} {:>12}".format("case", "ns/call"))
+        for name, result in results["results"].items():
+            print("{:<44} {:>12.1f}".format(name, result["ns_per_call"]))
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.threshold)
+    if args.json:
+        print(json.dumps(rows, indent=2, sort_keys=True))
+    else:
+        print(
+            "{:<44} {:>12} {:>12} {:>7}".format(
+                "case", "baseline ns", "ns", "ratio"
+            )
+        )
+        for row in rows:
+            print(
+                "{case:<44} {baseline_ns:>12.1f} {ns:>12.1f} "
+                "{ratio:>6.2f}x{flag}".format(
+                    flag="  REGRESSED" if row["regressed"] else "", **row
+                )
+            )
+    if any(row["regressed"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
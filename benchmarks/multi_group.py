@@ -0,0 +1,182 @@
+"""
+Measure running many method call groups with execute_batch against calling
+AtomicTransactionComposer.execute on each group in turn, on an in-process
+chain that closes a round at a fixed interval and adds a fixed latency to
+every request.
+
+Usage:
+    python -m benchmarks.multi_group [--groups N] [--round-time S]
+"""
+
+import argparse
+import base64
+import threading
+import time
+from typing import Any, Dict, List
+
+import msgpack
+
+from algosdk import abi, account, transaction
+from algosdk.abi.log_decoder import ABI_RETURN_HASH
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    execute_batch,
+)
+
+
+class SimulatedChain:
+    """
+    Algod client stand-in confirming every sent transaction in the round
+    after the one it was sent in. Method calls log their note as the return
+    value.
+    """
+
+    def __init__(self, round_time: float, request_latency: float) -> None:
+        self.round_time = round_time
+        self.request_latency = request_latency
+        self.start = time.monotonic()
+        self.rounds: Dict[int, List[transaction.SignedTransaction]] = {}
+        self.confirmed: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def _request(self) -> int:
+        time.sleep(self.request_latency)
+        return int((time.monotonic() - self.start) / self.round_time)
+
+    def status(self, **kwargs) -> Dict[str, Any]:
+        return {"last-round": self._request()}
+
+    def status_after_block(self, round_num: int, **kwargs) -> Dict[str, Any]:
+        last_round = self._request()
+        if last_round <= round_num:
+            time.sleep(
+                self.start
+                + (round_num + 1) * self.round_time
+                - time.monotonic()
+            )
+        return {"last-round": max(last_round, round_num + 1)}
+
+    def send_transactions(self, stxns, **kwargs) -> str:
+        round_num = self._request() + 1
+        with self.lock:
+            for stxn in stxns:
+                self.rounds.setdefault(round_num, []).append(stxn)
+                self.confirmed[stxn.get_txid()] = round_num
+        return stxns[0].get_txid()
+
+    def pending_transaction_info(self, tx_id: str, **kwargs):
+        last_round = self._request()
+        round_num = self.confirmed[tx_id]
+        if round_num > last_round:
+            return {"confirmed-round": 0}
+        with self.lock:
+            stxn = next(
+                s for s in self.rounds[round_num] if s.get_txid() == tx_id
+            )
+        log = ABI_RETURN_HASH + (stxn.transaction.note or b"")
+        return {
+            "confirmed-round": round_num,
+            "logs": [base64.b64encode(log).decode()],
+        }
+
+    def get_block_txids(self, round_num: int, **kwargs):
+        self._request()
+        with self.lock:
+            stxns = list(self.rounds.get(round_num, []))
+        return {"blockTxids": [s.get_txid() for s in stxns]}
+
+    def block_info(self, round_num: int, response_format="json", **kwargs):
+        self._request()
+        with self.lock:
+            stxns = list(self.rounds.get(round_num, []))
+        payset = [
+            {
+                "txn": {},
+                "dt": {"lg": [ABI_RETURN_HASH + (s.transaction.note or b"")]},
+            }
+            for s in stxns
+        ]
+        return msgpack.packb({"block": {"txns": payset}}, use_bin_type=True)
+
+
+def _composers(count: int, calls: int) -> List[AtomicTransactionComposer]:
+    sk, sender = account.generate_account()
+    signer = AccountTransactionSigner(sk)
+    method = abi.Method.from_signature("echo(uint64)uint64")
+    sp = transaction.SuggestedParams(
+        1000, 1, 1000, "A" * 43 + "=", "testnet-v1.0", flat_fee=True
+    )
+    composers = []
+    for i in range(count):
+        atc = AtomicTransactionComposer()
+        for j in range(calls):
+            value = i * calls + j
+            atc.add_method_call(
+                5,
+                method,
+                sender,
+                sp,
+                signer,
+                [value],
+                note=value.to_bytes(8, "big"),
+            )
+        composers.append(atc)
+    return composers
+
+
+def run(
+    groups: int, round_time: float, request_latency: float
+) -> List[Dict[str, Any]]:
+    results = []
+    client = SimulatedChain(round_time, request_latency)
+    start = time.perf_counter()
+    for atc in _composers(groups, 4):
+        atc.execute(client, 10)  # type: ignore[arg-type]
+    elapsed = time.perf_counter() - start
+    results.append(
+        {
+            "mode": "execute",
+            "groups_per_s": groups / elapsed,
+            "p50": float("nan"),
+            "p99": float("nan"),
+        }
+    )
+
+    client = SimulatedChain(round_time, request_latency)
+    report = execute_batch(
+        client, _composers(groups, 4), 10  # type: ignore[arg-type]
+    ).wait()
+    percentiles = report.latency_percentiles((50, 99))
+    results.append(
+        {
+            "mode": "execute_batch",
+            "groups_per_s": report.throughput,
+            "p50": percentiles[50],
+            "p99": percentiles[99],
+        }
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--round-time", type=float, default=0.2)
+    parser.add_argument("--request-latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    print(
+        "{:<16} {:>10} {:>10} {:>10}".format(
+            "mode", "groups/s", "p50 s", "p99 s"
+        )
+    )
+    for r in run(args.groups, args.round_time, args.request_latency):
+        print(
+            "{mode:<16} {groups_per_s:>10.1f} {p50:>10.3f} "
+            "{p99:>10.3f}".format(**r)
+        )
+
+
+if __name__ == "__main__":
+    main()
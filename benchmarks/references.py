@@ -0,0 +1,184 @@
+"""
+Measure foreign array, access list and box reference population against
+the list-scanning implementations they replaced, at the per-transaction
+reference limits, for a full group's worth of references pooled together,
+and for larger reference sets.
+
+Usage:
+    python -m benchmarks.references [--number N]
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from algosdk import account, app_access, constants, encoding, error
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    index_foreign_array,
+    populate_foreign_array,
+)
+from algosdk.box_reference import BoxReference
+
+MAX_TXN_REFERENCES = constants.APP_MAX_REFERENCES
+MAX_ACCESS_ENTRIES = constants.APP_MAX_ACCESS
+GROUP_SIZE = AtomicTransactionComposer.MAX_GROUP_SIZE
+
+
+def _baseline_populate(
+    value: Any, foreign_array: List[Any], zero_value: Optional[Any] = None
+) -> int:
+    if zero_value is not None and value == zero_value:
+        return 0
+    offset = 0 if zero_value is None else 1
+    if value in foreign_array:
+        return foreign_array.index(value) + offset
+    foreign_array.append(value)
+    return offset + len(foreign_array) - 1
+
+
+def _baseline_access(
+    accounts: List[str],
+    foreign_apps: List[int],
+    holdings: List[Tuple[int, str]],
+) -> List[app_access.ResourceReference]:
+    access: List[app_access.ResourceReference] = []
+
+    def ensure(target: app_access.ResourceReference) -> int:
+        for idx, a in enumerate(access):
+            if (
+                a.address == target.address
+                and a.asset_id == target.asset_id
+                and a.app_id == target.app_id
+            ):
+                return idx + 1
+        access.append(target)
+        return len(access)
+
+    for addr in accounts:
+        ensure(app_access.ResourceReference(address=addr))
+    for app in foreign_apps:
+        ensure(app_access.ResourceReference(app_id=app))
+    for asset, addr in holdings:
+        addr_idx = ensure(app_access.ResourceReference(address=addr))
+        asset_idx = ensure(app_access.ResourceReference(asset_id=asset))
+        access.append(
+            app_access.ResourceReference(
+                holding_reference=app_access.HoldingRef(asset_idx, addr_idx)
+            )
+        )
+    return access
+
+
+def _baseline_box(
+    ref: Tuple[int, bytes], foreign_apps: List[int], app_id: int
+) -> BoxReference:
+    if isinstance(ref, BoxReference):
+        return ref
+    ref_id, ref_name = ref[0], encoding.encode_as_bytes(ref[1])
+    if not isinstance(ref_id, int):
+        raise TypeError("Box reference ID must be an int")
+    index = 0
+    try:
+        index = foreign_apps.index(ref_id) + 1
+    except (ValueError, AttributeError):
+        if ref_id != 0 and ref_id != app_id:
+            raise error.InvalidForeignIndexError(ref_id)
+    return BoxReference(index, ref_name)
+
+
+def _baseline_boxes(
+    boxes: List[Tuple[int, bytes]], foreign_apps: List[int], app_id: int
+) -> List[BoxReference]:
+    return [_baseline_box(ref, foreign_apps, app_id) for ref in boxes]
+
+
+def _case(
+    size: int, addresses: List[str]
+) -> Dict[str, Dict[str, Callable[[], Any]]]:
+    # Every value is referenced twice, so half of the lookups are hits
+    apps = [1000 + i for i in range(size)] * 2
+    accounts = (addresses * (size // len(addresses) + 1))[:size] * 2
+    holdings = list(zip(apps[: size // 2], accounts[: size // 2]))
+    boxes = [(app, b"box") for app in apps[:size]]
+
+    def populate_indexed() -> List[int]:
+        array: List[int] = []
+        positions = index_foreign_array(array)
+        return [populate_foreign_array(a, array, 0, positions) for a in apps]
+
+    def populate_scanned() -> List[int]:
+        array: List[int] = []
+        return [_baseline_populate(a, array, 0) for a in apps]
+
+    return {
+        "populate_foreign_array": {
+            "optimized": populate_indexed,
+            "baseline": populate_scanned,
+        },
+        "access list": {
+            "optimized": lambda: app_access.translate_to_resource_references(
+                app_id=1,
+                accounts=accounts[:size],
+                foreign_apps=apps[: size // 2],
+                holdings=holdings,
+            ),
+            "baseline": lambda: _baseline_access(
+                accounts[:size], apps[: size // 2], holdings
+            ),
+        },
+        "box references": {
+            "optimized": lambda: BoxReference.translate_box_references(
+                boxes, apps[:size], 1
+            ),
+            "baseline": lambda: _baseline_boxes(boxes, apps[:size], 1),
+        },
+    }
+
+
+def run(number: int) -> List[Dict[str, Any]]:
+    addresses = [account.generate_account()[1] for _ in range(64)]
+    sizes = {
+        "txn max": MAX_TXN_REFERENCES,
+        "access max": MAX_ACCESS_ENTRIES,
+        "group max": GROUP_SIZE * MAX_ACCESS_ENTRIES,
+        "large": 2048,
+    }
+    results = []
+    for label, size in sizes.items():
+        for name, variants in _case(size, addresses).items():
+            timings = {
+                mode: min(timeit.repeat(call, number=number, repeat=3))
+                / number
+                for mode, call in variants.items()
+            }
+            results.append(
+                {
+                    "case": "{} ({} {})".format(name, label, size),
+                    "optimized_us": 1e6 * timings["optimized"],
+                    "baseline_us": 1e6 * timings["baseline"],
+                    "speedup": timings["baseline"] / timings["optimized"],
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        "{:<40} {:>14} {:>14} {:>8}".format(
+            "case", "optimized us", "baseline us", "speedup"
+        )
+    )
+    for r in run(args.number):
+        print(
+            "{case:<40} {optimized_us:>14.1f} {baseline_us:>14.1f} "
+            "{speedup:>7.1f}x".format(**r)
+        )
+
+
+if __name__ == "__main__":
+    main()
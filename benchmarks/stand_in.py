@@ -0,0 +1,298 @@
+"""
+Lightweight local stand-in for algod and indexer used by the benchmarks.
+
+The server answers requests from a table of canned responses keyed by
+request method and path, and honours ``Accept-Encoding: gzip/deflate`` the
+same way a node behind a compressing proxy would. Responses can be built
+with sample_routes, or recorded from a real node with record and replayed
+from a file with load_recording.
+"""
+
+import base64
+import gzip
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+from algosdk import encoding
+
+# A body and its content type
+Response = Tuple[bytes, str]
+ResponseBody = Union[bytes, dict, list, Response]
+
+# Transaction ID answered by the sample send and pending endpoints
+SAMPLE_TXID = "A" * 52
+
+_SAMPLE_ADDRESSES = [
+    encoding.encode_address(bytes([i]) * 32) for i in range(16)
+]
+
+
+def _route_key(key: str) -> Tuple[str, str]:
+    # "POST /v2/transactions" or just "/v2/status" for a GET
+    method, _, path = key.rpartition(" ")
+    return method or "GET", path
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # Keep benchmark output clean
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._reply("GET")
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply("POST")
+
+    def _reply(self, method: str) -> None:
+        server: StandInServer = self.server  # type: ignore[assignment]
+        if server.latency:
+            time.sleep(server.latency)
+        route = server.routes.get((method, urlsplit(self.path).path))
+        if route is None:
+            self._send(404, b'{"message": "not found"}', "application/json")
+            return
+        self._send(200, *route)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        server: StandInServer = self.server  # type: ignore[assignment]
+        accepted = [
+            e.strip().split(";")[0]
+            for e in self.headers.get("Accept-Encoding", "").split(",")
+        ]
+        encoding = None
+        if server.compress and "gzip" in accepted:
+            body, encoding = gzip.compress(body, compresslevel=6), "gzip"
+        elif server.compress and "deflate" in accepted:
+            body, encoding = zlib.compress(body, 6), "deflate"
+        server.bytes_sent += len(body)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server replaying canned algod/indexer responses.
+
+    Args:
+        routes (dict): map of request path (e.g. "/v2/status"), optionally
+            preceded by a method (e.g. "POST /v2/transactions"), to the body
+            to return; dicts and lists are served as JSON, and a
+            (bytes, content type) tuple is served as is
+        compress (bool, optional): whether to honour Accept-Encoding
+        latency (float, optional): seconds to wait before each response,
+            standing in for network and node processing time
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        routes: Dict[str, ResponseBody],
+        compress: bool = True,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+        latency: float = 0.0,
+    ) -> None:
+        super().__init__(address, StandInHandler)
+        self.routes: Dict[Tuple[str, str], Response] = {}
+        for key, body in routes.items():
+            method, path = _route_key(key)
+            self.add_route(path, body, method=method)
+        self.compress = compress
+        self.latency = latency
+        self.bytes_sent = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def add_route(
+        self,
+        path: str,
+        body: ResponseBody,
+        content_type: str = "application/json",
+        method: str = "GET",
+    ) -> None:
+        if isinstance(body, tuple):
+            body, content_type = body
+        elif not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.routes[(method, path)] = (body, content_type)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def __enter__(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def sample_routes(size: int = 100) -> Dict[str, ResponseBody]:
+    """
+    Build representative algod and indexer responses for status, suggested
+    params, sending and looking up a transaction, blocks, and indexer
+    transaction and account searches.
+
+    Args:
+        size (int): number of transactions in blocks and search results,
+            and of accounts in account searches
+    """
+    addrs = _SAMPLE_ADDRESSES
+    txns = [
+        {
+            "id": base64.b32encode(i.to_bytes(32, "big")).decode()[:52],
+            "sender": addrs[i % len(addrs)],
+            "fee": 1000,
+            "first-valid": 1000 + i,
+            "last-valid": 2000 + i,
+            "confirmed-round": 1500,
+            "tx-type": "pay",
+            "payment-transaction": {
+                "receiver": addrs[(i + 1) % len(addrs)],
+                "amount": i * 7,
+            },
+            "note": base64.b64encode(i.to_bytes(16, "big")).decode(),
+        }
+        for i in range(size)
+    ]
+    genesis_hash = base64.b64encode(bytes(32)).decode()
+    pending_path = "/v2/transactions/pending/" + SAMPLE_TXID
+    return {
+        "/v2/status": {
+            "catchup-time": 0,
+            "last-round": 1500,
+            "last-version": "future",
+            "next-version": "future",
+            "next-version-round": 1501,
+            "next-version-supported": True,
+            "stopped-at-unsupported-round": False,
+            "time-since-last-round": 1_200_000_000,
+        },
+        "/v2/transactions/params": {
+            "consensus-version": "future",
+            "fee": 0,
+            "genesis-hash": genesis_hash,
+            "genesis-id": "testnet-v1.0",
+            "last-round": 1500,
+            "min-fee": 1000,
+        },
+        "POST /v2/transactions": {"txId": SAMPLE_TXID},
+        pending_path: {
+            "confirmed-round": 1500,
+            "pool-error": "",
+            "txn": {
+                "sig": base64.b64encode(bytes(64)).decode(),
+                "txn": {
+                    "amt": 1000,
+                    "fee": 1000,
+                    "fv": 1000,
+                    "gh": genesis_hash,
+                    "lv": 2000,
+                    "rcv": addrs[1],
+                    "snd": addrs[0],
+                    "type": "pay",
+                },
+            },
+        },
+        "/v2/blocks/1500": {
+            "block": {
+                "rnd": 1500,
+                "ts": 1_700_000_000,
+                "txns": [
+                    {"txn": {"snd": t["sender"], "fee": 1000}} for t in txns
+                ],
+            }
+        },
+        "/v2/transactions": {"current-round": 1500, "transactions": txns},
+        "/v2/accounts": {
+            "current-round": 1500,
+            "accounts": [
+                {
+                    "address": addrs[i % len(addrs)],
+                    "amount": 10**9 + i,
+                    "amount-without-pending-rewards": 10**9 + i,
+                    "pending-rewards": 0,
+                    "round": 1500,
+                    "status": "Offline",
+                }
+                for i in range(size)
+            ],
+        },
+    }
+
+
+def record(
+    base_url: str,
+    paths: Iterable[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Response]:
+    """
+    Record responses of a real algod or indexer for later replay.
+
+    Args:
+        base_url (str): address of the node, e.g. "http://localhost:4001"
+        paths (Iterable[str]): paths to GET, including any query string
+        headers (dict, optional): headers to send, e.g. the API token
+
+    Returns:
+        dict: map of path, without query string, to the recorded response
+    """
+    recorded = {}
+    for path in paths:
+        req = Request(
+            base_url + path,
+            headers={**(headers or {}), "Accept-Encoding": "identity"},
+        )
+        with urlopen(req) as resp:
+            content_type = resp.headers.get("Content-Type", "")
+            recorded[urlsplit(path).path] = (resp.read(), content_type)
+    return recorded
+
+
+def save_recording(path: str, routes: Dict[str, Response]) -> None:
+    """
+    Write recorded responses to a JSON file, with bodies in base64.
+    """
+    with open(path, "w") as f:
+        json.dump(
+            {
+                key: {
+                    "content-type": content_type,
+                    "body": base64.b64encode(body).decode(),
+                }
+                for key, (body, content_type) in routes.items()
+            },
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load_recording(path: str) -> Dict[str, ResponseBody]:
+    """
+    Read responses written by save_recording, as routes for StandInServer.
+    """
+    with open(path) as f:
+        recording = json.load(f)
+    return {
+        key: (base64.b64decode(r["body"]), r["content-type"])
+        for key, r in recording.items()
+    }
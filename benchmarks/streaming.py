@@ -0,0 +1,85 @@
+"""
+Compare peak memory of fully buffered and incrementally streamed parsing
+of large algod and indexer responses.
+
+Usage:
+    python -m benchmarks.streaming [--size N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from algosdk.v2client import algod, indexer
+
+from benchmarks.compression import make_payloads
+from benchmarks.stand_in import StandInServer
+
+
+def _measure(call: Callable[[], Any]) -> Dict[str, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    call()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak_kib": peak / 1024, "ms": 1000 * elapsed}
+
+
+def _consume(items: Any) -> int:
+    count = 0
+    for _ in items:
+        count += 1
+    return count
+
+
+def run(size: int) -> List[Dict[str, Any]]:
+    payloads = make_payloads(size)
+    results = []
+    with StandInServer(payloads, compress=False) as server:
+        acl = algod.AlgodClient("a" * 64, server.url)
+        icl = indexer.IndexerClient("", server.url)
+        cases = {
+            "block_info": (
+                lambda: acl.block_info(1)["block"]["txns"],
+                lambda: acl.block_info(1, stream_path=("block", "txns")),
+            ),
+            "pending_transactions": (
+                lambda: acl.pending_transactions()["top-transactions"],
+                lambda: acl.pending_transactions(
+                    stream_path=("top-transactions",)
+                ),
+            ),
+            "search_transactions": (
+                lambda: icl.search_transactions()["transactions"],
+                lambda: icl.search_transactions(stream_path=("transactions",)),
+            ),
+        }
+        for name, (buffered, streamed) in cases.items():
+            for mode, call in (("buffered", buffered), ("streamed", streamed)):
+                result = _measure(lambda: _consume(call()))
+                results.append({"endpoint": name, "mode": mode, **result})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(
+        "{:<22} {:<9} {:>12} {:>10}".format(
+            "endpoint", "mode", "peak KiB", "ms"
+        )
+    )
+    for r in run(args.size):
+        print(
+            "{endpoint:<22} {mode:<9} {peak_kib:>12.1f} {ms:>10.2f}".format(
+                **r
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
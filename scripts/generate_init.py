@@ -5,6 +5,7 @@ from pathlib import Path
 import sys
 
 from algosdk import __all__ as static_all
+from algosdk import _reexports, _submodules
 
 
 # Start of the template to be appended to
@@ -13,14 +14,17 @@ pyi_template = """## File generated from scripts/generate_init.py.
 
 """
 
+# Template for an import of several names
+import_template = """from {} import (
+    {},
+)
+"""
+
 # Template for __all__ export list
 all_template = """__all__ = [
     {},
-]"""
-
-# Flags to denote the beginning/end of the __all__ exports in __init__.py
-begin_flag = "# begin __all__"
-end_flag = "# end __all__"
+]
+"""
 
 # Make it safe to run from anywhere
 curr_dir = Path.cwd()
@@ -30,18 +34,10 @@ orig_dir = curr_dir / "algosdk"
 pyi_file = "__init__.pyi"
 orig_file = orig_dir / pyi_file
 
-# Path to py
-py_file = "__init__.py"
-init_file = orig_dir / py_file
-
 
 def generate_init_pyi() -> str:
-    with open(init_file, "r") as f:
-        init_contents = f.read()
-
-    start_idx = init_contents.index(begin_flag)
-    end_idx = init_contents.index(end_flag)
-
+    # __init__.py imports its submodules lazily, so the stub spells out the
+    # imports that type checkers should see
     counts = Counter(static_all)
     dupes = [x for x, n in counts.items() if n > 1]
     BR = "\n"
@@ -50,15 +46,23 @@ def generate_init_pyi() -> str:
         f"detected:{BR}{BR.join(dupes)}"
     )
 
+    imports = [import_template.format(".", ",\n    ".join(_submodules))]
+    for module in sorted(set(_reexports.values())):
+        names = sorted(n for n, m in _reexports.items() if m == module)
+        imports.append(
+            import_template.format("." + module, ",\n    ".join(names))
+        )
+
     all_imports = ",\n    ".join(
         ['"{}"'.format(s) for s in sorted(static_all)]
     )
 
     return (
         pyi_template
-        + init_contents[:start_idx]
+        + "".join(imports)
+        + "\n"
         + all_template.format(all_imports)
-        + init_contents[end_idx + len(end_flag) :]
+        + '\nname = "algosdk"\n'
     )
 
 
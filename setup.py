@@ -22,6 +22,9 @@ setuptools.setup(
         "pycryptodomex>=3.6.0,<4",
         "msgpack>=1.0.0,<2",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.17"],
+    },
     packages=setuptools.find_packages(
         include=(
             "algosdk",
@@ -1,8 +1,12 @@
+import array
+import base64
 import random
 import string
 import unittest
 
-from algosdk import account, encoding, error
+import msgpack
+
+from algosdk import account, encoding, error, transaction
 from algosdk.abi import (
     ABIType,
     AddressType,
@@ -11,13 +15,28 @@ from algosdk.abi import (
     BoolType,
     ByteType,
     Contract,
+    Event,
+    EventRecord,
     Interface,
+    LogDecoder,
     Method,
+    MethodCallRecord,
     NetworkInfo,
+    ReturnRecord,
     StringType,
     TupleType,
+    TupleView,
     UfixedType,
     UintType,
+    decode_view,
+    struct_type,
+)
+from algosdk.abi import vectorized
+from algosdk.abi.log_decoder import ABI_RETURN_HASH
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
 )
 
 
@@ -618,6 +637,275 @@ class TestABIEncoding(unittest.TestCase):
             expected = test_case[1]
             self.assertEqual(actual, expected)
 
+    def test_tuple_encoding_invalid(self):
+        t = ABIType.from_string("(uint8,string)")
+        with self.assertRaises(error.ABIEncodingError):
+            t.encode([1])
+        # dynamic offset must point right after the head
+        with self.assertRaises(error.ABIEncodingError):
+            t.decode(bytes.fromhex("01 00 04 00 00 00"))
+        # empty dynamic arrays must not be followed by trailing bytes
+        for type_str, encoded in (
+            ("string[]", "000000"),
+            ("string[0]", "00"),
+            ("(uint8,string[])", "01000300000000"),
+        ):
+            with self.assertRaises(error.ABIEncodingError):
+                ABIType.from_string(type_str).decode(bytes.fromhex(encoded))
+
+    def test_compiled_layout(self):
+        t = TupleType(
+            [BoolType(), BoolType(), UintType(8), StringType(), BoolType()]
+        )
+        layout = t.layout()
+        self.assertIs(t.layout(), layout)
+        # adjacent bools share a byte, the string takes a 2 byte offset
+        self.assertEqual(layout.head_size, 1 + 1 + 2 + 1)
+        self.assertTrue(layout.is_dynamic)
+        t.child_types = [BoolType(), BoolType()]
+        self.assertIsNot(t.layout(), layout)
+        self.assertEqual(t.byte_len(), 1)
+
+    def test_large_arrays(self):
+        test_cases = [
+            ("bool[4096]", [i % 3 == 0 for i in range(4096)]),
+            ("uint64[]", list(range(5000))),
+            ("ufixed64x2[100]", list(range(100))),
+            ("byte[]", list(range(256))),
+            ("string[]", ["s%d" % i for i in range(300)]),
+            ("()[]", [[]] * 3),
+        ]
+        for type_str, value in test_cases:
+            t = ABIType.from_string(type_str)
+            self.assertEqual(t.decode(t.encode(value)), value)
+
+    def test_array_vectorized(self):
+        t = ABIType.from_string("uint16[]")
+        values = array.array("H", [0, 1, 2**16 - 1])
+        encoded = t.encode(values)
+        self.assertEqual(encoded, t.encode(list(values)))
+        self.assertEqual(list(t.decode(encoded, as_array=True)), list(values))
+
+        t = ABIType.from_string("uint24[2]")
+        encoded = t.encode(memoryview(array.array("I", [5, 2**24 - 1])))
+        self.assertEqual(
+            list(t.decode(encoded, as_array=True)), [5, 2**24 - 1]
+        )
+
+        t = ABIType.from_string("bool[10]")
+        encoded = t.encode([True, False, True] + [False] * 7)
+        self.assertEqual(
+            list(t.decode(encoded, as_array=True)), [1, 0, 1] + [0] * 7
+        )
+
+        # Every unsigned typecode of the right size takes the bulk path
+        t = ABIType.from_string("uint64[]")
+        for code in ("Q", "L"):
+            values = array.array(code, [0, 1, 2**32 + 7])
+            if values.itemsize != 8:
+                continue
+            for vector in (values, memoryview(values)):
+                self.assertEqual(
+                    vectorized.encode_vector(t.child_type, vector),
+                    t.encode(list(values))[2:],
+                )
+
+        t = ABIType.from_string("bool[10]")
+        flags = [True, False, True] + [False] * 6 + [True]
+        for vector in (
+            array.array("B", flags),
+            memoryview(bytes(flags)).cast("?"),
+        ):
+            self.assertEqual(
+                vectorized.encode_vector(t.child_type, vector),
+                t.encode(flags),
+            )
+        with self.assertRaises(error.ABIEncodingError):
+            t.encode(array.array("B", [2] * 10))
+
+        with self.assertRaises(error.ABITypeError):
+            ABIType.from_string("string[]").decode(b"\x00\x00", as_array=True)
+        with self.assertRaises(error.ABIEncodingError):
+            ABIType.from_string("uint8[2]").encode(array.array("H", [1, 256]))
+
+    @unittest.skipIf(vectorized.numpy is None, "numpy is not installed")
+    def test_array_numpy(self):
+        np = vectorized.numpy
+        test_cases = [
+            ("uint64[]", np.arange(100, dtype=np.uint64)),
+            ("uint40[3]", np.array([0, 1, 2**40 - 1])),
+            ("ufixed32x4[]", np.array([7, 8], dtype=np.uint32)),
+            ("byte[]", np.frombuffer(b"abc", dtype=np.uint8)),
+            ("bool[11]", np.arange(11) % 3 == 0),
+        ]
+        for type_str, values in test_cases:
+            t = ABIType.from_string(type_str)
+            encoded = t.encode(values)
+            self.assertEqual(encoded, t.encode(values.tolist()))
+            self.assertTrue((t.decode(encoded, as_array=True) == values).all())
+
+        t = ABIType.from_string("uint8[2]")
+        for values in (np.array([-1, 2]), np.array([1, 256]), np.ones(2)):
+            with self.assertRaises(error.ABIEncodingError):
+                t.encode(values)
+
+    def test_encode_into(self):
+        addr = account.generate_account()[1]
+        test_cases = [
+            ("uint64", 2**64 - 1),
+            ("(bool,string,bool,uint24)", [True, "héllo", False, 7]),
+            (
+                "(address,(uint8,string)[],bool[3])[2]",
+                [[addr, [[1, "a"], [2, "bc"]], [True] * 3]] * 2,
+            ),
+            ("string[]", ["x" * i for i in range(20)]),
+            ("uint16[20]", list(range(20))),
+        ]
+        for type_str, value in test_cases:
+            t = ABIType.from_string(type_str)
+            encoded = t.encode(value)
+            self.assertEqual(t.encoded_len(value), len(encoded))
+
+            # into a preallocated buffer, between existing bytes
+            buffer = bytearray(b"\xff" * (len(encoded) + 6))
+            self.assertEqual(t.encode_into(buffer, 3, value), len(encoded) + 3)
+            self.assertEqual(buffer, b"\xff" * 3 + encoded + b"\xff" * 3)
+
+            # appended at the end of a buffer
+            buffer = bytearray(b"ab")
+            self.assertEqual(t.encode_into(buffer, 2, value), len(encoded) + 2)
+            self.assertEqual(buffer, b"ab" + encoded)
+
+            with self.assertRaises(error.ABIEncodingError):
+                t.encode_into(bytearray(len(encoded) + 1), 2, value)
+
+    def test_from_string_cached(self):
+        t = ABIType.from_string("(uint64,address)[]")
+        self.assertIsNot(ABIType.from_string("(uint64,address)[]"), t)
+        self.assertIsInstance(t.child_type.child_types, list)
+
+        # Changing a parsed type does not change later results
+        t.child_type.child_types.append(BoolType())
+        t.child_type.child_types[0].bit_size = 8
+        self.assertEqual(
+            ABIType.from_string("(uint64,address)[]").child_type,
+            TupleType([UintType(64), AddressType()]),
+        )
+
+    def test_tuple_length_checked_on_encode(self):
+        t = TupleType([])
+        t.child_types = [BoolType()] * 2**16
+        with self.assertRaises(error.ABIEncodingError):
+            t.encode([True] * 2**16)
+
+
+class TestABIView(unittest.TestCase):
+    structs = {
+        "Point": [
+            {"name": "x", "type": "uint64"},
+            {"name": "y", "type": "uint64"},
+        ],
+        "Order": [
+            {"name": "owner", "type": "address"},
+            {"name": "flag", "type": "bool"},
+            {"name": "note", "type": "string"},
+            {"name": "at", "type": "Point"},
+            {"name": "levels", "type": "uint16[]"},
+        ],
+    }
+
+    def setUp(self):
+        self.addr = account.generate_account()[1]
+        self.order_type = struct_type("Order", self.structs)
+        self.order = [self.addr, True, "hi", [3, 4], [1, 2, 3]]
+
+    def test_struct_type(self):
+        self.assertEqual(
+            str(self.order_type),
+            "(address,bool,string,(uint64,uint64),uint16[])",
+        )
+        with self.assertRaises(error.ABITypeError):
+            struct_type("Missing", self.structs)
+
+    def test_view_matches_decode(self):
+        test_cases = [
+            (
+                "(uint64,string,bool,bool,(byte,bool[3])[])",
+                [
+                    7,
+                    "abc",
+                    True,
+                    False,
+                    [[1, [True, False, True]], [2, [False] * 3]],
+                ],
+            ),
+            ("(string[],uint8[2],())", [["a", "", "bc"], [1, 2], []]),
+            ("bool[10]", [True, False] * 5),
+            ("address[]", [self.addr] * 3),
+        ]
+        for type_str, value in test_cases:
+            t = ABIType.from_string(type_str)
+            encoded = t.encode(value)
+            for data in (encoded, bytearray(encoded), memoryview(encoded)):
+                view = decode_view(t, data)
+                self.assertEqual(view.to_list(), value)
+                self.assertEqual(view, value)
+                self.assertEqual(view[-1], value[-1])
+
+    def test_fields_decoded_on_access(self):
+        t = ABIType.from_string("(uint64,string)")
+        encoded = bytearray(t.encode([9, "ab"]))
+        encoded[-1] = 0xFF  # invalid utf-8, only noticed when read
+        view = decode_view(t, encoded)
+        self.assertIsInstance(view, TupleView)
+        self.assertEqual(view[0], 9)
+        with self.assertRaises(UnicodeDecodeError):
+            view[1]
+
+    def test_struct_fields(self):
+        view = decode_view(
+            self.order_type,
+            self.order_type.encode(self.order),
+            struct="Order",
+            structs=self.structs,
+        )
+        self.assertEqual(
+            view.field_names, ("owner", "flag", "note", "at", "levels")
+        )
+        self.assertEqual(view.note, "hi")
+        self.assertEqual(view["at"].y, 4)
+        self.assertEqual(list(view.levels), [1, 2, 3])
+        self.assertEqual(
+            view.to_dict(),
+            {
+                "owner": self.addr,
+                "flag": True,
+                "note": "hi",
+                "at": {"x": 3, "y": 4},
+                "levels": [1, 2, 3],
+            },
+        )
+        with self.assertRaises(AttributeError):
+            view.missing
+        with self.assertRaises(error.ABITypeError):
+            decode_view(
+                ABIType.from_string("(uint64)"),
+                bytes(8),
+                struct="Point",
+                structs=self.structs,
+            )
+
+    def test_malformed(self):
+        t = ABIType.from_string("(uint8,string)")
+        with self.assertRaises(error.ABIEncodingError):
+            decode_view(t, bytes.fromhex("01 00 04 00 00 00"))
+        with self.assertRaises(error.ABIEncodingError):
+            decode_view(ABIType.from_string("uint64[2]"), bytes(15))
+        with self.assertRaises(error.ABIEncodingError):
+            decode_view(
+                ABIType.from_string("string[]"), bytes.fromhex("0000ff")
+            )
+
 
 class TestABIInteraction(unittest.TestCase):
     def test_method(self):
@@ -724,3 +1012,338 @@ class TestABIInteraction(unittest.TestCase):
             [m.get_signature() for m in c.methods],
             ["add(uint64,uint64)void", "multiply(uint64,uint64)void"],
         )
+
+    def test_method_lookup(self):
+        c = Contract(
+            "Lookup",
+            [
+                Method.from_signature("add(uint64,uint64)uint64"),
+                Method.from_signature("add(uint32,uint32)uint32"),
+                Method.from_signature("sub(uint64,uint64)uint64"),
+            ],
+        )
+        sub = c.methods[2]
+        self.assertIs(c.get_method_by_name("sub"), sub)
+        self.assertIs(c.get_method_by_selector(sub.get_selector()), sub)
+        with self.assertRaises(KeyError):
+            c.get_method_by_name("add")
+        with self.assertRaises(KeyError):
+            c.get_method_by_name("mul")
+        with self.assertRaises(KeyError):
+            c.get_method_by_selector(b"\x00\x00\x00\x00")
+
+        # The signature and selector are computed once
+        self.assertIs(sub.get_signature(), sub.get_signature())
+        self.assertIs(sub.get_selector(), sub.get_selector())
+
+        # Methods appended after construction are indexed too
+        mul = Method.from_signature("mul(uint64,uint64)uint64")
+        c.methods.append(mul)
+        self.assertIs(c.get_method_by_name("mul"), mul)
+        i = Interface("Lookup", [mul])
+        self.assertIs(i.get_method_by_selector(mul.get_selector()), mul)
+
+    def test_decode_app_call(self):
+        sk, sender = account.generate_account()
+        other = account.generate_account()[1]
+        signer = AccountTransactionSigner(sk)
+        sp = transaction.SuggestedParams(
+            0, 1, 1000, "A" * 43 + "=", "testnet-v1.0", flat_fee=True
+        )
+        refs = Method.from_signature(
+            "refs(pay,account,account,asset,application,application,"
+            "(uint8,string))void"
+        )
+        many = Method.from_signature(
+            "many({})void".format(",".join(["uint64"] * 14 + ["string"] * 3))
+        )
+        c = Contract("Calls", [refs, many])
+        i = Interface("Calls", [refs, many])
+
+        pay = TransactionWithSigner(
+            transaction.PaymentTxn(sender, sp, other, 1), signer
+        )
+        refs_args = [pay, sender, other, 31, 10, 42, [7, "seven"]]
+        many_args = list(range(14)) + ["a", "bc", "def"]
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(10, refs, sender, sp, signer, refs_args)
+        atc.add_method_call(10, many, sender, sp, signer, many_args)
+        txns = atc.build_group()
+        call, many_call = txns[1].txn, txns[2].txn
+        self.assertEqual(len(many_call.app_args), 16)
+
+        for contract in (c, i):
+            decoded = contract.decode_app_call(call)
+            self.assertIs(decoded.method, refs)
+            self.assertEqual(decoded.args, refs_args[1:])
+            decoded = contract.decode_app_call(many_call)
+            self.assertIs(decoded.method, many)
+            self.assertEqual(decoded.args, many_args)
+
+        # Signed transactions and indexer records decode the same way
+        signed = call.sign(sk)
+        self.assertEqual(c.decode_app_call(signed).args, refs_args[1:])
+        record = {
+            "sender": sender,
+            "application-transaction": {
+                "application-id": call.index,
+                "application-args": [
+                    base64.b64encode(a).decode() for a in call.app_args
+                ],
+                "accounts": call.accounts,
+                "foreign-apps": call.foreign_apps,
+                "foreign-assets": call.foreign_assets,
+            },
+        }
+        self.assertEqual(c.decode_app_call(record).args, refs_args[1:])
+
+        with self.assertRaises(KeyError):
+            c.decode_app_call(
+                transaction.ApplicationCallTxn(
+                    sender, sp, 10, 0, app_args=[b"\x00\x01\x02\x03"]
+                )
+            )
+        with self.assertRaises(error.ABIEncodingError):
+            c.decode_app_call(pay.txn)
+        truncated = transaction.ApplicationCallTxn(
+            sender, sp, 10, 0, app_args=call.app_args[:3]
+        )
+        with self.assertRaises(error.ABIEncodingError):
+            c.decode_app_call(truncated)
+
+    def test_event(self):
+        e = Event.from_signature("Swapped(uint64,address,(bool,string))")
+        self.assertEqual(
+            e.get_signature(), "Swapped(uint64,address,(bool,string))"
+        )
+        self.assertEqual(Event.undictify(e.dictify()), e)
+        addr = account.generate_account()[1]
+        value = [5, addr, [True, "x"]]
+        log = e.get_selector() + e.args_type.encode(value)
+        self.assertEqual(e.decode(log), value)
+        with self.assertRaises(error.ABIEncodingError):
+            e.decode(b"\x00" * 4 + log[4:])
+        with self.assertRaises(error.ABITypeError):
+            Event.from_signature("Bad(account)")
+        with self.assertRaises(error.ABIEncodingError):
+            Event.from_signature("Bad(uint64)void")
+
+        test_json = '{"name": "Pool", "methods": [], "events": [{"name": "Swapped", "args": [{"type": "uint64", "name": "in"}, {"type": "uint64", "name": "out"}]}]}'
+        c = Contract.from_json(test_json)
+        self.assertEqual(c.events[0].get_signature(), "Swapped(uint64,uint64)")
+        self.assertEqual(Contract.undictify(c.dictify()), c)
+        self.assertNotIn("events", Contract("Empty", []).dictify())
+
+
+class TestLogDecoder(unittest.TestCase):
+    def setUp(self):
+        self.sender = account.generate_account()[1]
+        self.other = account.generate_account()[1]
+        self.swap = Method.from_signature("swap(account,uint64)uint64")
+        self.ping = Method.from_signature("ping()void")
+        self.swapped = Event.from_signature("Swapped(address,uint64)")
+        self.contract = Contract(
+            "Pool", [self.swap, self.ping], events=[self.swapped]
+        )
+        self.decoder = LogDecoder([self.contract, self.contract])
+
+    def logs(self, amount):
+        return [
+            b"not an event",
+            self.swapped.get_selector()
+            + self.swapped.args_type.encode([self.other, amount]),
+            ABI_RETURN_HASH + UintType(64).encode(amount * 2),
+        ]
+
+    def indexer_txn(self, method, amount, logs, inner=()):
+        return {
+            "id": "TXID",
+            "confirmed-round": 9,
+            "sender": self.sender,
+            "tx-type": "appl",
+            "application-transaction": {
+                "application-id": 10,
+                "application-args": [
+                    base64.b64encode(a).decode()
+                    for a in [
+                        method.get_selector(),
+                        b"\x01",
+                        amount.to_bytes(8, "big"),
+                    ]
+                ],
+                "accounts": [self.other],
+            },
+            "logs": [base64.b64encode(log).decode() for log in logs],
+            "inner-txns": list(inner),
+        }
+
+    def test_decode_transactions(self):
+        inner = self.indexer_txn(self.swap, 3, self.logs(3))
+        txns = [
+            {"id": "PAY", "tx-type": "pay", "sender": self.sender},
+            self.indexer_txn(self.swap, 5, self.logs(5), [inner]),
+        ]
+        records = list(self.decoder.decode_transactions(txns))
+        self.assertEqual(
+            [type(r) for r in records],
+            [
+                MethodCallRecord,
+                EventRecord,
+                MethodCallRecord,
+                EventRecord,
+                ReturnRecord,
+                ReturnRecord,
+            ],
+        )
+        call, event, _, inner_event, inner_return, ret = records
+        self.assertEqual(
+            (call.tx_id, call.confirmed_round, call.app_id), ("TXID", 9, 10)
+        )
+        self.assertIs(call.method, self.swap)
+        self.assertEqual(call.args, [self.other, 5])
+        self.assertIs(event.event, self.swapped)
+        self.assertEqual(event.args, [self.other, 5])
+        self.assertEqual(inner_event.args, [self.other, 3])
+        self.assertEqual(inner_return.return_value, 6)
+        self.assertEqual(ret.return_value, 10)
+        self.assertIsNone(ret.decode_error)
+
+        # A missing return value or malformed event is reported, not raised
+        bad_event = self.swapped.get_selector() + b"\x00"
+        records = list(
+            self.decoder.decode_transactions(
+                [self.indexer_txn(self.swap, 5, [bad_event])]
+            )
+        )
+        self.assertIsInstance(records[1].decode_error, error.ABIEncodingError)
+        self.assertIsInstance(records[2].decode_error, error.ABIEncodingError)
+        self.assertIsNone(records[2].return_value)
+
+    def test_decode_application_logs(self):
+        response = {
+            "application-id": 10,
+            "log-data": [
+                {
+                    "txid": "TXID",
+                    "logs": [
+                        base64.b64encode(log).decode() for log in self.logs(7)
+                    ],
+                }
+            ],
+        }
+        records = list(self.decoder.decode_application_logs([response]))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].tx_id, "TXID")
+        self.assertEqual(records[0].app_id, 10)
+        self.assertEqual(records[0].args, [self.other, 7])
+
+    def test_decode_blocks(self):
+        sp = transaction.SuggestedParams(
+            0, 1, 1000, "A" * 43 + "=", "testnet-v1.0", flat_fee=True
+        )
+        txn = transaction.ApplicationCallTxn(
+            self.sender,
+            sp,
+            10,
+            transaction.OnComplete.NoOpOC,
+            app_args=[
+                self.swap.get_selector(),
+                b"\x01",
+                (4).to_bytes(8, "big"),
+            ],
+            accounts=[self.other],
+        )
+        stxn = {
+            "txn": {
+                k: v
+                for k, v in txn.dictify().items()
+                if k not in ("gen", "gh")
+            },
+            "hgi": True,
+            "dt": {"lg": self.logs(4)},
+        }
+        block = {
+            "block": {
+                "rnd": 12,
+                "gen": sp.gen,
+                "gh": base64.b64decode(sp.gh),
+                "txns": [stxn],
+            }
+        }
+        block = msgpack.unpackb(
+            msgpack.packb(block, use_bin_type=True),
+            raw=False,
+            strict_map_key=False,
+        )
+        records = list(self.decoder.decode_blocks([block]))
+        self.assertEqual(len(records), 3)
+        self.assertEqual({r.tx_id for r in records}, {txn.get_txid()})
+        self.assertEqual(records[0].confirmed_round, 12)
+        self.assertEqual(records[0].args, [self.other, 4])
+        self.assertEqual(records[1].args, [self.other, 4])
+        self.assertEqual(records[2].return_value, 8)
+
+    def test_event_selector_collision(self):
+        e = Event.from_signature("Swapped(address,uint64)")
+        e._selector = Event.from_signature("Other()").get_selector()
+        with self.assertRaises(error.ABITypeError):
+            LogDecoder([], [Event.from_signature("Other()"), e])
+
+    def test_batches(self):
+        flags = Method.from_signature("flags(bool,string,uint8)(uint8,bool)")
+        decoder = LogDecoder(
+            Contract("Flags", [self.swap, flags], events=[self.swapped]),
+            batch_size=2,
+        )
+        flags_txn = {
+            "id": "FLAGS",
+            "sender": self.sender,
+            "application-transaction": {
+                "application-id": 11,
+                "application-args": [
+                    base64.b64encode(a).decode()
+                    for a in [
+                        flags.get_selector(),
+                        b"\x80",
+                        StringType().encode("hi"),
+                        b"\x07",
+                    ]
+                ],
+            },
+            "logs": [
+                base64.b64encode(
+                    ABI_RETURN_HASH + flags.returns.type.encode([7, True])
+                ).decode()
+            ],
+        }
+        short_arg = self.indexer_txn(self.swap, 1, self.logs(1))
+        short_arg["application-transaction"]["application-args"][2] = "AA=="
+        txns = [
+            self.indexer_txn(self.swap, i, self.logs(i)) for i in range(5)
+        ] + [flags_txn, short_arg]
+
+        records = list(decoder.decode_transactions(txns))
+        self.assertEqual(
+            [r.args for r in records if isinstance(r, MethodCallRecord)][:6],
+            [[self.other, i] for i in range(5)] + [[True, "hi", 7]],
+        )
+        self.assertEqual(
+            [r.return_value for r in records if isinstance(r, ReturnRecord)],
+            [2 * i for i in range(5)] + [[7, True], 2],
+        )
+        self.assertIsInstance(records[-3].decode_error, error.ABIEncodingError)
+        self.assertIsNone(records[-3].args)
+
+        # Batching does not change the records
+        unbatched = list(
+            LogDecoder(
+                Contract("Flags", [self.swap, flags], events=[self.swapped]),
+                batch_size=1000,
+            ).decode_transactions(txns)
+        )
+        self.assertEqual(
+            [(type(r), r.tx_id, r.decode_error is None) for r in records],
+            [(type(r), r.tx_id, r.decode_error is None) for r in unbatched],
+        )
+        with self.assertRaises(error.ABITypeError):
+            LogDecoder([], batch_size=0)
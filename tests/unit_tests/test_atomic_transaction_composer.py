@@ -0,0 +1,909 @@
+import asyncio
+import base64
+import threading
+import time
+import unittest
+
+import msgpack
+
+from algosdk import abi, account, app_access, encoding, error, transaction
+from algosdk.atomic_transaction_composer import (
+    ABI_RETURN_HASH,
+    AccountTransactionSigner,
+    AsyncTransactionSigner,
+    AtomicTransactionComposer,
+    AtomicTransactionComposerStatus,
+    FeeBudgetOptimizer,
+    MethodCallTemplate,
+    ResourcePopulator,
+    TransactionWithSigner,
+    execute_batch,
+    gather_signatures_batch,
+    index_foreign_array,
+    populate_foreign_array,
+    simulate_batch,
+)
+
+
+def return_log(stxn):
+    return ABI_RETURN_HASH + (stxn.transaction.note or b"")
+
+
+class FakeAlgod:
+    """
+    Records calls and answers them with canned return logs, echoing each
+    transaction's note as its ABI return value.
+    """
+
+    confirmed_round = 10
+
+    def __init__(self):
+        self.requests = []
+        self.sent = {}
+        self.pending_lookups = []
+        self.lock = threading.Lock()
+
+    def send_transactions(self, stxns, **kwargs):
+        for stxn in stxns:
+            self.sent[stxn.get_txid()] = stxn
+
+    def status(self, **kwargs):
+        return {"last-round": self.confirmed_round - 1}
+
+    def status_after_block(self, round_num, **kwargs):
+        return {"last-round": round_num}
+
+    def pending_transaction_info(self, tx_id, **kwargs):
+        with self.lock:
+            self.pending_lookups.append(tx_id)
+        log = return_log(self.sent[tx_id])
+        return {
+            "confirmed-round": self.confirmed_round,
+            "logs": [base64.b64encode(log).decode()],
+        }
+
+    def get_block_txids(self, round_num, **kwargs):
+        return {"blockTxids": list(self.sent)}
+
+    def block_info(self, round_num, response_format="json", **kwargs):
+        payset = [
+            {"txn": {}, "dt": {"lg": [return_log(stxn)]}}
+            for stxn in self.sent.values()
+        ]
+        return msgpack.packb({"block": {"txns": payset}}, use_bin_type=True)
+
+    def simulate_transactions(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+        groups = []
+        for group in request.txn_groups:
+            results = []
+            for stxn in group.txns:
+                note = stxn.transaction.note or b""
+                log = base64.b64encode(ABI_RETURN_HASH + note).decode()
+                results.append({"txn-result": {"logs": [log]}})
+            groups.append({"txn-results": results})
+        return {"version": 2, "txn-groups": groups}
+
+
+class ComposerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.sk, self.addr = account.generate_account()
+        self.signer = AccountTransactionSigner(self.sk)
+        self.sp = transaction.SuggestedParams(
+            0, 1, 1000, "A" * 43 + "=", "testnet-v1.0", flat_fee=True
+        )
+        self.sp.fee = 1000
+        self.method = abi.Method.from_signature("echo(uint64)uint64")
+
+    def composer(self, *values):
+        atc = AtomicTransactionComposer()
+        for value in values:
+            atc.add_method_call(
+                app_id=5,
+                method=self.method,
+                sender=self.addr,
+                sp=self.sp,
+                signer=self.signer,
+                method_args=[value],
+                note=value.to_bytes(8, "big"),
+            )
+        return atc
+
+
+class TestSimulateBatch(ComposerTestCase):
+    def test_results_map_to_composers(self):
+        client = FakeAlgod()
+        composers = [self.composer(i) for i in range(10)]
+        results = simulate_batch(client, composers, max_workers=3)
+        self.assertEqual(len(client.requests), 10)
+        self.assertEqual(
+            [r.abi_results[0].return_value for r in results], list(range(10))
+        )
+        for atc, result in zip(composers, results):
+            self.assertEqual(result.tx_ids, atc.tx_ids)
+
+    def test_packs_groups_per_request(self):
+        client = FakeAlgod()
+        composers = [self.composer(i) for i in range(7)]
+        results = simulate_batch(client, composers, max_groups_per_request=3)
+        self.assertEqual(
+            sorted(len(r.txn_groups) for r in client.requests), [1, 3, 3]
+        )
+        self.assertEqual(
+            [r.abi_results[0].return_value for r in results], list(range(7))
+        )
+
+    def test_group_count_mismatch(self):
+        client = FakeAlgod()
+        client.simulate_transactions = lambda request: {"txn-groups": []}
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            simulate_batch(client, [self.composer(1)])
+
+
+class TestExecuteResults(ComposerTestCase):
+    def test_reuses_confirmation_and_fetches_rest(self):
+        client = FakeAlgod()
+        atc = self.composer(1, 2, 3, 4)
+        resp = atc.execute(client, 5)
+        self.assertEqual(resp.confirmed_round, client.confirmed_round)
+        self.assertEqual(
+            [r.return_value for r in resp.abi_results], [1, 2, 3, 4]
+        )
+        # one lookup while waiting for confirmation, then one per other call
+        self.assertEqual(len(client.pending_lookups), 4)
+
+    def test_results_from_block(self):
+        client = FakeAlgod()
+        atc = self.composer(5, 6, 7)
+        resp = atc.execute(client, 5, results_from_block=True)
+        self.assertEqual([r.return_value for r in resp.abi_results], [5, 6, 7])
+        self.assertEqual(len(client.pending_lookups), 1)
+        self.assertEqual(
+            resp.abi_results[2].tx_info["confirmed-round"],
+            client.confirmed_round,
+        )
+
+    def test_results_from_block_falls_back(self):
+        client = FakeAlgod()
+        client.block_info = None  # not callable, forces the fallback
+        atc = self.composer(8, 9)
+        resp = atc.execute(client, 5, results_from_block=True)
+        self.assertEqual([r.return_value for r in resp.abi_results], [8, 9])
+
+
+class TestMethodCallTemplate(ComposerTestCase):
+    def assertSameGroup(self, atc, expected):
+        self.assertEqual(
+            [encoding.msgpack_encode(t.txn) for t in atc.txn_list],
+            [encoding.msgpack_encode(t.txn) for t in expected.txn_list],
+        )
+        self.assertEqual(atc.method_dict, expected.method_dict)
+
+    def test_matches_add_method_call(self):
+        method = abi.Method.from_signature(
+            "swap(pay,account,asset,application,uint64,bool,bool)uint64"
+        )
+        other = account.generate_account()[1]
+        fixed = dict(
+            app_id=5,
+            method=method,
+            sender=self.addr,
+            signer=self.signer,
+            accounts=[other],
+            foreign_apps=[7],
+            boxes=[(7, b"box"), (0, b"own")],
+        )
+        template = MethodCallTemplate(**fixed)
+        sp = transaction.SuggestedParams(1000, 1, 1000, "A" * 43 + "=")
+        atc = AtomicTransactionComposer()
+        expected = AtomicTransactionComposer()
+        for i in range(3):
+            pay = transaction.PaymentTxn(self.addr, self.sp, other, i)
+            args = [
+                TransactionWithSigner(pay, self.signer),
+                [self.addr, other, account.generate_account()[1]][i],
+                100 + i,
+                [5, 7, 9][i],
+                i,
+                True,
+                i % 2 == 0,
+            ]
+            note = b"note%d" % i
+            atc.add_template_call(template, sp, args, note=note)
+            expected.add_method_call(
+                sp=sp, method_args=args, note=note, **fixed
+            )
+        self.assertSameGroup(atc, expected)
+        # Each call resolves references against fresh foreign arrays
+        self.assertEqual(atc.txn_list[3].txn.accounts, [other])
+        self.assertEqual(len(atc.txn_list[5].txn.accounts), 2)
+
+    def test_boxes_of_application_args(self):
+        method = abi.Method.from_signature("f(application)void")
+        fixed = dict(
+            app_id=5,
+            method=method,
+            sender=self.addr,
+            signer=self.signer,
+            boxes=[(9, b"x"), (0, b"own")],
+        )
+        template = MethodCallTemplate(**fixed)
+        atc = AtomicTransactionComposer()
+        expected = AtomicTransactionComposer()
+        atc.add_template_call(template, self.sp, [9])
+        expected.add_method_call(sp=self.sp, method_args=[9], **fixed)
+        self.assertSameGroup(atc, expected)
+        self.assertEqual(atc.txn_list[0].txn.boxes[0].app_index, 1)
+        # The box's app must still be passed
+        with self.assertRaises(error.InvalidForeignIndexError):
+            template.instantiate(self.sp, [5])
+
+    def test_packs_many_args(self):
+        method = abi.Method.from_signature(
+            "many({})void".format(",".join(["uint64"] * 17))
+        )
+        template = MethodCallTemplate(5, method, self.addr, self.signer)
+        atc = AtomicTransactionComposer()
+        atc.add_template_call(template, self.sp, list(range(17)))
+        expected = AtomicTransactionComposer()
+        expected.add_method_call(
+            5, method, self.addr, self.sp, self.signer, list(range(17))
+        )
+        self.assertSameGroup(atc, expected)
+        self.assertEqual(len(atc.txn_list[0].txn.app_args), 16)
+
+    def test_instances_do_not_share_lists(self):
+        template = MethodCallTemplate(
+            5, self.method, self.addr, self.signer, boxes=[(0, b"box")]
+        )
+        first = template.instantiate(self.sp, [1])[0].txn
+        first.boxes.append(first.boxes[0])
+        second = template.instantiate(self.sp, [2])[0].txn
+        self.assertEqual(len(second.boxes), 1)
+        self.assertIsNot(first.boxes, second.boxes)
+
+    def test_invalid(self):
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            MethodCallTemplate(0, self.method, self.addr, self.signer)
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            MethodCallTemplate(
+                5,
+                self.method,
+                self.addr,
+                self.signer,
+                on_complete=transaction.OnComplete.UpdateApplicationOC,
+            )
+        template = MethodCallTemplate(5, self.method, self.addr, self.signer)
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            template.instantiate(self.sp, [1, 2])
+        atc = AtomicTransactionComposer()
+        for i in range(atc.MAX_GROUP_SIZE):
+            atc.add_template_call(template, self.sp, [i])
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            atc.add_template_call(template, self.sp, [16])
+
+
+class TestClone(ComposerTestCase):
+    def test_clone_is_structural(self):
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(
+            5,
+            self.method,
+            self.addr,
+            self.sp,
+            self.signer,
+            [1],
+            accounts=[account.generate_account()[1]],
+        )
+        atc.add_transaction(
+            TransactionWithSigner(
+                transaction.PaymentTxn(self.addr, self.sp, self.addr, 1),
+                self.signer,
+            )
+        )
+        atc.build_group()
+        cloned = atc.clone()
+        self.assertEqual(
+            cloned.get_status(), AtomicTransactionComposerStatus.BUILDING
+        )
+        self.assertEqual(cloned.method_dict, atc.method_dict)
+        for original, copied in zip(atc.txn_list, cloned.txn_list):
+            self.assertIsNotNone(original.txn.group)
+            self.assertIsNone(copied.txn.group)
+            self.assertIs(copied.signer, original.signer)
+            copied.txn.group = original.txn.group
+            self.assertEqual(copied.txn, original.txn)
+
+        app_call = cloned.txn_list[0].txn
+        self.assertIs(app_call.app_args[0], atc.txn_list[0].txn.app_args[0])
+        app_call.fee = 5000
+        app_call.accounts.append(self.addr)
+        self.assertEqual(atc.txn_list[0].txn.fee, 1000)
+        self.assertEqual(len(atc.txn_list[0].txn.accounts), 1)
+
+        cloned.add_method_call(
+            5, self.method, self.addr, self.sp, self.signer, [2]
+        )
+        self.assertEqual(cloned.get_tx_count(), 3)
+        self.assertEqual(atc.get_tx_count(), 2)
+
+
+class SlowSigner(AccountTransactionSigner):
+    def __init__(self, private_key, delay=0.0):
+        super().__init__(private_key)
+        self.delay = delay
+        self.calls = []
+
+    def sign_transactions(self, txn_group, indexes):
+        self.calls.append(indexes)
+        time.sleep(self.delay)
+        return super().sign_transactions(txn_group, indexes)
+
+    def sign_transaction_groups(self, groups):
+        self.calls.append([indexes for _, indexes in groups])
+        time.sleep(self.delay)
+        return [
+            AccountTransactionSigner.sign_transactions(self, *group)
+            for group in groups
+        ]
+
+
+class SlowAsyncSigner(AsyncTransactionSigner):
+    def __init__(self, private_key, delay=0.0):
+        super().__init__()
+        self.signer = AccountTransactionSigner(private_key)
+        self.delay = delay
+
+    async def sign_transactions_async(self, txn_group, indexes):
+        await asyncio.sleep(self.delay)
+        return self.signer.sign_transactions(txn_group, indexes)
+
+
+class TestGatherSignatures(ComposerTestCase):
+    def composer_for(self, *signers):
+        atc = AtomicTransactionComposer()
+        for i, signer in enumerate(signers):
+            txn = transaction.PaymentTxn(self.addr, self.sp, self.addr, i)
+            atc.add_transaction(TransactionWithSigner(txn, signer))
+        return atc
+
+    def expected(self, atc):
+        return [t.txn.sign(self.sk) for t in atc.build_group()]
+
+    def test_signers_sign_concurrently(self):
+        signers = [SlowSigner(self.sk, 0.2) for _ in range(2)]
+        atc = self.composer_for(signers[0], signers[1], signers[0])
+        start = time.monotonic()
+        stxns = atc.gather_signatures()
+        self.assertLess(time.monotonic() - start, 0.35)
+        self.assertEqual(stxns, self.expected(atc))
+        self.assertEqual(signers[0].calls, [[0, 2]])
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.SIGNED
+        )
+
+    def test_async_signers(self):
+        signers = [SlowAsyncSigner(self.sk, 0.2) for _ in range(2)]
+        atc = self.composer_for(signers[0], signers[1], self.signer)
+        start = time.monotonic()
+        stxns = atc.gather_signatures()
+        self.assertLess(time.monotonic() - start, 0.35)
+        self.assertEqual(stxns, self.expected(atc))
+
+    def test_timeout(self):
+        for slow in (SlowSigner(self.sk, 1), SlowAsyncSigner(self.sk, 1)):
+            atc = self.composer_for(self.signer, slow)
+            start = time.monotonic()
+            with self.assertRaises(error.AtomicTransactionComposerError):
+                atc.gather_signatures(timeout=0.05)
+            self.assertLess(time.monotonic() - start, 0.5)
+            self.assertEqual(
+                atc.get_status(), AtomicTransactionComposerStatus.BUILT
+            )
+
+    def test_timeout_starts_with_each_signer(self):
+        signers = [SlowSigner(self.sk, 0.15) for _ in range(2)]
+        atc = self.composer_for(*signers)
+        stxns = atc.gather_signatures(max_workers=1, timeout=0.25)
+        self.assertEqual(stxns, self.expected(atc))
+
+    def test_async_signer_in_running_loop(self):
+        signer = SlowAsyncSigner(self.sk)
+        atc = self.composer_for(signer, self.signer)
+        txns = [t.txn for t in atc.build_group()]
+
+        async def sign():
+            return signer.sign_transactions(txns, [0])
+
+        self.assertEqual(asyncio.run(sign()), self.expected(atc)[:1])
+
+    def test_batch_signs_each_signer_once(self):
+        shared = SlowSigner(self.sk)
+        composers = [self.composer_for(shared, self.signer) for _ in range(3)]
+        signed = composers[1].gather_signatures()
+        results = gather_signatures_batch(composers)
+        self.assertIs(results[1], signed)
+        self.assertEqual(shared.calls, [[0], [[0], [0]]])
+        for atc, stxns in zip(composers, results):
+            self.assertEqual(stxns, self.expected(atc))
+            self.assertEqual(
+                atc.get_status(), AtomicTransactionComposerStatus.SIGNED
+            )
+
+
+class TestPopulateForeignArray(unittest.TestCase):
+    def test_positions_match_scanning(self):
+        values = [3, 5, 3, 0, 7, 5, 9, 0, 3]
+        for zero_value in (None, 0):
+            scanned = [5, 1, 5]
+            indexed = scanned[:]
+            positions = index_foreign_array(indexed)
+            self.assertEqual(positions, {5: 0, 1: 1})
+            expected = [
+                populate_foreign_array(v, scanned, zero_value) for v in values
+            ]
+            self.assertEqual(
+                [
+                    populate_foreign_array(v, indexed, zero_value, positions)
+                    for v in values
+                ],
+                expected,
+            )
+            self.assertEqual(indexed, scanned)
+            self.assertEqual(positions, index_foreign_array(indexed))
+
+
+class UnnamedResourcesAlgod:
+    """
+    Answers simulate requests with fixed unnamed resources for each
+    transaction and for the group.
+    """
+
+    def __init__(self, txn_resources=(), group_resources=None, failure=""):
+        self.txn_resources = txn_resources
+        self.group_resources = group_resources
+        self.failure = failure
+        self.requests = []
+
+    def simulate_transactions(self, request, **kwargs):
+        self.requests.append(request)
+        txns = request.txn_groups[0].txns
+        resources = list(self.txn_resources) + [None] * len(txns)
+        group = {
+            "txn-results": [
+                {"txn-result": {}, "unnamed-resources-accessed": r}
+                for r in resources[: len(txns)]
+            ],
+            "unnamed-resources-accessed": self.group_resources,
+        }
+        if self.failure:
+            group["failure-message"] = self.failure
+        return {"version": 2, "txn-groups": [group]}
+
+
+class TestPopulateResources(ComposerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.others = [account.generate_account()[1] for _ in range(6)]
+
+    def app_calls(self, count, **kwargs):
+        atc = AtomicTransactionComposer()
+        for i in range(count):
+            atc.add_method_call(
+                5, self.method, self.addr, self.sp, self.signer, [i], **kwargs
+            )
+        return atc
+
+    def test_packs_into_foreign_arrays(self):
+        a, b, c = self.others[:3]
+        client = UnnamedResourcesAlgod(
+            txn_resources=[None, {"accounts": [a]}],
+            group_resources={
+                "asset-holdings": [{"asset": 9, "account": b}],
+                "app-locals": [{"app": 5, "account": self.addr}],
+                "accounts": [c],
+                "boxes": [
+                    {"app": 5, "name": base64.b64encode(b"k").decode()},
+                    {"app": 7, "name": base64.b64encode(b"q").decode()},
+                ],
+                "assets": [11],
+                "apps": [12],
+                "extra-box-refs": 1,
+            },
+        )
+        atc = self.app_calls(2)
+        atc.populate_resources(client)
+
+        request = client.requests[0]
+        self.assertTrue(request.allow_unnamed_resources)
+        self.assertTrue(request.allow_empty_signatures)
+        self.assertFalse(request.txn_groups[0].txns[0].signature)
+        self.assertIs(atc.txn_list[0].signer, self.signer)
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.BUILDING
+        )
+
+        first, second = [t.txn for t in atc.txn_list]
+        self.assertEqual(second.accounts[0], a)
+        accounts = (first.accounts or []) + (second.accounts or [])
+        self.assertEqual(sorted(accounts), sorted([a, b, c]))
+        # A holding's account and asset share a transaction
+        holder = first if b in (first.accounts or []) else second
+        self.assertIn(9, holder.foreign_assets)
+        for txn in (first, second):
+            count = sum(
+                len(getattr(txn, name) or [])
+                for name in ("accounts", "foreign_apps", "foreign_assets")
+            ) + len(txn.boxes or [])
+            self.assertLessEqual(count, 8)
+            for box in txn.boxes or []:
+                if box.app_index:
+                    self.assertEqual(txn.foreign_apps[box.app_index - 1], 7)
+        boxes = [
+            (box.app_index == 0, box.name)
+            for txn in (first, second)
+            for box in txn.boxes or []
+        ]
+        self.assertEqual(
+            sorted(boxes), [(False, b"q"), (True, b""), (True, b"k")]
+        )
+        apps = (first.foreign_apps or []) + (second.foreign_apps or [])
+        self.assertEqual(sorted(apps), [7, 12])
+
+    def test_spreads_over_app_calls(self):
+        client = UnnamedResourcesAlgod(
+            group_resources={"accounts": self.others}
+        )
+        atc = self.app_calls(2)
+        atc.populate_resources(client)
+        self.assertEqual(
+            atc.txn_list[0].txn.accounts + atc.txn_list[1].txn.accounts,
+            self.others,
+        )
+        self.assertEqual(len(atc.txn_list[0].txn.accounts), 4)
+
+        client = UnnamedResourcesAlgod(
+            group_resources={"accounts": self.others * 2}
+        )
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            self.app_calls(1).populate_resources(client)
+
+    def test_access_list(self):
+        txn = transaction.ApplicationCallTxn(
+            self.addr,
+            self.sp,
+            5,
+            transaction.OnComplete.NoOpOC,
+            accounts=[self.others[0]],
+            use_access=True,
+        )
+        atc = AtomicTransactionComposer()
+        atc.add_transaction(TransactionWithSigner(txn, self.signer))
+        client = UnnamedResourcesAlgod(
+            group_resources={
+                "accounts": [self.others[1]],
+                "asset-holdings": [{"asset": 9, "account": self.addr}],
+            }
+        )
+        atc.populate_resources(client)
+        self.assertEqual(
+            txn.resources,
+            transaction.translate_to_resource_references(
+                5, accounts=[self.others[0]], holdings=[(9, "")]
+            )
+            + [app_access.ResourceReference(address=self.others[1])],
+        )
+
+    def test_cached_packing(self):
+        client = UnnamedResourcesAlgod(
+            group_resources={"accounts": self.others[:2], "assets": [9]}
+        )
+        populator = ResourcePopulator(client)
+        populator.populate(self.app_calls(2))
+        populator.populate(self.app_calls(2))
+        self.assertEqual(len(client.requests), 2)
+
+        client.requests.clear()
+        populator = ResourcePopulator(client, cache_size=256)
+        first = populator.populate(self.app_calls(2))
+        second = populator.populate(self.app_calls(2))
+        self.assertEqual(len(client.requests), 1)
+        for expected, txn in zip(first.txn_list, second.txn_list):
+            self.assertEqual(txn.txn, expected.txn)
+        # A group of another shape is simulated again
+        populator.populate(self.app_calls(1))
+        self.assertEqual(len(client.requests), 2)
+
+    def test_template_is_unchanged(self):
+        template = MethodCallTemplate(
+            5, self.method, self.addr, self.signer, boxes=[(0, b"k")]
+        )
+        client = UnnamedResourcesAlgod(
+            group_resources={"boxes": [{"app": 5, "name": "cQ=="}]}
+        )
+        atc = AtomicTransactionComposer()
+        atc.add_template_call(template, self.sp, [1])
+        atc.populate_resources(client)
+        self.assertEqual(len(atc.txn_list[0].txn.boxes), 2)
+        self.assertEqual(
+            len(template.instantiate(self.sp, [2])[0].txn.boxes), 1
+        )
+
+    def test_failed_simulation(self):
+        client = UnnamedResourcesAlgod(failure="logic eval error")
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            self.app_calls(1).populate_resources(client)
+        atc = self.app_calls(1)
+        atc.build_group()
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            atc.populate_resources(UnnamedResourcesAlgod())
+
+
+class BudgetAlgod:
+    """
+    Answers simulate requests with a fixed opcode budget consumed by the
+    group and fixed inner transactions for each transaction.
+    """
+
+    def __init__(self, consumed=0, inner_txns=()):
+        self.consumed = consumed
+        self.inner_txns = inner_txns
+        self.requests = []
+
+    def simulate_transactions(self, request, **kwargs):
+        self.requests.append(request)
+        txns = request.txn_groups[0].txns
+        inner = list(self.inner_txns) + [[]] * len(txns)
+        group = {
+            "txn-results": [
+                {"txn-result": {"inner-txns": i}} for i in inner[: len(txns)]
+            ],
+            "app-budget-added": 700 * len(txns) + request.extra_opcode_budget,
+            "app-budget-consumed": self.consumed,
+        }
+        return {"version": 2, "txn-groups": [group]}
+
+
+def inner_txn(txn_type, fee=0, inner_txns=()):
+    return {
+        "txn": {"txn": {"type": txn_type, "fee": fee}},
+        "inner-txns": list(inner_txns),
+    }
+
+
+class TestFeeBudgetOptimizer(ComposerTestCase):
+    def group(self, count):
+        atc = AtomicTransactionComposer()
+        pay = transaction.PaymentTxn(self.addr, self.sp, self.addr, 0)
+        atc.add_transaction(TransactionWithSigner(pay, self.signer))
+        for i in range(count):
+            atc.add_method_call(
+                5, self.method, self.addr, self.sp, self.signer, [i]
+            )
+        return atc
+
+    def test_pools_fees_onto_payer(self):
+        client = BudgetAlgod(
+            consumed=1000,
+            inner_txns=[
+                [],
+                [
+                    inner_txn("pay"),
+                    inner_txn("appl", inner_txns=[inner_txn("axfer")]),
+                ],
+                [inner_txn("pay", fee=1000)],
+            ],
+        )
+        atc = self.group(2).optimize_fees(client)
+        self.assertEqual(client.requests[0].extra_opcode_budget, 320000)
+        # Three app calls provide the budget and three inner transactions
+        # are paid for by the group
+        self.assertEqual(atc.get_tx_count(), 3)
+        self.assertEqual([t.txn.fee for t in atc.txn_list], [6000, 0, 0])
+        self.assertEqual(len(atc.build_group()), 3)
+
+    def test_inner_overpayment_covers_other_inners(self):
+        client = BudgetAlgod(
+            inner_txns=[[], [inner_txn("pay", fee=3000), inner_txn("pay")]]
+        )
+        atc = self.group(1).optimize_fees(client)
+        self.assertEqual([t.txn.fee for t in atc.txn_list], [2000, 0])
+
+    def test_adds_budget_padding(self):
+        # Two app calls leave 1300 of the budget consumed uncovered
+        client = BudgetAlgod(consumed=2700)
+        atc = self.group(2).optimize_fees(client, payer_index=1)
+        self.assertEqual(atc.get_tx_count(), 5)
+        padding = [t.txn for t in atc.txn_list[3:]]
+        for txn in padding:
+            self.assertIsInstance(txn, transaction.ApplicationCallTxn)
+            self.assertEqual(txn.index, 0)
+            self.assertEqual(txn.sender, self.addr)
+            self.assertEqual(
+                txn.on_complete, transaction.OnComplete.DeleteApplicationOC
+            )
+        self.assertNotEqual(padding[0].get_txid(), padding[1].get_txid())
+        self.assertEqual([t.txn.fee for t in atc.txn_list], [0, 5000, 0, 0, 0])
+
+        atc = self.group(1)
+        FeeBudgetOptimizer(client, budget_app_id=9).optimize(atc)
+        self.assertEqual(atc.get_tx_count(), 5)
+        self.assertTrue(all(t.txn.index == 9 for t in atc.txn_list[2:]))
+
+    def test_cached_plan(self):
+        client = BudgetAlgod(
+            consumed=1000, inner_txns=[[], [inner_txn("pay")]]
+        )
+        optimizer = FeeBudgetOptimizer(client)
+        optimizer.optimize(self.group(1))
+        optimizer.optimize(self.group(1))
+        self.assertEqual(len(client.requests), 2)
+
+        client.requests.clear()
+        optimizer = FeeBudgetOptimizer(client, cache_size=256)
+        first = optimizer.optimize(self.group(1))
+        second = optimizer.optimize(self.group(1))
+        self.assertEqual(len(client.requests), 1)
+        self.assertEqual(
+            [t.txn.fee for t in first.txn_list],
+            [t.txn.fee for t in second.txn_list],
+        )
+        # Another method is simulated again
+        atc = self.group(1)
+        atc.add_method_call(
+            5,
+            abi.Method.from_signature("other(uint64)void"),
+            self.addr,
+            self.sp,
+            self.signer,
+            [1],
+        )
+        optimizer.optimize(atc)
+        self.assertEqual(len(client.requests), 2)
+
+    def test_rejects_invalid_groups(self):
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            self.group(1).optimize_fees(BudgetAlgod(), payer_index=2)
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            self.group(14).optimize_fees(BudgetAlgod(consumed=20000))
+        atc = self.group(1)
+        atc.build_group()
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            atc.optimize_fees(BudgetAlgod())
+
+
+class DroppingAlgod(FakeAlgod):
+    """
+    Accepts transactions but never confirms any of them.
+    """
+
+    def get_block_txids(self, round_num, **kwargs):
+        return {"blockTxids": []}
+
+
+class NoBlocksAlgod(FakeAlgod):
+    """
+    Confirms transactions but cannot serve blocks.
+    """
+
+    def block_info(self, round_num, response_format="json", **kwargs):
+        raise error.AlgodHTTPError("block not available", 404)
+
+
+class LaggingAlgod(FakeAlgod):
+    """
+    Runs far ahead of the caller, confirming the n-th submitted group in
+    round 10 * (n + 1).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.rounds = {}
+
+    def send_transactions(self, stxns, **kwargs):
+        confirmed_round = 10 * (len(self.rounds) + 1)
+        for stxn in stxns:
+            self.sent[stxn.get_txid()] = stxn
+            self.rounds[stxn.get_txid()] = confirmed_round
+
+    def status_after_block(self, round_num, **kwargs):
+        return {"last-round": round_num + 50}
+
+    def confirmed(self, round_num):
+        return [t for t, r in self.rounds.items() if r == round_num]
+
+    def get_block_txids(self, round_num, **kwargs):
+        return {"blockTxids": self.confirmed(round_num)}
+
+    def block_info(self, round_num, response_format="json", **kwargs):
+        payset = [
+            {"txn": {}, "dt": {"lg": [return_log(self.sent[t])]}}
+            for t in self.confirmed(round_num)
+        ]
+        return msgpack.packb({"block": {"txns": payset}}, use_bin_type=True)
+
+
+class RejectingAlgod(DroppingAlgod):
+    """
+    Drops every transaction from its pool.
+    """
+
+    def pending_transaction_info(self, tx_id, **kwargs):
+        return {"pool-error": "overspend", "confirmed-round": 0}
+
+
+class TestExecuteBatch(ComposerTestCase):
+    def test_confirms_every_group(self):
+        for client in (FakeAlgod(), NoBlocksAlgod()):
+            composers = [self.composer(i, i + 1) for i in range(5)]
+            execution = execute_batch(client, composers, 5, max_in_flight=2)
+            report = execution.wait(10)
+            self.assertTrue(execution.done())
+            self.assertEqual(report.confirmed, 5)
+            self.assertEqual(report.errors, [None] * 5)
+            for i, response in enumerate(report.responses):
+                self.assertEqual(
+                    [r.return_value for r in response.abi_results], [i, i + 1]
+                )
+                self.assertEqual(response.tx_ids, composers[i].tx_ids)
+                self.assertEqual(
+                    composers[i].get_status(),
+                    AtomicTransactionComposerStatus.COMMITTED,
+                )
+            self.assertEqual(
+                execution.futures[4].result().abi_results[0].return_value, 4
+            )
+            self.assertEqual(set(report.latency_percentiles()), {50, 90, 99})
+            self.assertGreater(report.throughput, 0)
+
+    def test_deadlines_follow_node_rounds(self):
+        # The second group is submitted when the node is at round 59, and
+        # confirmed in round 20, long after the loop's own round plus 3
+        composers = [self.composer(i) for i in range(2)]
+        report = execute_batch(
+            LaggingAlgod(), composers, 3, max_in_flight=1
+        ).wait(10)
+        self.assertEqual(report.errors, [None, None])
+        self.assertEqual(report.responses[1].confirmed_round, 20)
+
+    def test_reports_rejected_groups(self):
+        start = time.monotonic()
+        report = execute_batch(
+            RejectingAlgod(), [self.composer(1)], 1000
+        ).wait(10)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertIsInstance(report.errors[0], error.TransactionRejectedError)
+
+    def test_lookup_errors_fail_only_their_group(self):
+        client = NoBlocksAlgod()
+        composers = [self.composer(i) for i in range(3)]
+        broken = composers[1].build_group()[0].txn.get_txid()
+        lookup = client.pending_transaction_info
+
+        def pending_transaction_info(tx_id, **kwargs):
+            if tx_id == broken:
+                raise ValueError("malformed response")
+            return lookup(tx_id, **kwargs)
+
+        client.pending_transaction_info = pending_transaction_info
+        report = execute_batch(client, composers, 5).wait(10)
+        self.assertEqual(report.confirmed, 2)
+        self.assertIsInstance(report.errors[1], ValueError)
+
+    def test_reports_failed_groups(self):
+        executed = self.composer(1)
+        executed.execute(FakeAlgod(), 5)
+        composers = [self.composer(2), executed, self.composer(3)]
+        report = execute_batch(DroppingAlgod(), composers, 3).wait(10)
+        self.assertEqual(report.confirmed, 0)
+        self.assertEqual(report.responses, [None] * 3)
+        self.assertIsInstance(report.errors[0], error.ConfirmationTimeoutError)
+        self.assertIsInstance(
+            report.errors[1], error.AtomicTransactionComposerError
+        )
+        self.assertEqual(report.latency_percentiles(), {})
+        self.assertEqual(
+            composers[2].get_status(),
+            AtomicTransactionComposerStatus.SUBMITTED,
+        )
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import algosdk
+from algosdk import abi, v2client
+from scripts.generate_init import generate_init_pyi
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def imported_modules(statement):
+    """
+    Run a statement in a new interpreter with `-X importtime`, returning the
+    algosdk modules it imported and their cumulative import time in
+    microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip().startswith("algosdk"):
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_loads_no_submodules(self):
+        self.assertEqual(set(imported_modules("import algosdk")), {"algosdk"})
+
+    def test_only_used_submodules_are_loaded(self):
+        modules = imported_modules("from algosdk import account, mnemonic")
+        self.assertIn("algosdk.mnemonic", modules)
+        for unused in (
+            "algosdk.abi",
+            "algosdk.kmd",
+            "algosdk.v2client",
+            "algosdk.wallet",
+            "algosdk.source_map",
+        ):
+            self.assertNotIn(unused, modules)
+
+        modules = imported_modules("from algosdk import transaction")
+        self.assertNotIn("algosdk.abi", modules)
+        self.assertNotIn("algosdk.wordlist", modules)
+
+    def test_attributes_resolve(self):
+        self.assertIs(algosdk.Method, abi.Method)
+        self.assertIs(algosdk.algod, v2client.algod)
+        namespace = {}
+        exec("from algosdk import *", namespace)
+        for name in algosdk.__all__:
+            self.assertIn(name, namespace)
+        self.assertIn("transaction", dir(algosdk))
+        with self.assertRaises(AttributeError):
+            algosdk.missing
+
+    def test_reexports_match_submodules(self):
+        expected = dict.fromkeys(abi.__all__, "abi")
+        expected.update(dict.fromkeys(v2client.__all__, "v2client"))
+        self.assertEqual(algosdk._reexports, expected)
+
+    def test_stub_is_up_to_date(self):
+        with open(os.path.join(ROOT, "algosdk", "__init__.pyi")) as f:
+            self.assertEqual(f.read(), generate_init_pyi())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from algosdk import account, constants, encoding, error, transaction
+from algosdk.kmd import KMDSession
+
+
+class FakeKMDHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Keep-alive responses written in two parts would otherwise wait on
+    # delayed acknowledgements
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.reply(200, {"wallets": [{"name": "bulk", "id": "wallet-id"}]})
+
+    def do_POST(self):
+        server = self.server
+        raw = self.rfile.read(int(self.headers["Content-Length"]))
+        server.bodies.append(raw)
+        server.paths.append(self.path)
+        body = json.loads(raw)
+        if self.headers[constants.kmd_auth_header] != "token":
+            self.reply(401, {"message": "invalid token"})
+        elif self.path == "/v1/wallet/init":
+            server.handles += 1
+            self.reply(200, {"wallet_handle_token": str(server.handles)})
+        elif body.get("wallet_handle_token") != str(server.handles):
+            self.reply(400, {"message": "wallet handle expired"})
+        elif self.path == "/v1/wallet/renew":
+            server.renewals += 1
+            self.reply(200, {"wallet_handle": {}})
+        elif self.path == "/v1/wallet/release":
+            self.reply(200, {})
+        else:
+            txn = encoding.msgpack_decode(body["transaction"])
+            if txn.note == b"missing key":
+                self.reply(400, {"message": "key does not exist in wallet"})
+                return
+            signed = encoding.msgpack_encode(txn.sign(server.sk))
+            self.reply(200, {"signed_transaction": signed})
+
+    def reply(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class TestKMDSession(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeKMDHandler)
+        self.server.daemon_threads = True
+        self.sk, self.addr = account.generate_account()
+        self.server.sk = self.sk
+        self.server.connections = 0
+        self.server.handles = 0
+        self.server.renewals = 0
+        self.server.bodies = []
+        self.server.paths = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.address = "http://127.0.0.1:{}".format(self.server.server_port)
+        self.sp = transaction.SuggestedParams(
+            1000, 1, 1000, "A" * 43 + "=", flat_fee=True
+        )
+        self.txns = [
+            transaction.PaymentTxn(self.addr, self.sp, self.addr, i)
+            for i in range(20)
+        ]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_signs_in_order_over_pooled_connections(self):
+        with KMDSession(
+            "token", self.address, "bulk", "pswd", max_connections=2
+        ) as session:
+            signed = session.sign_transactions(self.txns)
+        self.assertEqual(signed, [txn.sign(self.sk) for txn in self.txns])
+        self.assertLessEqual(self.server.connections, 2)
+        self.assertEqual(self.server.handles, 1)
+        self.assertFalse(any(b"\n" in body for body in self.server.bodies))
+
+    def test_replaces_expired_handle(self):
+        session = KMDSession("token", self.address, "bulk", "pswd")
+        # Another client expires the session's handle
+        self.server.handles += 1
+        signed = session.sign_transactions(self.txns[:4], max_workers=4)
+        self.assertEqual(signed, [txn.sign(self.sk) for txn in self.txns[:4]])
+        self.assertEqual(session.handle, str(self.server.handles))
+        # The replaced handle is released
+        self.assertEqual(self.server.paths.count("/v1/wallet/release"), 1)
+        session.close()
+
+        with self.assertRaises(error.KMDHTTPError):
+            KMDSession("token", self.address, "missing", "pswd")
+
+    def test_other_errors_keep_handle(self):
+        with KMDSession("token", self.address, "bulk", "pswd") as session:
+            unknown = transaction.PaymentTxn(
+                self.addr, self.sp, self.addr, 0, note=b"missing key"
+            )
+            for _ in range(3):
+                with self.assertRaises(error.KMDHTTPError):
+                    session.sign_transactions([self.txns[0], unknown])
+            self.assertEqual(self.server.handles, 1)
+            self.assertEqual(session.handle, "1")
+
+    def test_renews_handle_in_background(self):
+        with KMDSession(
+            "token", self.address, "bulk", "pswd", renew_interval=0.01
+        ):
+            deadline = time.monotonic() + 5
+            while not self.server.renewals and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertGreater(self.server.renewals, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
 import base64
+from concurrent.futures import ThreadPoolExecutor
+import os
 import random
+import stat
+import tempfile
 import unittest
+from unittest import mock
 
 import pytest
 from algosdk import (
@@ -131,6 +136,118 @@ class TestAddress(unittest.TestCase):
         )
         self.assertEqual(pk, account.address_from_private_key(sk))
 
+    def test_batch_matches_single(self):
+        keys = [os.urandom(32) for _ in range(20)]
+        keys += keys[:5] + [b""]
+        addrs = [encoding.encode_address(k) for k in keys]
+        encoding.set_address_cache_size(0)
+        try:
+            self.assertEqual(encoding.encode_addresses(keys), addrs)
+            self.assertEqual(encoding.decode_addresses(addrs), keys)
+            self.assertEqual(
+                encoding.encode_addresses([bytearray(keys[0])]), addrs[:1]
+            )
+            invalid = ("B" if addrs[0][0] == "A" else "A") + addrs[0][1:]
+            for bad, exception in (
+                (invalid, error.WrongChecksumError),
+                (addrs[0][:-1], error.WrongKeyLengthError),
+            ):
+                with self.assertRaises(exception):
+                    encoding.decode_addresses(addrs[:3] + [bad])
+            with self.assertRaises(error.WrongKeyBytesLengthError):
+                encoding.encode_addresses(keys[:3] + [bytes(31)])
+        finally:
+            encoding.set_address_cache_size(encoding.ADDRESS_CACHE_SIZE)
+
+    def test_cache(self):
+        addrs = [account.generate_account()[1] for _ in range(3)]
+        encoding.set_address_cache_size(2)
+        try:
+            keys = encoding.decode_addresses(addrs[:2])
+            self.assertEqual(encoding.decode_address(addrs[0]), keys[0])
+            self.assertEqual(encoding.encode_address(keys[1]), addrs[1])
+            # addrs[1] was used least recently, so it is evicted
+            encoding.decode_address(addrs[2])
+            encoding.decode_address(addrs[0])
+            encoding.decode_address(addrs[1])
+            info = encoding.address_cache_info()
+            self.assertEqual(
+                info["decode"],
+                {"hits": 2, "misses": 4, "size": 2, "maxsize": 2},
+            )
+            self.assertEqual(info["encode"]["misses"], 1)
+        finally:
+            encoding.set_address_cache_size(encoding.ADDRESS_CACHE_SIZE)
+
+    def test_cache_threads(self):
+        addrs = [account.generate_account()[1] for _ in range(8)]
+        encoding.set_address_cache_size(4)
+        try:
+            with ThreadPoolExecutor(4) as executor:
+                for keys in executor.map(
+                    lambda _: [encoding.decode_address(a) for a in addrs * 50],
+                    range(4),
+                ):
+                    self.assertEqual(keys[:8], keys[8:16])
+            info = encoding.address_cache_info()["decode"]
+            self.assertEqual(info["hits"] + info["misses"], 4 * 8 * 50)
+            self.assertEqual(info["size"], 4)
+        finally:
+            encoding.set_address_cache_size(encoding.ADDRESS_CACHE_SIZE)
+
+
+class TestBulkAccounts(unittest.TestCase):
+    def test_generate_accounts(self):
+        for processes in (1, 2):
+            accounts = list(
+                account.generate_accounts(
+                    7, with_mnemonics=True, processes=processes, chunk_size=3
+                )
+            )
+            self.assertEqual(len(accounts), 7)
+            self.assertEqual(len({sk for sk, _, _ in accounts}), 7)
+            for sk, addr, mn in accounts:
+                self.assertEqual(addr, account.address_from_private_key(sk))
+                self.assertEqual(mnemonic.to_private_key(mn), sk)
+                self.assertEqual(mnemonic.from_private_key(sk), mn)
+        self.assertEqual(len(next(account.generate_accounts(1))), 2)
+
+    def test_generate_accounts_in_process_by_default(self):
+        with mock.patch("os.cpu_count", return_value=4), mock.patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            side_effect=AssertionError,
+        ):
+            accounts = list(account.generate_accounts(7, chunk_size=3))
+        self.assertEqual(len(accounts), 7)
+
+    def test_write_accounts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "accounts.csv")
+            written = account.write_accounts(path, 5, with_mnemonics=True)
+            self.assertEqual(written, 5)
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+            with open(path) as f:
+                rows = [line.rstrip("\n").split(",") for line in f]
+            self.assertEqual(rows[0], ["address", "private_key", "mnemonic"])
+            for addr, sk, mn in rows[1:]:
+                self.assertEqual(addr, account.address_from_private_key(sk))
+                self.assertEqual(mnemonic.to_private_key(mn), sk)
+            with self.assertRaises(FileExistsError):
+                account.write_accounts(path, 1)
+
+            path = os.path.join(tmp, "accounts.bin")
+            account.write_accounts(path, 5, "binary", chunk_size=2)
+            self.assertEqual(os.path.getsize(path), 8 + 5 * 64)
+            accounts = list(account.read_accounts(path))
+            self.assertEqual(len(accounts), 5)
+            for sk, addr in accounts:
+                self.assertEqual(addr, account.address_from_private_key(sk))
+            with self.assertRaises(ValueError):
+                account.write_accounts(
+                    os.path.join(tmp, "m.bin"), 1, "binary", True
+                )
+            self.assertFalse(os.path.exists(os.path.join(tmp, "m.bin")))
+
 
 class TestMsgpack(unittest.TestCase):
     def test_bid(self):
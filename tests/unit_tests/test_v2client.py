@@ -0,0 +1,267 @@
+import base64
+import gzip
+import io
+import json
+import unittest
+import zlib
+from unittest import mock
+
+import msgpack
+
+from algosdk import constants, error
+from algosdk.v2client import algod, indexer, response
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal stand-in for the object returned by urlopen."""
+
+    def __init__(self, body, headers=None, status=200):
+        super().__init__(body)
+        self.headers = headers or {}
+        self.status = status
+        self.length = len(body)
+
+
+class TestResponseDecoding(unittest.TestCase):
+    payload = {"txns": [{"fee": 1000, "snd": "A" * 58}] * 500}
+
+    def encoded(self):
+        return json.dumps(self.payload).encode()
+
+    def test_decode_identity(self):
+        resp = FakeResponse(self.encoded())
+        self.assertIs(response.decode_body(resp), resp)
+
+    def test_decode_gzip(self):
+        resp = FakeResponse(
+            gzip.compress(self.encoded()), {"Content-Encoding": "gzip"}
+        )
+        self.assertEqual(json.load(response.decode_body(resp)), self.payload)
+
+    def test_decode_deflate(self):
+        # raw deflate stream without the zlib wrapper
+        raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        for compressed in (
+            zlib.compress(self.encoded()),
+            raw_deflate.compress(self.encoded()) + raw_deflate.flush(),
+        ):
+            resp = FakeResponse(compressed, {"Content-Encoding": "deflate"})
+            body = response.decode_body(resp).read()
+            self.assertEqual(body, self.encoded())
+
+    def test_decompression_is_bounded_by_read_size(self):
+        body = bytes(10**7)
+        reader = response.DecompressingReader(
+            io.BytesIO(gzip.compress(body)), "gzip"
+        )
+        buffer = bytearray(4096)
+        self.assertEqual(reader.readinto(buffer), 4096)
+        self.assertEqual(len(reader._pending), 0)
+        rest = reader.read()
+        self.assertEqual(4096 + len(rest), len(body))
+        self.assertEqual(rest, body[4096:])
+
+    def test_algod_request_negotiates_compression(self):
+        client = algod.AlgodClient("a" * 64, "http://localhost")
+        resp = FakeResponse(
+            gzip.compress(self.encoded()), {"Content-Encoding": "gzip"}
+        )
+        with mock.patch.object(algod, "urlopen", return_value=resp) as m:
+            self.assertEqual(client.status(), self.payload)
+        req = m.call_args[0][0]
+        self.assertEqual(
+            req.get_header("Accept-encoding"), constants.ACCEPT_ENCODING
+        )
+
+    def test_algod_request_msgpack_gzip(self):
+        client = algod.AlgodClient("a" * 64, "http://localhost")
+        raw = bytes(range(256)) * 64
+        resp = FakeResponse(gzip.compress(raw), {"Content-Encoding": "gzip"})
+        with mock.patch.object(algod, "urlopen", return_value=resp):
+            self.assertEqual(
+                client.block_info(1, response_format="msgpack"), raw
+            )
+
+    def test_indexer_request_decodes_gzip(self):
+        client = indexer.IndexerClient("", "http://localhost")
+        resp = FakeResponse(
+            gzip.compress(self.encoded()), {"Content-Encoding": "gzip"}
+        )
+        with mock.patch.object(indexer, "urlopen", return_value=resp):
+            self.assertEqual(client.health(), self.payload)
+
+    def test_compression_can_be_disabled(self):
+        client = algod.AlgodClient(
+            "a" * 64,
+            "http://localhost",
+            headers={"Accept-Encoding": "identity"},
+        )
+        resp = FakeResponse(self.encoded())
+        with mock.patch.object(algod, "urlopen", return_value=resp) as m:
+            client.status()
+        req = m.call_args[0][0]
+        self.assertEqual(req.get_header("Accept-encoding"), "identity")
+
+
+class TestStreamedResponse(unittest.TestCase):
+    block = {
+        "block": {
+            "rnd": 12345,
+            "txns": [
+                {"txn": {"fee": 1000 + i, "snd": "A" * 58}} for i in range(50)
+            ],
+            "ts": 1700000000,
+        },
+        "cert": {"prop": {"oprop": "B" * 58}},
+    }
+
+    def stream(self, body, path, response_format="json"):
+        return response.StreamedResponse(
+            FakeResponse(body), path, response_format
+        )
+
+    def test_json_nested_array(self):
+        # Tiny chunks force values to straddle buffer refills
+        with mock.patch.object(response, "STREAM_CHUNK_SIZE", 7):
+            streamed = self.stream(
+                json.dumps(self.block, indent=1).encode(), ["block", "txns"]
+            )
+            items = list(streamed)
+        self.assertEqual(items, self.block["block"]["txns"])
+        self.assertEqual(
+            streamed.fields,
+            {
+                "block": {"rnd": 12345, "ts": 1700000000},
+                "cert": self.block["cert"],
+            },
+        )
+
+    def test_json_top_level_and_empty_arrays(self):
+        self.assertEqual(list(self.stream(b"[1, 22, 333]", [])), [1, 22, 333])
+        streamed = self.stream(b'{"txns": [], "next": 5}', ["txns"])
+        self.assertEqual(list(streamed), [])
+        self.assertEqual(streamed.fields, {"next": 5})
+
+    def test_json_missing_or_null_path(self):
+        streamed = self.stream(b'{"txns": null}', ["txns"])
+        self.assertEqual(list(streamed), [])
+        self.assertEqual(streamed.fields, {"txns": None})
+
+    def test_json_malformed(self):
+        with self.assertRaises(error.ResponseStreamError):
+            list(self.stream(b'{"txns": [1 2]}', ["txns"]))
+
+    def test_msgpack_nested_array(self):
+        body = msgpack.packb(self.block, use_bin_type=True)
+        streamed = self.stream(body, ["block", "txns"], "msgpack")
+        self.assertEqual(list(streamed), self.block["block"]["txns"])
+        self.assertEqual(streamed.fields["block"]["rnd"], 12345)
+        self.assertEqual(streamed.fields["cert"], self.block["cert"])
+
+    def test_algod_request_stream_path(self):
+        client = algod.AlgodClient("a" * 64, "http://localhost")
+        resp = FakeResponse(
+            gzip.compress(json.dumps(self.block).encode()),
+            {"Content-Encoding": "gzip"},
+        )
+        with mock.patch.object(algod, "urlopen", return_value=resp):
+            streamed = client.block_info(1, stream_path=["block", "txns"])
+            self.assertEqual(len(list(streamed)), 50)
+        self.assertTrue(resp.closed)
+
+    def test_indexer_request_stream_path(self):
+        client = indexer.IndexerClient("", "http://localhost")
+        page = {"next-token": "abc", "transactions": [{"b": 1, "a": 2}]}
+        resp = FakeResponse(json.dumps(page).encode())
+        with mock.patch.object(indexer, "urlopen", return_value=resp):
+            streamed = client.search_transactions(stream_path=["transactions"])
+            items = list(streamed)
+        self.assertEqual(list(items[0]), ["a", "b"])
+        self.assertEqual(streamed.fields, {"next-token": "abc"})
+
+
+class TestFetchAllBoxes(unittest.TestCase):
+    app_id = 77
+
+    def setUp(self):
+        self.client = algod.AlgodClient("a" * 64, "http://localhost")
+        self.boxes = {i.to_bytes(2, "big"): b"value-%d" % i for i in range(25)}
+        names = sorted(self.boxes)
+
+        self.kwargs = []
+
+        def application_boxes(app_id, limit=0, next_page=None, **kwargs):
+            self.kwargs.append(kwargs)
+            start = int(next_page or 0)
+            page = names[start : start + 10]
+            resp = {
+                "boxes": [{"name": base64.b64encode(n).decode()} for n in page]
+            }
+            if start + 10 < len(names):
+                resp["next-token"] = str(start + 10)
+            return resp
+
+        def application_box_by_name(app_id, name, **kwargs):
+            self.kwargs.append(kwargs)
+            if name not in self.boxes:
+                raise error.AlgodHTTPError("box not found", 404)
+            return {
+                "name": base64.b64encode(name).decode(),
+                "value": base64.b64encode(self.boxes[name]).decode(),
+            }
+
+        self.client.application_boxes = application_boxes
+        self.client.application_box_by_name = application_box_by_name
+
+    def test_fetch_all_pages(self):
+        self.assertEqual(
+            self.client.fetch_all_boxes(self.app_id, max_workers=3),
+            self.boxes,
+        )
+
+    def test_stream(self):
+        pairs = self.client.fetch_all_boxes(
+            self.app_id, max_workers=2, stream=True
+        )
+        self.assertEqual(dict(pairs), self.boxes)
+
+    def test_since_round(self):
+        prefix = algod.box_key_prefix + self.app_id.to_bytes(8, "big")
+        other = algod.box_key_prefix + (1).to_bytes(8, "big")
+        deltas = {
+            11: {b"KvMods": {prefix + b"\x00\x01": {b"Data": b"x"}}},
+            12: {
+                b"KvMods": {
+                    prefix + b"gone": {b"OldData": b"y"},
+                    other + b"\x00\x02": {b"Data": b"z"},
+                }
+            },
+        }
+        self.client.status = lambda **kwargs: {"last-round": 12}
+        self.client.get_ledger_state_delta = (
+            lambda rnd, response_format="json", **kwargs: msgpack.packb(
+                deltas[rnd]
+            )
+        )
+        self.assertEqual(
+            self.client.fetch_all_boxes(
+                self.app_id, since_round=10, response_format="json"
+            ),
+            {b"\x00\x01": self.boxes[b"\x00\x01"], b"gone": None},
+        )
+        # Too many rounds to scan falls back to reading every box
+        self.assertEqual(
+            self.client.fetch_all_boxes(
+                self.app_id, since_round=10, max_rounds=1
+            ),
+            self.boxes,
+        )
+
+    def test_forwards_kwargs(self):
+        headers = {"X-Test": "1"}
+        self.client.fetch_all_boxes(
+            self.app_id, headers=headers, response_format="msgpack"
+        )
+        self.assertEqual(len(self.kwargs), 3 + len(self.boxes))
+        for kwargs in self.kwargs:
+            self.assertEqual(kwargs, {"headers": headers})